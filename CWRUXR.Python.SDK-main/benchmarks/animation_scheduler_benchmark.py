@@ -0,0 +1,64 @@
+"""
+Compares an AnimationScheduler with the loop of the threaded animation example, which posts each object with PostObject
+and then sleeps for the frame period, against a LocalServer with network-like latency and jitter.
+Reports the frames per second the loop actually reached, the requests sent, and for the scheduler its tick statistics.
+
+Usage: python animation_scheduler_benchmark.py [objects] [rate] [seconds] [latency ms] [jitter ms]
+"""
+import math
+import sys
+import time
+
+from cwruxr_sdk.animation_scheduler import AnimationScheduler
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import Pose, Vector3
+from cwruxr_sdk.local_server import LocalServer
+from cwruxr_sdk.object_message import ObjectMessage
+from cwruxr_sdk.transport import Urllib3Transport
+
+OBJECTS = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+RATE = float(sys.argv[2]) if len(sys.argv) > 2 else 30
+SECONDS = float(sys.argv[3]) if len(sys.argv) > 3 else 3
+LATENCY = float(sys.argv[4]) / 1000 if len(sys.argv) > 4 else .02
+JITTER = float(sys.argv[5]) / 1000 if len(sys.argv) > 5 else .03
+
+def Frame(t : float) -> list[ObjectMessage]:
+    return [
+        ObjectMessage(id = "sphere" + str(i), pose = Pose(Vector3(i * .1, math.sin(t + i) * .5 + 1, 0)))
+        for i in range(OBJECTS)
+    ]
+
+def SleepLoop(client : Client) -> int:
+    """
+    Runs the loop of the example, returning the number of frames it managed.
+    """
+    frames = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < SECONDS:
+        for message in Frame(time.perf_counter() - start):
+            client.PostObject(message)
+        time.sleep(1 / RATE)
+        frames += 1
+    return frames
+
+if __name__ == "__main__":
+    with LocalServer(latency = LATENCY, jitter = JITTER, seed = 1) as server:
+        client = Client(server.endpoint, "bench", "bench", transport = Urllib3Transport())
+        client.PostObjectBulk(Frame(0))
+        print("%d objects at %.0f Hz for %.0f s, %.0f ms latency with up to %.0f ms jitter" % (OBJECTS, RATE, SECONDS, LATENCY * 1000, JITTER * 1000))
+
+        server.Reset()
+        frames = SleepLoop(client)
+        print("sleep loop: %.1f frames/s, %d requests" % (frames / SECONDS, server.requests))
+
+        server.Reset()
+        scheduler = AnimationScheduler(client, rate = RATE)
+        scheduler.Add(lambda t, tick : Frame(t))
+        with scheduler:
+            time.sleep(SECONDS)
+        stats = scheduler.Stats()
+        print("scheduler:  %.1f ticks/s, %.1f frames/s sent, %d requests, %d objects dropped as stale" % (
+            stats["ticks"] / SECONDS, stats["sends"] / SECONDS, server.requests, stats["objectsDropped"]))
+        print("            tick lag p95 %.2f ms, send latency p50 %.1f ms, p95 %.1f ms, keeping up: %s" % (
+            stats["tickLagP95"] * 1000, stats["sendLatencyP50"] * 1000, stats["sendLatencyP95"] * 1000, stats["keepingUp"]))
+        client.Close()
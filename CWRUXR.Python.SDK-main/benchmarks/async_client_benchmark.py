@@ -0,0 +1,66 @@
+"""
+Compares requests/second of the sync Client and the AsyncClient against a LocalServer with latency.
+
+Usage: python async_client_benchmark.py [requests_per_run] [latency_seconds]
+"""
+import asyncio
+import sys
+import time
+from threading import Thread
+
+from cwruxr_sdk.async_client import AsyncClient
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import Pose, Vector3, Quaternion
+from cwruxr_sdk.local_server import LocalServer
+from cwruxr_sdk.object_message import PrimitiveMessage, PRIMITIVE_SPHERE
+
+REQUESTS_PER_RUN = int(sys.argv[1]) if len(sys.argv) > 1 else 512
+LATENCY = float(sys.argv[2]) if len(sys.argv) > 2 else 0.005
+CONCURRENCY = [1, 8, 64]
+
+def MakeMessage(i : int) -> PrimitiveMessage:
+    return PrimitiveMessage(
+        id = "sphere" + str(i),
+        source = PRIMITIVE_SPHERE,
+        pose = Pose(Vector3(0, i * .01, 0), Quaternion(0,0,0,1), scale = Vector3(.1,.1,.1)),
+    )
+
+def RunSync(endpoint : str, callers : int) -> float:
+    client = Client(endpoint, "bench", "bench", poolSize = callers)
+    perCaller = REQUESTS_PER_RUN // callers
+
+    def Work():
+        for i in range(perCaller):
+            client.PostObject(MakeMessage(i))
+
+    threads = [Thread(target = Work) for _ in range(callers)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    client.Close()
+    return perCaller * callers / elapsed
+
+async def RunAsync(endpoint : str, callers : int) -> float:
+    perCaller = REQUESTS_PER_RUN // callers
+    async with AsyncClient(endpoint, "bench", "bench", maxConnections = callers) as client:
+        async def Work():
+            for i in range(perCaller):
+                await client.PostObject(MakeMessage(i))
+
+        start = time.perf_counter()
+        await asyncio.gather(*[Work() for _ in range(callers)])
+        elapsed = time.perf_counter() - start
+    return perCaller * callers / elapsed
+
+if __name__ == "__main__":
+    with LocalServer(latency = LATENCY) as server:
+        endpoint = server.endpoint
+        print("latency %.1f ms, %d requests per run" % (LATENCY * 1000, REQUESTS_PER_RUN))
+        print("%8s %14s %14s" % ("callers", "sync req/s", "async req/s"))
+        for callers in CONCURRENCY:
+            sync = RunSync(endpoint, callers)
+            asyncRate = asyncio.run(RunAsync(endpoint, callers))
+            print("%8d %14.0f %14.0f" % (callers, sync, asyncRate))
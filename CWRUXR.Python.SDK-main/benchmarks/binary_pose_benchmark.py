@@ -0,0 +1,75 @@
+"""
+Compares the binary pose layout with json for the pose updates of an animation loop: bytes per update, encode and decode time,
+and the time per frame posting to a LocalServer limited to a bandwidth, through an InMemoryTransport.
+tests/test_binary_pose.py checks that the layout decodes to the json form.
+
+Usage: python binary_pose_benchmark.py [objects] [repeats] [bandwidth MB/s]
+"""
+import gc
+import math
+import sys
+import time
+
+from cwruxr_sdk.binary_pose import DecodePoses, EncodePoses
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import Pose, Vector3, Euler, FromJson, ToJson
+from cwruxr_sdk.local_server import LocalServer
+from cwruxr_sdk.object_message import ObjectMessage
+from cwruxr_sdk.precision import FINE
+from cwruxr_sdk.transport import InMemoryTransport
+
+OBJECTS = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+REPEATS = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+BANDWIDTH = float(sys.argv[3]) * 1e6 if len(sys.argv) > 3 else 5e6
+
+def Updates(t : float) -> list[ObjectMessage]:
+    """
+    Returns the pose updates of one frame, holding only the fields which change.
+    """
+    return [
+        ObjectMessage(
+            id = "sphere" + str(i),
+            pose = Pose(
+                Vector3(i % 50 * .1, math.sin(t + i) * .5 + 1, i // 50 * .1),
+                Euler(Vector3(0, t + i, 0)),
+                scale = Vector3(.05, .05, .05),
+            ),
+            active = i % 7 != 0,
+        )
+        for i in range(OBJECTS)
+    ]
+
+def Best(run) -> float:
+    best = None
+    for _ in range(REPEATS):
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        gc.enable()
+        best = elapsed if best == None else min(best, elapsed)
+    return best
+
+if __name__ == "__main__":
+    messages = Updates(1.0)
+
+    server = LocalServer(bandwidth = BANDWIDTH)
+    client = Client("http://localhost/api/v2/", "bench", "bench", transport = InMemoryTransport(server))
+    client.PostObjectBulk(messages)
+
+    print("%d pose updates per frame, best of %d, posted at %.1f MB/s" % (OBJECTS, REPEATS, BANDWIDTH / 1e6))
+    print("%-12s %12s %12s %12s %12s" % ("format", "bytes/update", "encode ms", "decode ms", "post ms"))
+    for name, encode, decode, post in [
+            ("json", lambda : ToJson(messages), FromJson, lambda : client.PostObjectBulk(messages)),
+            ("json FINE", lambda : ToJson(messages, FINE), FromJson, lambda : client.PostObjectBulk(ToJson(messages, FINE))),
+            ("binary", lambda : EncodePoses(messages), DecodePoses, lambda : client.PostObjectPoses(messages)),
+        ]:
+        body = encode()
+        print("%-12s %12.1f %12.2f %12.2f %12.2f" % (
+            name,
+            len(body) / OBJECTS,
+            Best(encode) * 1000,
+            Best(lambda : decode(body)) * 1000,
+            Best(post) * 1000,
+        ))
@@ -0,0 +1,73 @@
+"""
+Compares uploading a large scene as one PostObjectBulk request against PostObjectBulkChunked, against a local stand-in server.
+The stand-in server spends a fixed time per request plus a time per object, like a server which stores each object it receives.
+It rejects bodies over a size limit with 413, as servers with body limits do.
+
+Usage: python bulk_benchmark.py [objects] [latency_seconds] [seconds_per_object]
+"""
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import Pose, Vector3, Quaternion
+from cwruxr_sdk.object_message import PrimitiveMessage, PRIMITIVE_SPHERE
+
+OBJECTS = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+LATENCY = float(sys.argv[2]) if len(sys.argv) > 2 else 0.02
+PER_OBJECT = float(sys.argv[3]) if len(sys.argv) > 3 else 0.00005
+BODY_LIMIT = 8 << 20
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        if length > BODY_LIMIT:
+            self.send_response(413)
+        else:
+            time.sleep(LATENCY + body.count(b'"id":') * PER_OBJECT)
+            self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    Thread(target = server.serve_forever, daemon = True).start()
+    endpoint = "http://127.0.0.1:" + str(server.server_address[1]) + "/api/v2/"
+    messages = [
+        PrimitiveMessage(
+            id = "sphere" + str(i),
+            source = PRIMITIVE_SPHERE,
+            materialID = "Lit:White",
+            pose = Pose(Vector3(i * .001, 1, 0), Quaternion(0,0,0,1), scale = Vector3(.01,.01,.01)),
+        )
+        for i in range(OBJECTS)
+    ]
+
+    print("%d objects, %.0f ms per request, %.0f us per object, %d MB body limit" % (
+        OBJECTS, LATENCY * 1000, PER_OBJECT * 1e6, BODY_LIMIT >> 20))
+    print("%-36s %10s %10s" % ("method", "seconds", "result"))
+    client = Client(endpoint, "bench", "bench", poolSize = 16)
+    start = time.perf_counter()
+    try:
+        client.PostObjectBulk(messages)
+        outcome = "ok"
+    except Exception as e:
+        outcome = "raised " + str(e)
+    print("%-36s %10.2f %10s" % ("PostObjectBulk", time.perf_counter() - start, outcome))
+
+    for parallelism in (1, 4, 16):
+        start = time.perf_counter()
+        result = client.PostObjectBulkChunked(messages, parallelism = parallelism)
+        print("%-36s %10.2f %10s" % ("PostObjectBulkChunked parallelism=%d" % parallelism,
+            time.perf_counter() - start, "ok" if result.ok else "%d failed" % len(result.failures)))
+    client.Close()
+    server.shutdown()
@@ -0,0 +1,81 @@
+"""
+Compares a dashboard which reads the same objects repeatedly through the Client and the CachingClient, against a local stand-in server.
+The stand-in server sends ETags, and answers If-None-Match with 304 when the object has not changed.
+
+Usage: python caching_client_benchmark.py [objects] [rounds] [latency_seconds]
+"""
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+from cwruxr_sdk.caching_client import CachingClient
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import Pose, Vector3, Quaternion, ToJson
+from cwruxr_sdk.object_message import PrimitiveMessage, PRIMITIVE_SPHERE
+
+OBJECTS = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+ROUNDS = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+LATENCY = float(sys.argv[3]) if len(sys.argv) > 3 else 0.005
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    bodies = {}
+    downloaded = 0
+
+    def do_GET(self):
+        time.sleep(LATENCY)
+        id = self.path.rsplit("/", 1)[-1]
+        body = self.bodies[id]
+        etag = '"' + str(hash(body)) + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        StandInHandler.downloaded += len(body)
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def Run(client : Client) -> tuple[float, int]:
+    """
+    Returns the time to read every object ROUNDS times, and the bytes of bodies the server sent.
+    """
+    StandInHandler.downloaded = 0
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for i in range(OBJECTS):
+            client.GetObject("sphere" + str(i))
+    elapsed = time.perf_counter() - start
+    client.Close()
+    return elapsed, StandInHandler.downloaded
+
+if __name__ == "__main__":
+    for i in range(OBJECTS):
+        StandInHandler.bodies["sphere" + str(i)] = ToJson(PrimitiveMessage(
+            id = "sphere" + str(i),
+            source = PRIMITIVE_SPHERE,
+            pose = Pose(Vector3(0, i * .01, 0), Quaternion(0,0,0,1), scale = Vector3(.1,.1,.1)),
+        ))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    Thread(target = server.serve_forever, daemon = True).start()
+    endpoint = "http://127.0.0.1:" + str(server.server_address[1]) + "/api/v2/"
+
+    print("%d objects read %d times, latency %.1f ms" % (OBJECTS, ROUNDS, LATENCY * 1000))
+    print("%-30s %10s %14s %s" % ("client", "ms", "bytes sent", "counters"))
+    elapsed, downloaded = Run(Client(endpoint, "bench", "bench"))
+    print("%-30s %10.1f %14d" % ("Client", elapsed * 1000, downloaded))
+    for name, ttl in [("CachingClient ttl=60", 60), ("CachingClient ttl=0 (ETag)", 0)]:
+        client = CachingClient(endpoint, "bench", "bench", ttl = ttl)
+        stats = client.CacheStats
+        elapsed, downloaded = Run(client)
+        print("%-30s %10.1f %14d %s" % (name, elapsed * 1000, downloaded, stats()))
+    server.shutdown()
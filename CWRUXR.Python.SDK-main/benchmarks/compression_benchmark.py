@@ -0,0 +1,71 @@
+"""
+Measures the bytes on the wire and the end-to-end time of a bulk post and a GetAllObjects of the same scene, with request and
+response compression off, with gzip and with zstd, against a LocalServer limited to a bandwidth like that of a busy Wi-Fi link.
+Poses are random, so the bodies compress about as well as a real scene's do.
+The codec is that of the requests. Responses use the best codec the client accepts, which is zstd when urllib3 can decode it.
+
+Usage: python compression_benchmark.py [bandwidth MB/s] [repeats]
+"""
+import gc
+import random
+import sys
+import time
+
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import Pose, Vector3, Quaternion
+from cwruxr_sdk.compression import GZIP, ZSTD, Available
+from cwruxr_sdk.local_server import LocalServer
+from cwruxr_sdk.object_message import PrimitiveMessage, PRIMITIVE_CUBE
+from cwruxr_sdk.transport import Urllib3Transport
+
+BANDWIDTH = float(sys.argv[1]) * 1e6 if len(sys.argv) > 1 else 5e6
+REPEATS = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+SIZES = [1000, 10000, 100000]
+
+def Messages(count : int) -> list[PrimitiveMessage]:
+    generator = random.Random(count)
+    return [
+        PrimitiveMessage(
+            id = "cube" + str(i),
+            source = PRIMITIVE_CUBE,
+            materialID = "material" + str(i % 16),
+            pose = Pose(
+                Vector3(generator.uniform(-5, 5), generator.uniform(0, 3), generator.uniform(-5, 5)),
+                Quaternion(0, generator.random(), 0, 1),
+                scale = Vector3(.1, .1, .1),
+            ),
+        )
+        for i in range(count)
+    ]
+
+def Run(server : LocalServer, codec, messages : list) -> tuple[float, int, int]:
+    """
+    Returns the best time of a bulk post and a GetAllObjects over the repeats, with the bytes sent each way by the last run.
+    """
+    client = Client(server.endpoint, "bench", "bench", transport = Urllib3Transport(), compression = codec)
+    # Every client accepts compressed responses, so the server only compresses them when compression is on.
+    server.compressAbove = None if codec == None else 16384
+    best = None
+    for _ in range(REPEATS):
+        server.Reset()
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        client.PostObjectBulk(messages)
+        assert len(client.GetAllObjects()) == len(messages)
+        elapsed = time.perf_counter() - start
+        gc.enable()
+        best = elapsed if best == None else min(best, elapsed)
+    client.Close()
+    return best, server.bytesReceived, server.bytesSent
+
+if __name__ == "__main__":
+    codecs = [None] + [codec for codec in (GZIP, ZSTD) if Available(codec)]
+    with LocalServer(bandwidth = BANDWIDTH) as server:
+        print("%.1f MB/s, best of %d, post and get of the whole scene" % (BANDWIDTH / 1e6, REPEATS))
+        print("%8s %6s %14s %14s %10s" % ("objects", "codec", "request bytes", "response bytes", "ms"))
+        for size in SIZES:
+            messages = Messages(size)
+            for codec in codecs:
+                seconds, sent, received = Run(server, codec, messages)
+                print("%8d %6s %14d %14d %10.1f" % (size, codec or "off", sent, received, seconds * 1000))
@@ -0,0 +1,85 @@
+"""
+Compares payload bytes of full reposts against delta updates for typical animation workloads.
+
+Usage: python delta_benchmark.py [objects] [frames]
+"""
+import math
+import sys
+import time
+
+from cwruxr_sdk.common import Pose, Vector3, Quaternion, Color, Euler, ToJson
+from cwruxr_sdk.delta import DiffList
+from cwruxr_sdk.material_message import UnlitMaterialMessage, UnlitParameters
+from cwruxr_sdk.object_message import PrimitiveMessage, TextMessage, TextParameters, Interpolation, PRIMITIVE_SPHERE
+
+OBJECTS = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+FRAMES = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+def MovingSphere(i : int, t : float) -> PrimitiveMessage:
+    return PrimitiveMessage(
+        id = "sphere" + str(i),
+        source = PRIMITIVE_SPHERE,
+        materialID = "Lit:White",
+        pose = Pose(Vector3(i * .1, math.sin(t + i) * .5 + 1, 0), Quaternion(0,0,0,1), scale = Vector3(.1,.1,.1)),
+        isManipulationOn = True,
+        interpolation = Interpolation(on = True, moveSpeed = 5),
+    )
+
+def SpinningSphere(i : int, t : float) -> PrimitiveMessage:
+    return PrimitiveMessage(
+        id = "sphere" + str(i),
+        source = PRIMITIVE_SPHERE,
+        materialID = "Lit:White",
+        pose = Pose(Vector3(i * .1, 1, 0), Euler(Vector3(0, t, 0)), scale = Vector3(.1,.1,.1)),
+        isManipulationOn = True,
+        interpolation = Interpolation(on = True, moveSpeed = 5),
+    )
+
+def MovingLabel(i : int, t : float) -> TextMessage:
+    return TextMessage(
+        id = "label" + str(i),
+        pose = Pose(Vector3(i * .1, math.sin(t + i) * .5 + 1.2, 0), Quaternion(0,0,0,1), scale = Vector3(1,1,1)),
+        active = True,
+        params = TextParameters(
+            text = "Sensor " + str(i) + " reading",
+            fontSize = 1,
+            width = 2,
+            height = 1,
+            color = Color(255,255,0,255)
+        ),
+        interpolation = Interpolation(on = True, moveSpeed = 5),
+    )
+
+def FadingMaterial(i : int, t : float) -> UnlitMaterialMessage:
+    return UnlitMaterialMessage(
+        id = "mat" + str(i),
+        color = Color(255, 64, 64, int(128 + 127 * math.sin(t + i))),
+        parameters = UnlitParameters(alphaTest = False, alphaCutoff = .5),
+    )
+
+def Measure(make) -> tuple[float, float, float]:
+    previous = {}
+    full = 0
+    delta = 0
+    elapsed = 0
+    for frame in range(FRAMES + 1):
+        messages = [make(i, frame * .1) for i in range(OBJECTS)]
+        if frame > 0:
+            full += len(ToJson(messages))
+            start = time.perf_counter()
+            delta += len(ToJson(DiffList(messages, previous)))
+            elapsed += time.perf_counter() - start
+        previous = {m.id : m for m in messages}
+    return full / FRAMES, delta / FRAMES, elapsed / FRAMES
+
+if __name__ == "__main__":
+    print("%d messages per frame, %d frames" % (OBJECTS, FRAMES))
+    print("%-24s %12s %12s %8s %12s" % ("workload", "full B", "delta B", "ratio", "diff ms"))
+    for name, make in [
+            ("moving primitive", MovingSphere),
+            ("spinning primitive", SpinningSphere),
+            ("moving text label", MovingLabel),
+            ("fading material", FadingMaterial),
+        ]:
+        full, delta, seconds = Measure(make)
+        print("%-24s %12.0f %12.0f %7.1fx %12.2f" % (name, full, delta, full / delta, seconds * 1000))
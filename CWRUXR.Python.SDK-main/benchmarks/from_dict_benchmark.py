@@ -0,0 +1,67 @@
+"""
+Tracks FromDict and FromDictList time per 100k records for each message class, as returned by GetAllObjects and GetAllMaterials.
+
+Usage: python from_dict_benchmark.py [records] [repeats]
+"""
+import gc
+import sys
+import time
+
+from cwruxr_sdk.common import Pose, Vector2, Vector3, Quaternion, Color, ToJson, FromJson
+from cwruxr_sdk.material_message import (
+    MaterialMessage, MRTKMaterialMessage, MRTKStandardParameters, UnlitMaterialMessage, UnlitParameters,
+    TextureReference, MaterialRenderSettings, MaterialBlending, BLEND_ONE, BLEND_ZERO
+)
+from cwruxr_sdk.object_message import (
+    ObjectMessage, PrimitiveMessage, TextMessage, TextParameters, LineMessage, LineParameters,
+    Interpolation, PRIMITIVE_CUBE, LINE_CYLINDER
+)
+
+RECORDS = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+REPEATS = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+def MakePose(i : int) -> Pose:
+    return Pose(Vector3(i * .01, 1, -i * .01), Quaternion(0,0,0,1), Vector3(0,0,0), Vector3(.1,.1,.1))
+
+# Builders for one message of each type, given its index, and the class whose FromDict decodes it.
+BUILDERS = {
+    "PrimitiveMessage" : (ObjectMessage, lambda i : PrimitiveMessage(
+        id = "cube" + str(i), source = PRIMITIVE_CUBE, pose = MakePose(i), materialID = "Lit:White",
+        isManipulationOn = True, interpolation = Interpolation())),
+    "TextMessage" : (ObjectMessage, lambda i : TextMessage(
+        id = "text" + str(i), pose = MakePose(i), active = True,
+        params = TextParameters("Label " + str(i), 1, 2, 1, Color(255,255,0,255)), interpolation = Interpolation())),
+    "LineMessage" : (ObjectMessage, lambda i : LineMessage(
+        id = "line" + str(i), source = LINE_CYLINDER, params = LineParameters("a" + str(i), "b" + str(i), .01))),
+    "UnlitMaterialMessage" : (MaterialMessage, lambda i : UnlitMaterialMessage(
+        "unlit" + str(i), Color(i % 256, 64, 64, 255), UnlitParameters(False, .5))),
+    "MRTKMaterialMessage" : (MaterialMessage, lambda i : MRTKMaterialMessage(
+        "mrtk" + str(i), Color(i % 256, 64, 64, 255),
+        MRTKStandardParameters(1, .75, texture = TextureReference("http://url.to.texture.png", Vector2(1,1), Vector2(0,0))),
+        MaterialRenderSettings(MaterialBlending(BLEND_ONE, BLEND_ZERO), True, "Back", 2000))),
+}
+
+def Best(run) -> float:
+    """
+    Returns the best time of run over the repeats, with the garbage collector paused while timing.
+    """
+    best = None
+    for _ in range(REPEATS):
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        gc.enable()
+        best = elapsed if best == None else min(best, elapsed)
+    return best
+
+if __name__ == "__main__":
+    scale = 100000 / RECORDS
+    print("%d records per run, best of %d, times per 100k records" % (RECORDS, REPEATS))
+    print("%-22s %14s %16s" % ("class", "FromDict ms", "FromDictList ms"))
+    for name, (base, build) in BUILDERS.items():
+        records = FromJson(ToJson([build(i) for i in range(RECORDS)]))
+        one = Best(lambda : [base.FromDict(d) for d in records])
+        many = Best(lambda : base.FromDictList(records))
+        print("%-22s %14.1f %16.1f" % (name, one * 1000 * scale, many * 1000 * scale))
@@ -0,0 +1,56 @@
+"""
+Measures the cost of instrumentation per request: a client without instruments, and one with a MetricsCollector,
+against a LocalServer without latency, so the client's own overhead dominates.
+
+Usage: python instrumentation_benchmark.py [requests] [repeats]
+"""
+import gc
+import sys
+import time
+
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import Pose, Vector3, Quaternion
+from cwruxr_sdk.instrumentation import MetricsCollector
+from cwruxr_sdk.local_server import LocalServer
+from cwruxr_sdk.object_message import PrimitiveMessage, PRIMITIVE_SPHERE
+
+REQUESTS = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+REPEATS = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+MESSAGE = PrimitiveMessage(
+    id = "sphere",
+    source = PRIMITIVE_SPHERE,
+    pose = Pose(Vector3(0, 1, 0), Quaternion(0,0,0,1), scale = Vector3(.1,.1,.1)),
+)
+
+def Best(client : Client) -> float:
+    """
+    Returns the best time of REQUESTS posts over the repeats, with the garbage collector paused while timing.
+    """
+    best = None
+    for _ in range(REPEATS):
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        for _ in range(REQUESTS):
+            client.PostObject(MESSAGE)
+        elapsed = time.perf_counter() - start
+        gc.enable()
+        best = elapsed if best == None else min(best, elapsed)
+    return best
+
+if __name__ == "__main__":
+    with LocalServer() as server:
+        client = Client(server.endpoint, "bench", "bench")
+        Best(client)
+        print("%d PostObject requests, best of %d" % (REQUESTS, REPEATS))
+        print("%-28s %14s" % ("client", "us / request"))
+        plain = Best(client)
+        print("%-28s %14.1f" % ("no instruments", plain / REQUESTS * 1e6))
+        collector = client.AddInstrument(MetricsCollector())
+        measured = Best(client)
+        print("%-28s %14.1f" % ("MetricsCollector", measured / REQUESTS * 1e6))
+        client.RemoveInstrument(collector)
+        print("%-28s %14.1f" % ("overhead", (measured - plain) / REQUESTS * 1e6))
+        print(collector.Snapshot()["POST object/"]["latencyP99"])
+        client.Close()
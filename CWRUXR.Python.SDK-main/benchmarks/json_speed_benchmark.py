@@ -0,0 +1,80 @@
+"""
+Tracks ToJson time per 100k messages for each message class.
+
+Usage: python json_speed_benchmark.py [messages] [repeats]
+"""
+import gc
+import sys
+import time
+
+from cwruxr_sdk.anchor_message import AnchorMessage, ASAAnchor
+from cwruxr_sdk.common import Pose, Vector2, Vector3, Quaternion, Color, ToJson
+from cwruxr_sdk.material_message import (
+    MRTKMaterialMessage, MRTKStandardParameters, UnlitMaterialMessage, UnlitParameters,
+    TextureReference, MaterialRenderSettings, MaterialBlending, BLEND_ONE, BLEND_ZERO
+)
+from cwruxr_sdk.object_message import (
+    ContainerMessage, PrimitiveMessage, TextMessage, TextParameters, LineMessage, LineParameters,
+    ImageMessage, ImageParameters, FileMessage, Interpolation, PRIMITIVE_CUBE, LINE_CYLINDER
+)
+
+MESSAGES = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+REPEATS = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+def MakePose(i : int) -> Pose:
+    return Pose(Vector3(i * .01, 1, -i * .01), Quaternion(0,0,0,1), scale = Vector3(.1,.1,.1))
+
+# Builders for one message of each type, given its index.
+BUILDERS = {
+    "ContainerMessage" : lambda i : ContainerMessage(
+        id = "container" + str(i), pose = MakePose(i), active = True, interpolation = Interpolation()),
+    "PrimitiveMessage" : lambda i : PrimitiveMessage(
+        id = "cube" + str(i), source = PRIMITIVE_CUBE, pose = MakePose(i), materialID = "Lit:White",
+        isManipulationOn = True, interpolation = Interpolation()),
+    "TextMessage" : lambda i : TextMessage(
+        id = "text" + str(i), pose = MakePose(i), active = True,
+        params = TextParameters("Label " + str(i), 1, 2, 1, Color(255,255,0,255))),
+    "LineMessage" : lambda i : LineMessage(
+        id = "line" + str(i), source = LINE_CYLINDER, params = LineParameters("a" + str(i), "b" + str(i), .01)),
+    "ImageMessage" : lambda i : ImageMessage(
+        id = "image" + str(i), source = "http://url.to.map.png", pose = MakePose(i), params = ImageParameters(.1)),
+    "FileMessage" : lambda i : FileMessage(
+        id = "file" + str(i), source = "http://url.to.terrain.fbx", pose = MakePose(i), walkable = True),
+    "UnlitMaterialMessage" : lambda i : UnlitMaterialMessage(
+        "unlit" + str(i), Color(i % 256, 64, 64, 255), UnlitParameters(False, .5)),
+    "MRTKMaterialMessage" : lambda i : MRTKMaterialMessage(
+        "mrtk" + str(i), Color(i % 256, 64, 64, 255),
+        MRTKStandardParameters(1, .75, texture = TextureReference("http://url.to.texture.png", Vector2(1,1), Vector2(0,0))),
+        MaterialRenderSettings(MaterialBlending(BLEND_ONE, BLEND_ZERO), True, "Back", 2000)),
+    "AnchorMessage" : lambda i : AnchorMessage("anchor" + str(i), [ASAAnchor(0, "guid" + str(i))]),
+}
+
+def Measure(build) -> tuple[float, float, int]:
+    """
+    Returns the time to build the messages, the best ToJson time over fresh messages, and the payload size.
+    The garbage collector is paused while timing, as timeit does, so collections of earlier runs don't skew the results.
+    """
+    buildSeconds = None
+    serializeSeconds = None
+    for _ in range(REPEATS):
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        messages = [build(i) for i in range(MESSAGES)]
+        elapsed = time.perf_counter() - start
+        buildSeconds = elapsed if buildSeconds == None else min(buildSeconds, elapsed)
+
+        start = time.perf_counter()
+        data = ToJson(messages)
+        elapsed = time.perf_counter() - start
+        serializeSeconds = elapsed if serializeSeconds == None else min(serializeSeconds, elapsed)
+        gc.enable()
+    return buildSeconds, serializeSeconds, len(data)
+
+if __name__ == "__main__":
+    scale = 100000 / MESSAGES
+    print("%d messages per run, best of %d, times per 100k messages" % (MESSAGES, REPEATS))
+    print("%-22s %12s %12s %12s" % ("class", "build ms", "ToJson ms", "bytes/msg"))
+    for name, build in BUILDERS.items():
+        buildSeconds, serializeSeconds, size = Measure(build)
+        print("%-22s %12.1f %12.1f %12.0f" % (name, buildSeconds * 1000 * scale, serializeSeconds * 1000 * scale, size / MESSAGES))
@@ -0,0 +1,78 @@
+"""
+Compares posting a generated scene's materials as is against interning them with MaterialInterner, against a local stand-in server.
+The scene gives every object its own material, but only a few distinct colors are used, as generated heat maps and charts do.
+
+Usage: python material_interner_benchmark.py [objects] [colors]
+"""
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import Color
+from cwruxr_sdk.material_interner import MaterialInterner
+from cwruxr_sdk.material_message import MRTKMaterialMessage, MRTKStandardParameters
+from cwruxr_sdk.object_message import PrimitiveMessage, PRIMITIVE_CUBE
+
+OBJECTS = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+COLORS = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    received = 0
+
+    def do_POST(self):
+        StandInHandler.received += len(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+def MakeScene() -> tuple[list, list]:
+    """
+    Returns a material per object, and the objects using them.
+    """
+    materials = []
+    objects = []
+    for i in range(OBJECTS):
+        shade = i % COLORS * 255 // COLORS
+        materials.append(MRTKMaterialMessage("cell" + str(i), Color(shade, 255 - shade, 64, 255), MRTKStandardParameters(0, .5)))
+        objects.append(PrimitiveMessage(id = "cube" + str(i), source = PRIMITIVE_CUBE, materialID = "cell" + str(i)))
+    return materials, objects
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    Thread(target = server.serve_forever, daemon = True).start()
+    endpoint = "http://127.0.0.1:" + str(server.server_address[1]) + "/api/v2/"
+    client = Client(endpoint, "bench", "bench")
+
+    print("%d objects, %d distinct materials" % (OBJECTS, COLORS))
+    print("%-36s %10s %12s %14s" % ("method", "ms", "materials", "bytes sent"))
+    materials, objects = MakeScene()
+    StandInHandler.received = 0
+    start = time.perf_counter()
+    client.PostMaterialBulk(materials)
+    client.PostObjectBulk(objects)
+    print("%-36s %10.1f %12d %14d" % ("PostMaterialBulk as is", (time.perf_counter() - start) * 1000, len(materials), StandInHandler.received))
+
+    materials, objects = MakeScene()
+    StandInHandler.received = 0
+    start = time.perf_counter()
+    interner = MaterialInterner()
+    interner.InternMany(materials)
+    posted = interner.Flush(client)
+    client.PostObjectBulk(interner.Rewrite(objects))
+    print("%-36s %10.1f %12d %14d" % ("MaterialInterner", (time.perf_counter() - start) * 1000, len(posted), StandInHandler.received))
+
+    StandInHandler.received = 0
+    start = time.perf_counter()
+    interner.InternMany(MakeScene()[0])
+    posted = interner.Flush(client)
+    print("%-36s %10.1f %12d %14d" % ("MaterialInterner, scene regenerated", (time.perf_counter() - start) * 1000, len(posted), StandInHandler.received))
+    client.Close()
+    server.shutdown()
@@ -0,0 +1,64 @@
+"""
+Compares building and serializing a point cloud as PrimitiveMessages against an ObjectBatch.
+
+Usage: python object_batch_benchmark.py [points] [repeats]
+"""
+import gc
+import sys
+import time
+
+import numpy as np
+
+from cwruxr_sdk.common import Pose, Vector3, Quaternion, ToJson
+from cwruxr_sdk.object_batch import ObjectBatch
+from cwruxr_sdk.object_message import PrimitiveMessage, PRIMITIVE_SPHERE
+
+POINTS = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+REPEATS = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+def Best(run) -> float:
+    """
+    Returns the best time of run over the repeats, with the garbage collector paused while timing.
+    """
+    best = None
+    for _ in range(REPEATS):
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        gc.enable()
+        best = elapsed if best == None else min(best, elapsed)
+    return best
+
+if __name__ == "__main__":
+    ids = ["point" + str(i) for i in range(POINTS)]
+    positions = np.random.default_rng(0).normal(0, 2, (POINTS, 3))
+    rows = positions.tolist()
+    offset = np.array([0, .01, 0])
+
+    def Messages():
+        return ToJson([
+            PrimitiveMessage(
+                id = ids[i],
+                source = PRIMITIVE_SPHERE,
+                materialID = "Lit:White",
+                pose = Pose(Vector3(*rows[i]), Quaternion(0,0,0,1), scale = Vector3(.01,.01,.01)),
+            )
+            for i in range(POINTS)
+        ])
+
+    batch = ObjectBatch(ids, source = PRIMITIVE_SPHERE, materialID = "Lit:White", position = positions, scale = .01)
+    batch.ToJson()
+
+    # Every frame moves the upper half of the cloud and serializes the whole batch.
+    def Frame():
+        batch.position[batch.position[:, 1] > 0] += offset
+        return batch.ToJson()
+
+    print("%d points, best of %d" % (POINTS, REPEATS))
+    print("%-34s %10s %12s" % ("method", "ms", "bytes"))
+    print("%-34s %10.1f %12d" % ("PrimitiveMessage + ToJson", Best(Messages) * 1000, len(Messages())))
+    for decimals in (6, 4, 2):
+        batch.decimals = decimals
+        print("%-34s %10.1f %12d" % ("ObjectBatch.ToJson, %d decimals" % decimals, Best(Frame) * 1000, len(Frame())))
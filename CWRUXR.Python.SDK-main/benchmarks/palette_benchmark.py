@@ -0,0 +1,82 @@
+"""
+Compares animating a heat map by posting a new material and the whole object per cell, against recoloring with a Palette,
+against a local stand-in server.
+
+Usage: python palette_benchmark.py [cells] [frames]
+"""
+import math
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import Color, Pose, Vector3, Quaternion
+from cwruxr_sdk.material_message import UnlitMaterialMessage, UnlitParameters
+from cwruxr_sdk.object_message import PrimitiveMessage, PRIMITIVE_CUBE
+from cwruxr_sdk.palette import Palette
+
+CELLS = int(sys.argv[1]) if len(sys.argv) > 1 else 2500
+FRAMES = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    received = 0
+    requests = 0
+
+    def do_POST(self):
+        StandInHandler.received += len(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        StandInHandler.requests += 1
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+def Value(cell : int, frame : int) -> float:
+    return .5 + .5 * math.sin(cell * .1 + frame * .3)
+
+def Cell(cell : int, materialID : str) -> PrimitiveMessage:
+    side = int(math.sqrt(CELLS))
+    return PrimitiveMessage(
+        id = "cell" + str(cell),
+        source = PRIMITIVE_CUBE,
+        materialID = materialID,
+        pose = Pose(Vector3(cell % side * .05, 1, cell // side * .05), Quaternion(0,0,0,1), scale = Vector3(.05,.01,.05)),
+    )
+
+def Report(name : str, start : float):
+    elapsed = time.perf_counter() - start
+    print("%-32s %12.1f %10d %14d" % (name, elapsed / FRAMES * 1000, StandInHandler.requests, StandInHandler.received))
+    StandInHandler.requests = 0
+    StandInHandler.received = 0
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    Thread(target = server.serve_forever, daemon = True).start()
+    endpoint = "http://127.0.0.1:" + str(server.server_address[1]) + "/api/v2/"
+    client = Client(endpoint, "bench", "bench")
+    palette = Palette.Gradient("heat", [Color(0,0,255,255), Color(0,255,0,255), Color(255,0,0,255)], 256)
+
+    print("%d cells, %d frames" % (CELLS, FRAMES))
+    print("%-32s %12s %10s %14s" % ("method", "ms / frame", "requests", "bytes sent"))
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        materials = []
+        for cell in range(CELLS):
+            color = palette.colors[palette.Index(Value(cell, frame))]
+            materials.append(UnlitMaterialMessage("cell" + str(cell), color, UnlitParameters()))
+        client.PostMaterialBulk(materials)
+        client.PostObjectBulk([Cell(cell, "cell" + str(cell)) for cell in range(CELLS)])
+    Report("material + object per cell", start)
+
+    start = time.perf_counter()
+    palette.Post(client)
+    for frame in range(FRAMES):
+        client.PostObjectBulk(palette.RecolorMany(("cell" + str(cell) for cell in range(CELLS)), (Value(cell, frame) for cell in range(CELLS))))
+    Report("Palette.RecolorMany", start)
+    client.Close()
+    server.shutdown()
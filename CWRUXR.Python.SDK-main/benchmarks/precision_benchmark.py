@@ -0,0 +1,61 @@
+"""
+Measures what precision profiles save in an animation loop like the examples', where objects bob with math.sin(t) * .5 + 1 and
+most of them move less than the profile's precision between frames. A Scene posts each frame through an InMemoryTransport,
+and the bytes posted, the objects posted, and the time per frame are reported for each profile.
+
+Usage: python precision_benchmark.py [objects] [frames]
+"""
+import gc
+import math
+import sys
+import time
+
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import Pose, Vector3, Euler
+from cwruxr_sdk.local_server import LocalServer
+from cwruxr_sdk.object_message import PrimitiveMessage, PRIMITIVE_SPHERE
+from cwruxr_sdk.precision import COARSE, FINE
+from cwruxr_sdk.scene import Scene
+from cwruxr_sdk.transport import InMemoryTransport
+
+OBJECTS = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+FRAMES = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+
+def Frame(i : int, t : float) -> PrimitiveMessage:
+    # Most objects move slowly, so between frames they move by less than a tenth of a millimeter.
+    speed = 1.0 if i % 20 == 0 else 1e-4
+    return PrimitiveMessage(
+        id = "sphere" + str(i),
+        source = PRIMITIVE_SPHERE,
+        pose = Pose(
+            Vector3(i % 50 * .1, math.sin(t * speed + i) * .5 + 1, i // 50 * .1),
+            Euler(Vector3(0, t * speed, 0)),
+            scale = Vector3(.05, .05, .05),
+        ),
+    )
+
+if __name__ == "__main__":
+    server = LocalServer()
+    print("%d objects, %d frames at 60 fps" % (OBJECTS, FRAMES))
+    print("%-8s %14s %14s %12s" % ("profile", "bytes/frame", "posted/frame", "ms/frame"))
+    for name, precision in [("full", None), ("FINE", FINE), ("COARSE", COARSE)]:
+        server.Reset()
+        client = Client("http://localhost/api/v2/", "bench", "bench", transport = InMemoryTransport(server))
+        scene = Scene(precision)
+        for i in range(OBJECTS):
+            scene.Set(Frame(i, 0))
+        scene.Sync(client)
+        server.Reset()
+
+        posted = 0
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        for frame in range(1, FRAMES + 1):
+            t = frame / 60
+            for i in range(OBJECTS):
+                scene.Set(Frame(i, t))
+            posted += len(scene.Sync(client)[0])
+        elapsed = time.perf_counter() - start
+        gc.enable()
+        print("%-8s %14d %14d %12.2f" % (name, server.bytesReceived / FRAMES, posted / FRAMES, elapsed / FRAMES * 1000))
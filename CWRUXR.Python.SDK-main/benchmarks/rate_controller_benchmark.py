@@ -0,0 +1,68 @@
+"""
+Shows a RateController following the network: an AnimationScheduler with a controller posts to a LocalServer whose latency
+and error rate change in phases, as the hosted instance's do over a day. Prints the controller's rate, bulk size and
+round-trip estimate twice a second, then compares it with a scheduler fixed at maxRate by the objects delivered to the
+server and the requests per second achieved. Objects replaced by a newer frame before being sent are not counted as lost,
+as only the latest state of each object matters.
+
+Usage: python rate_controller_benchmark.py [objects] [seconds per phase]
+"""
+import math
+import sys
+import time
+
+from cwruxr_sdk.animation_scheduler import AnimationScheduler
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import Pose, Vector3
+from cwruxr_sdk.local_server import LocalServer
+from cwruxr_sdk.object_message import ObjectMessage
+from cwruxr_sdk.rate_controller import RateController
+from cwruxr_sdk.transport import Urllib3Transport
+
+OBJECTS = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+PHASE = float(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+# Latency in seconds and error rate of each phase.
+PHASES = [(.005, 0), (.1, 0), (.02, .3), (.005, 0)]
+
+def Frame(t : float, tick : int) -> list[ObjectMessage]:
+    return [
+        ObjectMessage(id = "sphere" + str(i), pose = Pose(Vector3(i * .1, math.sin(t + i) * .5 + 1, 0)))
+        for i in range(OBJECTS)
+    ]
+
+def Run(server : LocalServer, scheduler : AnimationScheduler, controller = None) -> dict:
+    server.Reset()
+    scheduler.Add(Frame)
+    start = time.perf_counter()
+    with scheduler:
+        for latency, errorRate in PHASES:
+            server.latency = latency
+            server.errorRate = errorRate
+            for _ in range(int(PHASE * 2)):
+                time.sleep(.5)
+                if controller != None:
+                    stats = controller.Stats()
+                    print("%8.0f %8.2f %8.1f %8d %8.1f %8.2f" % (
+                        latency * 1000, errorRate, stats["rate"], stats["batchSize"], (stats["rtt"] or 0) * 1000, stats["errorRate"]))
+    stats = scheduler.Stats()
+    stats["seconds"] = time.perf_counter() - start
+    return stats
+
+if __name__ == "__main__":
+    with LocalServer(seed = 1) as server:
+        client = Client(server.endpoint, "bench", "bench", transport = Urllib3Transport())
+        client.PostObjectBulk(Frame(0, 0))
+        print("%d objects, %.0f s per phase" % (OBJECTS, PHASE))
+        print("%8s %8s %8s %8s %8s %8s" % ("latency", "errors", "rate", "batch", "rtt ms", "errRate"))
+        controller = RateController(maxRate = 30, batchSize = OBJECTS, maxBatchSize = OBJECTS)
+        adaptive = Run(server, AnimationScheduler(client, controller = controller), controller)
+        fixed = Run(server, AnimationScheduler(client, rate = 30))
+
+        # Updates per object per second is the rate each object's state actually reached the server at.
+        print("%-10s %8s %8s %8s %10s %10s %12s" % ("", "ticks", "sends", "errors", "delivered", "sends/s", "updates/obj/s"))
+        for name, stats in (("adaptive", adaptive), ("fixed 30", fixed)):
+            print("%-10s %8d %8d %8d %10d %10.1f %12.1f" % (
+                name, stats["ticks"], stats["sends"], stats["sendErrors"], stats["objectsSent"],
+                stats["sends"] / stats["seconds"], stats["objectsSent"] / OBJECTS / stats["seconds"]))
+        client.Close()
@@ -0,0 +1,77 @@
+"""
+Compares the per-object cost of rotation math written one object at a time against rotation_math over arrays.
+
+Usage: python rotation_math_benchmark.py [rotations] [repeats]
+"""
+import gc
+import math
+import sys
+import time
+
+import numpy as np
+
+from cwruxr_sdk.common import Vector3, Quaternion, Euler
+from cwruxr_sdk import rotation_math
+
+ROTATIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+REPEATS = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+def MultiplyOne(a : Quaternion, b : Quaternion) -> Quaternion:
+    return Quaternion(
+        a.w * b.x + a.x * b.w + a.y * b.z - a.z * b.y,
+        a.w * b.y - a.x * b.z + a.y * b.w + a.z * b.x,
+        a.w * b.z + a.x * b.y - a.y * b.x + a.z * b.w,
+        a.w * b.w - a.x * b.x - a.y * b.y - a.z * b.z,
+    )
+
+def SlerpOne(a : Quaternion, b : Quaternion, t : float) -> Quaternion:
+    dot = a.x * b.x + a.y * b.y + a.z * b.z + a.w * b.w
+    sign = 1
+    if dot < 0:
+        sign = -1
+        dot = -dot
+    if dot > .9995:
+        wa, wb = 1 - t, t
+    else:
+        angle = math.acos(dot)
+        wa = math.sin((1 - t) * angle) / math.sin(angle)
+        wb = math.sin(t * angle) / math.sin(angle)
+    wb *= sign
+    x, y, z, w = wa * a.x + wb * b.x, wa * a.y + wb * b.y, wa * a.z + wb * b.z, wa * a.w + wb * b.w
+    n = math.sqrt(x * x + y * y + z * z + w * w)
+    return Quaternion(x / n, y / n, z / n, w / n)
+
+def Best(run) -> float:
+    """
+    Returns the best time of run over the repeats, with the garbage collector paused while timing.
+    """
+    best = None
+    for _ in range(REPEATS):
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        gc.enable()
+        best = elapsed if best == None else min(best, elapsed)
+    return best
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    angles = rng.uniform(-math.pi, math.pi, (ROTATIONS, 3))
+    vectors = [Vector3(x, y, z) for x, y, z in angles.tolist()]
+    a = rotation_math.EulerToQuaternion(angles)
+    b = rotation_math.EulerToQuaternion(angles[::-1])
+    qa = rotation_math.ToQuaternions(a)
+    qb = rotation_math.ToQuaternions(b)
+
+    print("%d rotations, best of %d, cost per rotation" % (ROTATIONS, REPEATS))
+    print("%-20s %14s %14s %10s" % ("operation", "per object ns", "arrays ns", "speedup"))
+    for name, one, many in [
+            ("euler to quaternion", lambda : [Euler(v) for v in vectors], lambda : rotation_math.EulerToQuaternion(angles)),
+            ("multiply", lambda : [MultiplyOne(x, y) for x, y in zip(qa, qb)], lambda : rotation_math.Multiply(a, b)),
+            ("slerp", lambda : [SlerpOne(x, y, .3) for x, y in zip(qa, qb)], lambda : rotation_math.Slerp(a, b, .3)),
+        ]:
+        oneSeconds = Best(one)
+        manySeconds = Best(many)
+        print("%-20s %14.0f %14.1f %9.0fx" % (name, oneSeconds * 1e9 / ROTATIONS, manySeconds * 1e9 / ROTATIONS, oneSeconds / manySeconds))
@@ -0,0 +1,84 @@
+"""
+Compares bytes and time per frame for reposting a full scene against Scene.Sync when only a few objects move.
+
+Usage: python scene_benchmark.py [objects] [moving_per_frame] [frames]
+"""
+import sys
+import time
+
+from cwruxr_sdk.common import Pose, Vector3, Quaternion, ToJson
+from cwruxr_sdk.object_message import PrimitiveMessage, Interpolation, PRIMITIVE_CUBE
+from cwruxr_sdk.scene import Scene
+
+OBJECTS = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+MOVING = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+FRAMES = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+
+class CountingClient:
+    """
+    Stand-in for Client which serializes bulk requests the same way, but only counts the bytes.
+    """
+    def __init__(self):
+        self.bytes = 0
+
+    def PostObjectBulk(self, message):
+        self.bytes += len(ToJson(message))
+
+    def DeleteObjectBulk(self, ids):
+        self.bytes += len(ToJson(ids))
+
+def MakeObject(i : int, frame : int) -> PrimitiveMessage:
+    y = frame * .01 if i < MOVING else 0
+    return PrimitiveMessage(
+        id = "cube" + str(i),
+        source = PRIMITIVE_CUBE,
+        pose = Pose(Vector3(i * .1, y, 0), Quaternion(0,0,0,1), scale = Vector3(.05,.05,.05)),
+        isManipulationOn = False,
+        interpolation = Interpolation(),
+    )
+
+def FullRepost() -> tuple[float, float]:
+    client = CountingClient()
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        client.PostObjectBulk([MakeObject(i, frame) for i in range(OBJECTS)])
+    return client.bytes / FRAMES, (time.perf_counter() - start) / FRAMES
+
+def SceneRebuildAll() -> tuple[float, float]:
+    scene = Scene()
+    client = CountingClient()
+    for i in range(OBJECTS):
+        scene.Set(MakeObject(i, 0))
+    scene.Sync(client)
+    client.bytes = 0
+    start = time.perf_counter()
+    for frame in range(1, FRAMES + 1):
+        for i in range(OBJECTS):
+            scene.Set(MakeObject(i, frame))
+        scene.Sync(client)
+    return client.bytes / FRAMES, (time.perf_counter() - start) / FRAMES
+
+def SceneSetMoved() -> tuple[float, float]:
+    scene = Scene()
+    client = CountingClient()
+    for i in range(OBJECTS):
+        scene.Set(MakeObject(i, 0))
+    scene.Sync(client)
+    client.bytes = 0
+    start = time.perf_counter()
+    for frame in range(1, FRAMES + 1):
+        for i in range(MOVING):
+            scene.Set(MakeObject(i, frame))
+        scene.Sync(client)
+    return client.bytes / FRAMES, (time.perf_counter() - start) / FRAMES
+
+if __name__ == "__main__":
+    print("%d objects, %d moving per frame, %d frames" % (OBJECTS, MOVING, FRAMES))
+    print("%-34s %14s %12s" % ("strategy", "bytes/frame", "ms/frame"))
+    for name, run in [
+            ("full repost (PostObjectBulk)", FullRepost),
+            ("Scene.Sync, rebuild every object", SceneRebuildAll),
+            ("Scene.Sync, Set moved objects", SceneSetMoved),
+        ]:
+        size, seconds = run()
+        print("%-34s %14.0f %12.2f" % (name, size, seconds * 1000))
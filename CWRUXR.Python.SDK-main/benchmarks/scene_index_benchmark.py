@@ -0,0 +1,107 @@
+"""
+Compares deleting a container and everything under it by walking GetAllObjects and calling DeleteObject for each object,
+against SceneIndex.DeleteSubtree, against a local stand-in server. Also times the index queries on a large scene.
+
+Usage: python scene_index_benchmark.py [objects] [fanout] [latency_seconds]
+"""
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import orjson
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.object_message import ContainerMessage, PrimitiveMessage, PRIMITIVE_SPHERE
+from cwruxr_sdk.scene_index import SceneIndex
+
+OBJECTS = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+FANOUT = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+LATENCY = float(sys.argv[3]) if len(sys.argv) > 3 else 0.005
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    objects = {}
+
+    def Reply(self, body : bytes):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        time.sleep(LATENCY)
+        self.Reply(orjson.dumps(list(self.objects.values())))
+
+    def do_DELETE(self):
+        time.sleep(LATENCY)
+        length = int(self.headers.get("Content-Length", 0))
+        if length > 0:
+            for id in orjson.loads(self.rfile.read(length)):
+                self.objects.pop(id, None)
+        else:
+            self.objects.pop(self.path.rsplit("/", 1)[-1], None)
+        self.Reply(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+def MakeScene() -> list:
+    """
+    Returns a tree of containers with FANOUT children each, with a sphere under every container.
+    """
+    messages = []
+    for i in range(OBJECTS // 2):
+        messages.append(ContainerMessage(id = "node" + str(i), parentID = "node" + str((i - 1) // FANOUT) if i > 0 else None))
+        messages.append(PrimitiveMessage(id = "sphere" + str(i), source = PRIMITIVE_SPHERE, parentID = "node" + str(i), materialID = "Lit:White"))
+    return messages
+
+def Walk(objects : list, id : str) -> list:
+    """
+    Collects a subtree from GetAllObjects by hand, the way callers did without an index.
+    """
+    children = {}
+    for data in objects:
+        children.setdefault(data.get("parentID"), []).append(data["id"])
+    result = [id]
+    for current in result:
+        result.extend(children.get(current, ()))
+    return result
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    Thread(target = server.serve_forever, daemon = True).start()
+    endpoint = "http://127.0.0.1:" + str(server.server_address[1]) + "/api/v2/"
+    client = Client(endpoint, "bench", "bench")
+    messages = MakeScene()
+    target = "node" + str(FANOUT + 1)
+
+    print("%d objects, fanout %d, %.0f ms per request" % (len(messages), FANOUT, LATENCY * 1000))
+    index = SceneIndex()
+    start = time.perf_counter()
+    index.AddMany(messages)
+    print("%-40s %10.1f ms" % ("SceneIndex.AddMany", (time.perf_counter() - start) * 1000))
+    for name, query in [
+            ("Subtree(node1)", lambda : index.Subtree("node1")),
+            ("Ancestors(sphere%d)" % (OBJECTS // 2 - 1), lambda : index.Ancestors("sphere" + str(OBJECTS // 2 - 1))),
+            ("ByType(Primitive)", lambda : index.ByType("Primitive")),
+            ("Children(node0)", lambda : index.Children("node0")),
+        ]:
+        start = time.perf_counter()
+        count = len(query())
+        print("%-40s %10.3f ms %8d ids" % (name, (time.perf_counter() - start) * 1000, count))
+
+    print("%-40s %10s %8s %10s" % ("delete " + target + " subtree", "seconds", "ids", "requests"))
+    StandInHandler.objects = {m.id : {"id" : m.id, "parentID" : getattr(m, "parentID", None)} for m in messages}
+    start = time.perf_counter()
+    ids = Walk(client.GetAllObjects(), target)
+    for id in ids:
+        client.DeleteObject(id)
+    print("%-40s %10.2f %8d %10d" % ("GetAllObjects walk + DeleteObject", time.perf_counter() - start, len(ids), len(ids) + 1))
+
+    StandInHandler.objects = {m.id : {"id" : m.id, "parentID" : getattr(m, "parentID", None)} for m in messages}
+    start = time.perf_counter()
+    ids = index.DeleteSubtree(client, target)
+    print("%-40s %10.2f %8d %10d" % ("SceneIndex.DeleteSubtree", time.perf_counter() - start, len(ids), 1))
+    client.Close()
+    server.shutdown()
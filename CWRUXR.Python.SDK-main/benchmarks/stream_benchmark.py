@@ -0,0 +1,108 @@
+"""
+Compares peak memory and time to the first object of GetAllObjects against IterAllObjects, against a local stand-in server.
+Each method runs in a fresh process, so its peak resident memory is measured on its own.
+Peak memory is read from /proc, so the benchmark needs Linux.
+
+Usage: python stream_benchmark.py [objects]
+"""
+import subprocess
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+OBJECTS = int(sys.argv[1]) if len(sys.argv) > 1 and sys.argv[1] != "--measure" else 50000
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    body = b""
+
+    def do_GET(self):
+        body = self.body if self.path.endswith("/") else b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        for start in range(0, len(body), 1 << 16):
+            self.wfile.write(body[start : start + (1 << 16)])
+
+    def log_message(self, *args):
+        pass
+
+def Body() -> bytes:
+    from cwruxr_sdk.common import Pose, Vector3, Quaternion, ToJson
+    from cwruxr_sdk.object_message import PrimitiveMessage, Interpolation, PRIMITIVE_SPHERE
+    return ToJson([
+        PrimitiveMessage(
+            id = "sphere" + str(i),
+            source = PRIMITIVE_SPHERE,
+            materialID = "Lit:White",
+            pose = Pose(Vector3(i * .01, 1, 0), Quaternion(0,0,0,1), scale = Vector3(.1,.1,.1)),
+            isManipulationOn = True,
+            interpolation = Interpolation(),
+        )
+        for i in range(OBJECTS)
+    ])
+
+def Memory(field : str) -> int:
+    """
+    Returns a memory figure of this process from /proc/self/status in bytes, such as VmRSS or VmHWM, the peak of VmRSS.
+    """
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+def Measure(method : str, endpoint : str):
+    """
+    Runs in the child process. Prints the time to the first object, the total time, and the peak resident memory above the memory in use at the start.
+    """
+    from cwruxr_sdk.client import Client
+    import cwruxr_sdk.json_stream
+    client = Client(endpoint, "bench", "bench")
+    client.GetObject("warmup")
+
+    # Reset the peak, so it only covers the method being measured.
+    with open("/proc/self/clear_refs", "w") as clearRefs:
+        clearRefs.write("5")
+    baseline = Memory("VmRSS")
+
+    count = 0
+    first = None
+    start = time.perf_counter()
+    if method == "GetAllObjects":
+        objects = client.GetAllObjects()
+        first = time.perf_counter() - start
+        for data in objects:
+            count += 1
+        del objects
+    else:
+        for data in client.IterAllObjects(typed = method.endswith("typed")):
+            if first == None:
+                first = time.perf_counter() - start
+            count += 1
+    total = time.perf_counter() - start
+    print(count, first, total, Memory("VmHWM") - baseline)
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--measure"]:
+        Measure(sys.argv[2], sys.argv[3])
+        sys.exit()
+
+    StandInHandler.body = Body()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    Thread(target = server.serve_forever, daemon = True).start()
+    endpoint = "http://127.0.0.1:" + str(server.server_address[1]) + "/api/v2/"
+
+    print("%d objects, %.1f MB response" % (OBJECTS, len(StandInHandler.body) / 1e6))
+    print("%-22s %10s %12s %10s %14s" % ("method", "objects", "first ms", "total ms", "peak RSS MB"))
+    for method in ("GetAllObjects", "IterAllObjects", "IterAllObjects typed"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--measure", method, endpoint],
+            capture_output = True, check = True, text = True
+        ).stdout.split()
+        count, first, total, peak = int(output[0]), float(output[1]), float(output[2]), int(output[3])
+        print("%-22s %10d %12.1f %10.1f %14.1f" % (method, count, first * 1000, total * 1000, peak / 1e6))
+    server.shutdown()
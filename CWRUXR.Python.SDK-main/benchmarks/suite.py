@@ -0,0 +1,137 @@
+"""
+End-to-end benchmark suite for the hot paths of the SDK, run at several scene sizes.
+Covers building messages, ToJson, FromJson, FromDictList, posting with PostObjectBulkChunked and polling with GetAllObjects,
+the last two against a LocalServer on localhost.
+
+Results are written as json, and compared against a stored baseline. Cases slower than the baseline by more than the tolerance
+are reported as regressions, and the suite exits with status 1.
+Baselines are machine specific, so record one with --save-baseline on the machine the comparison runs on.
+
+Usage: python suite.py [--sizes 100 1000 10000 100000] [--repeats 3] [--output results.json]
+                       [--baseline baseline.json] [--tolerance 0.25] [--save-baseline]
+"""
+import argparse
+import gc
+import os
+import platform
+import sys
+import time
+
+import orjson
+from cwruxr_sdk import __version__
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import Pose, Vector3, Quaternion, ToJson, FromJson
+from cwruxr_sdk.local_server import LocalServer
+from cwruxr_sdk.object_message import ObjectMessage, PrimitiveMessage, Interpolation, PRIMITIVE_CUBE
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def MakeScene(size : int) -> list:
+    return [
+        PrimitiveMessage(
+            id = "cube" + str(i),
+            source = PRIMITIVE_CUBE,
+            materialID = "Lit:White",
+            pose = Pose(Vector3(i * .01, 1, -i * .01), Quaternion(0,0,0,1), scale = Vector3(.1,.1,.1)),
+            isManipulationOn = True,
+            interpolation = Interpolation(),
+        )
+        for i in range(size)
+    ]
+
+def Best(run, repeats : int, setup = None) -> float:
+    """
+    Returns the best time of run over the repeats, with the garbage collector paused while timing.
+    setup is called before each repeat, outside the timing.
+    """
+    best = None
+    for _ in range(repeats):
+        if setup != None:
+            setup()
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        gc.enable()
+        best = elapsed if best == None else min(best, elapsed)
+    return best
+
+def Run(sizes : list[int], repeats : int) -> dict[str, float]:
+    """
+    Returns the best seconds of every case, keyed by case name and size.
+    """
+    results = {}
+    with LocalServer() as server:
+        client = Client(server.endpoint, "bench", "bench", poolSize = 8)
+        for size in sizes:
+            scene = MakeScene(size)
+            body = ToJson(scene)
+            records = FromJson(body)
+            cases = [
+                ("construct", lambda : MakeScene(size), None),
+                ("to_json", lambda : ToJson(scene), None),
+                ("from_json", lambda : FromJson(body), None),
+                ("from_dict", lambda : ObjectMessage.FromDictList(records), None),
+                ("bulk_post", lambda : client.PostObjectBulkChunked(scene).Raise(), server.Reset),
+                ("poll", lambda : client.GetAllObjects(), None),
+            ]
+            for name, run, setup in cases:
+                key = name + "/" + str(size)
+                results[key] = Best(run, repeats, setup)
+                print("%-20s %12.3f ms %10.2f us/object" % (key, results[key] * 1000, results[key] * 1e6 / size), flush = True)
+        client.Close()
+    return results
+
+def Compare(results : dict[str, float], baseline : dict[str, float], tolerance : float) -> list[str]:
+    """
+    Prints each case against the baseline, and returns the cases slower than it by more than the tolerance.
+    """
+    regressions = []
+    print("%-20s %12s %12s %8s" % ("case", "baseline ms", "current ms", "ratio"))
+    for key, seconds in results.items():
+        if key not in baseline:
+            continue
+        ratio = seconds / baseline[key]
+        flag = ""
+        if ratio > 1 + tolerance:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print("%-20s %12.3f %12.3f %8.2f%s" % (key, baseline[key] * 1000, seconds * 1000, ratio, flag))
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Benchmark suite for the hot paths of the SDK.")
+    parser.add_argument("--sizes", type = int, nargs = "+", default = [100, 1000, 10000, 100000])
+    parser.add_argument("--repeats", type = int, default = 3)
+    parser.add_argument("--output", default = os.path.join(HERE, "results.json"))
+    parser.add_argument("--baseline", default = os.path.join(HERE, "baseline.json"))
+    parser.add_argument("--tolerance", type = float, default = 0.25)
+    parser.add_argument("--save-baseline", action = "store_true", help = "Store the results as the new baseline.")
+    args = parser.parse_args()
+
+    results = Run(args.sizes, args.repeats)
+    report = {
+        "sdk" : __version__,
+        "python" : platform.python_version(),
+        "machine" : platform.platform(),
+        "repeats" : args.repeats,
+        "results" : results,
+    }
+    with open(args.output, "wb") as f:
+        f.write(orjson.dumps(report, option = orjson.OPT_INDENT_2))
+    print("Results written to " + args.output)
+
+    if args.save_baseline:
+        with open(args.baseline, "wb") as f:
+            f.write(orjson.dumps(report, option = orjson.OPT_INDENT_2))
+        print("Baseline written to " + args.baseline)
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, "rb") as f:
+            baseline = orjson.loads(f.read())
+        regressions = Compare(results, baseline["results"], args.tolerance)
+        if len(regressions) > 0:
+            print("%d regressions beyond %.0f%%: %s" % (len(regressions), args.tolerance * 100, ", ".join(regressions)))
+            sys.exit(1)
+    else:
+        print("No baseline at " + args.baseline + ", run with --save-baseline to record one.")
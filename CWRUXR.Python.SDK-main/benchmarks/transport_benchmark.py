@@ -0,0 +1,56 @@
+"""
+Measures the per-request time of each transport for the small requests of animation loops, against a LocalServer without latency,
+so the client's own overhead dominates. InMemoryTransport answers with the same server without sockets, as a floor.
+
+Usage: python transport_benchmark.py [requests] [repeats]
+"""
+import gc
+import sys
+import time
+
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import Pose, Vector3, Quaternion
+from cwruxr_sdk.local_server import LocalServer
+from cwruxr_sdk.object_message import PrimitiveMessage, PRIMITIVE_SPHERE
+from cwruxr_sdk.transport import InMemoryTransport, RequestsTransport, Urllib3Transport
+
+REQUESTS = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+REPEATS = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+MESSAGE = PrimitiveMessage(
+    id = "sphere",
+    source = PRIMITIVE_SPHERE,
+    pose = Pose(Vector3(0, 1, 0), Quaternion(0,0,0,1), scale = Vector3(.1,.1,.1)),
+)
+
+def Best(run) -> float:
+    """
+    Returns the best time of REQUESTS calls of run over the repeats, with the garbage collector paused while timing.
+    """
+    best = None
+    for _ in range(REPEATS):
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        for _ in range(REQUESTS):
+            run()
+        elapsed = time.perf_counter() - start
+        gc.enable()
+        best = elapsed if best == None else min(best, elapsed)
+    return best
+
+if __name__ == "__main__":
+    with LocalServer() as server:
+        print("%d requests, best of %d, us per request" % (REQUESTS, REPEATS))
+        print("%-22s %12s %12s" % ("transport", "PostObject", "GetObject"))
+        for name, transport in [
+                ("RequestsTransport", RequestsTransport()),
+                ("Urllib3Transport", Urllib3Transport()),
+                ("InMemoryTransport", InMemoryTransport(server)),
+            ]:
+            client = Client(server.endpoint, "bench", "bench", transport = transport)
+            client.PostObject(MESSAGE)
+            post = Best(lambda : client.PostObject(MESSAGE))
+            get = Best(lambda : client.GetObject("sphere"))
+            print("%-22s %12.1f %12.1f" % (name, post / REQUESTS * 1e6, get / REQUESTS * 1e6))
+            client.Close()
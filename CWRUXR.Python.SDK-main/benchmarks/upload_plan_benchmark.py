@@ -0,0 +1,91 @@
+"""
+Compares uploading a shuffled scene graph with PostObjectBulkChunked against PlanUpload, against a local stand-in server.
+The stand-in server rejects a chunk with 422 when an object in it references a parent or line end it has not stored yet,
+so uploads which send children before their parents fail part way.
+
+Usage: python upload_plan_benchmark.py [objects] [fanout] [latency_seconds]
+"""
+import random
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+
+import orjson
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import Pose, Vector3, Quaternion
+from cwruxr_sdk.object_message import ContainerMessage, LineMessage, LineParameters, PrimitiveMessage, PRIMITIVE_SPHERE
+from cwruxr_sdk.upload_plan import PlanUpload, References
+
+OBJECTS = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+FANOUT = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+LATENCY = float(sys.argv[3]) if len(sys.argv) > 3 else 0.02
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    stored = set()
+    lock = Lock()
+
+    def do_POST(self):
+        time.sleep(LATENCY)
+        items = orjson.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        with self.lock:
+            known = self.stored | {item["id"] for item in items}
+            ok = all(reference in known for item in items for reference in References(item))
+            if ok:
+                self.stored.update(item["id"] for item in items)
+        self.send_response(200 if ok else 422)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+def MakeScene() -> list:
+    """
+    Returns a tree of containers with a sphere at every leaf, and a line joining each leaf to the next, shuffled.
+    """
+    messages = [ContainerMessage(id = "node0")]
+    for i in range(1, OBJECTS // 2):
+        messages.append(ContainerMessage(id = "node" + str(i), parentID = "node" + str((i - 1) // FANOUT)))
+    leaves = []
+    for i in range(OBJECTS // 2, OBJECTS * 3 // 4):
+        leaves.append("sphere" + str(i))
+        messages.append(PrimitiveMessage(
+            id = leaves[-1],
+            source = PRIMITIVE_SPHERE,
+            parentID = "node" + str(i % (OBJECTS // 2)),
+            pose = Pose(Vector3(0, 0, 0), Quaternion(0,0,0,1), scale = Vector3(.01,.01,.01)),
+        ))
+    for i in range(len(leaves) - 1):
+        messages.append(LineMessage(id = "line" + str(i), params = LineParameters(leaves[i], leaves[i + 1], .001)))
+    random.Random(0).shuffle(messages)
+    return messages
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    Thread(target = server.serve_forever, daemon = True).start()
+    endpoint = "http://127.0.0.1:" + str(server.server_address[1]) + "/api/v2/"
+    messages = MakeScene()
+    client = Client(endpoint, "bench", "bench", poolSize = 16)
+
+    print("%d objects, fanout %d, %.0f ms per request" % (len(messages), FANOUT, LATENCY * 1000))
+    print("%-40s %10s %10s %12s" % ("method", "seconds", "levels", "result"))
+    StandInHandler.stored.clear()
+    start = time.perf_counter()
+    result = client.PostObjectBulkChunked(messages, parallelism = 16)
+    print("%-40s %10.2f %10s %12s" % ("PostObjectBulkChunked shuffled", time.perf_counter() - start, "-",
+        "ok" if result.ok else "%d failed" % len(result.failedIds)))
+
+    StandInHandler.stored.clear()
+    start = time.perf_counter()
+    plan = PlanUpload(messages)
+    planned = time.perf_counter() - start
+    results = plan.Upload(client, parallelism = 16)
+    failed = sum(len(result.failedIds) for result in results)
+    print("%-40s %10.2f %10d %12s" % ("PlanUpload + Upload (plan %.0f ms)" % (planned * 1000),
+        time.perf_counter() - start, len(plan), "ok" if failed == 0 and len(results) == len(plan) else "%d failed" % failed))
+    client.Close()
+    server.shutdown()
@@ -0,0 +1,59 @@
+"""
+Measures memory and ToJson throughput for a pose-heavy scene.
+
+Usage: python value_types_benchmark.py [objects]
+"""
+import sys
+import time
+import tracemalloc
+
+from cwruxr_sdk.common import Pose, Vector3, Quaternion, ToJson
+from cwruxr_sdk.object_message import PrimitiveMessage, PRIMITIVE_CUBE
+
+OBJECTS = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+def BuildScene() -> list[PrimitiveMessage]:
+    return [
+        PrimitiveMessage(
+            id = "cube" + str(i),
+            source = PRIMITIVE_CUBE,
+            pose = Pose(Vector3(i * .01, 1, -i * .01), Quaternion(0,0,0,1), scale = Vector3(.1,.1,.1)),
+        )
+        for i in range(OBJECTS)
+    ]
+
+def BuildPoses() -> list[Pose]:
+    return [Pose(Vector3(i * .01, 1, -i * .01), Quaternion(0,0,0,1), scale = Vector3(.1,.1,.1)) for i in range(OBJECTS)]
+
+if __name__ == "__main__":
+    tracemalloc.start()
+    poses = BuildPoses()
+    poseBytes = tracemalloc.get_traced_memory()[0]
+    del poses
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    scene = BuildScene()
+    sceneBytes = tracemalloc.get_traced_memory()[0]
+    ToJson(scene)
+    serializedBytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del scene
+
+    # Animation loops build new messages every frame, so the first ToJson of fresh objects is the common case.
+    start = time.perf_counter()
+    scene = BuildScene()
+    buildSeconds = time.perf_counter() - start
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        data = ToJson(scene)
+        timings.append(time.perf_counter() - start)
+
+    print("%d objects" % OBJECTS)
+    print("poses only      %8.1f MB  (%d B per pose)" % (poseBytes / 1e6, poseBytes / OBJECTS))
+    print("full scene      %8.1f MB  (%d B per object)" % (sceneBytes / 1e6, sceneBytes / OBJECTS))
+    print("after ToJson    %8.1f MB  (%d B per object)" % (serializedBytes / 1e6, serializedBytes / OBJECTS))
+    print("build           %8.1f ms" % (buildSeconds * 1000))
+    print("ToJson first    %8.1f ms  (%d bytes)" % (timings[0] * 1000, len(data)))
+    print("ToJson repeat   %8.1f ms  (best of %d)" % (min(timings[1:]) * 1000, len(timings) - 1))
@@ -1,4 +1,5 @@
 from typing import Dict, Optional
+from cwruxr_sdk.common import RegisterEncoder, EncodeWithoutNone
 
 class ASAAnchor:
     """
@@ -26,6 +27,8 @@ class ASAAnchor:
         """
         return cls(id = data["id"], asaGuid= data["asaGuid"])
 
+RegisterEncoder(ASAAnchor, EncodeWithoutNone)
+
 class AnchorMessage:
     """
     A message type which holds information about an anchor in the room.
@@ -0,0 +1,341 @@
+import time
+from itertools import islice
+from threading import Condition, Event, Lock, Thread
+from typing import Any, Callable, Iterable, Optional
+from requests.exceptions import ReadTimeout
+from urllib3.exceptions import ReadTimeoutError
+from cwruxr_sdk.client import ApiError, Client
+from cwruxr_sdk.instrumentation import LatencyHistogram
+from cwruxr_sdk.rate_controller import RateController
+
+def _Id(message) -> Optional[str]:
+    """
+    Method to get the id of a message, or of a dictionary holding one.
+    """
+    if isinstance(message, dict):
+        return message.get("id")
+    return getattr(message, "id", None)
+
+def _SizeFailure(error : Exception) -> bool:
+    """
+    Method to tell whether a request failed because of the size of its body: a 413 from the server, or a response which
+    timed out while being read. Connect timeouts are not counted, as an unreachable server has nothing to do with the body.
+    """
+    if isinstance(error, ApiError):
+        return error.status_code == 413
+    return isinstance(error, (ReadTimeout, ReadTimeoutError))
+
+class AnimationScheduler:
+    """
+    Runs animation callbacks at a fixed tick rate and sends what they produce, replacing loops of PostObject and time.sleep.
+    Ticks are timed from the start rather than from the end of the previous tick, so they do not drift, and ticks which are
+    missed entirely are skipped rather than run late.
+    Sending happens on a thread of its own, so a slow request never delays a tick. While a request is in flight, newer
+    messages for an id replace older ones, so only the latest state of each object is sent. Everything waiting is sent
+    together in one bulk request. When a request fails, its messages are queued again unless a newer message for the same
+    id is already waiting, so a lost update is not left standing until the object next changes.
+    With a RateController, the tick rate and the number of objects per request follow the measured round-trip time, and the
+    headset's interpolation speeds are updated to smooth over the gaps between updates.
+
+    with AnimationScheduler(client, rate = 30) as scheduler:
+        scheduler.Add(lambda t, tick : [ObjectMessage(id = "sphere", pose = Pose(Vector3(0, math.sin(t) * .5 + 1, 0)))])
+        time.sleep(10)
+    """
+    def __init__(
+            self,
+            client : Client,
+            rate : float = 30,
+            send : Optional[Callable[[list], Any]] = None,
+            controller : Optional[RateController] = None,
+            forgetAfter : float = 10,
+        ):
+        """
+        Initialization function.
+
+        Arguments:
+        client -- The client to send the messages with.
+        rate -- The number of ticks per second.
+        send -- The bulk method each tick's messages are sent with. Defaults to client.PostObjectBulk.
+            client.PostObjectPoses sends pose updates in the smaller binary layout.
+        controller -- Sets the tick rate and the largest number of objects per request from the time requests take, in
+            place of rate. Objects beyond the bulk size wait for the next request. Each time it gives new interpolation
+            settings, they are sent for every object the callbacks have produced recently. PostObjectPoses cannot send them.
+        forgetAfter -- The number of seconds after which an object the callbacks stopped producing no longer gets new
+            interpolation settings, so deleted objects are not created again by them. Forget drops objects at once.
+        """
+        self.rate = rate if controller == None else controller.rate
+        self._controller = controller
+        self.forgetAfter = forgetAfter
+        # The ids the callbacks have produced, to when they last did, for sending them new interpolation settings.
+        # The least recently produced come first.
+        self._ids = {}
+        self._send = send if send != None else client.PostObjectBulk
+        self._callbacks = ()
+        self._pending = {}
+        self._condition = Condition()
+        self._statsLock = Lock()
+        self._stopping = Event()
+        self._tickThread = None
+        self._sendThread = None
+        self.lastError = None
+        self.Reset()
+
+    def Add(
+            self,
+            callback : Callable[[float, int], Optional[Iterable[Any]]],
+        ) -> Callable[[float, int], Optional[Iterable[Any]]]:
+        """
+        Register a callback to run every tick. Returns the callback, so this can be used as a decorator.
+        The callback is given the seconds since the scheduler started and the number of the tick, and returns the object
+        messages to send, or None. Messages without an id are always sent.
+        """
+        # The tuple is replaced rather than changed, so the tick thread never sees it half updated.
+        self._callbacks = self._callbacks + (callback,)
+        return callback
+
+    def Remove(
+            self,
+            callback : Callable[[float, int], Optional[Iterable[Any]]],
+        ):
+        """
+        Stop running a callback.
+        """
+        self._callbacks = tuple(c for c in self._callbacks if c is not callback)
+
+    def Forget(
+            self,
+            ids : Iterable[str],
+        ):
+        """
+        Stop sending new interpolation settings to objects, and drop any of their messages still waiting to be sent.
+        Call this before deleting objects the callbacks produced, so they are not created again. Messages in a request
+        already being sent are not recalled, so Stop the scheduler first when none may reach the server.
+        """
+        with self._condition:
+            for id in ids:
+                self._ids.pop(id, None)
+                self._pending.pop(id, None)
+                self._pending.pop((id, "interpolation"), None)
+
+    def Start(self):
+        """
+        Start ticking and sending on background threads.
+        """
+        if self._tickThread != None:
+            return self
+        self._stopping.clear()
+        self._tickThread = Thread(target = self._TickLoop, name = "cwruxr-animation-tick", daemon = True)
+        self._sendThread = Thread(target = self._SendLoop, name = "cwruxr-animation-send", daemon = True)
+        self._sendThread.start()
+        self._tickThread.start()
+        return self
+
+    def Stop(self):
+        """
+        Stop ticking, and wait for the messages of the last tick to be sent.
+        """
+        if self._tickThread == None:
+            return
+        self._stopping.set()
+        self._tickThread.join()
+        with self._condition:
+            self._condition.notify()
+        self._sendThread.join()
+        self._tickThread = None
+        self._sendThread = None
+
+    def __enter__(self):
+        return self.Start()
+
+    def __exit__(self, *args):
+        self.Stop()
+
+    def Reset(self):
+        """
+        Zero the statistics.
+        """
+        with self._statsLock:
+            self.ticks = 0
+            self.skippedTicks = 0
+            self.callbackErrors = 0
+            self.sends = 0
+            self.sendErrors = 0
+            self.objectsSent = 0
+            self.objectsDropped = 0
+            # How late each tick started, how long its callbacks took, and how long each request took.
+            self._lag = LatencyHistogram()
+            self._work = LatencyHistogram()
+            self._latency = LatencyHistogram()
+
+    def Tick(
+            self,
+            t : float,
+            tick : int,
+        ) -> int:
+        """
+        Run every callback once and queue what they return, as each tick does. Returns the number of messages queued.
+        Useful for driving the scheduler from a loop of one's own.
+        """
+        messages = []
+        for callback in self._callbacks:
+            try:
+                result = callback(t, tick)
+            except Exception as e:
+                self.lastError = e
+                with self._statsLock:
+                    self.callbackErrors += 1
+                continue
+            if result != None:
+                messages.extend(result)
+        if len(messages) == 0:
+            return 0
+
+        dropped = 0
+        now = time.monotonic()
+        with self._condition:
+            pending = self._pending
+            ids = self._ids if self._controller != None else None
+            for message in messages:
+                key = _Id(message)
+                if key == None:
+                    key = object()
+                else:
+                    if key in pending:
+                        dropped += 1
+                    if ids != None:
+                        # Moved to the end, so the ids are kept in the order they were last produced.
+                        ids.pop(key, None)
+                        ids[key] = now
+                pending[key] = message
+            self._condition.notify()
+        if dropped > 0:
+            with self._statsLock:
+                self.objectsDropped += dropped
+        return len(messages)
+
+    def _TickLoop(self):
+        start = time.perf_counter()
+        deadline = start
+        tick = 0
+        while True:
+            wait = deadline - time.perf_counter()
+            if wait > 0 and self._stopping.wait(wait):
+                return
+            if self._stopping.is_set():
+                return
+            begin = time.perf_counter()
+            self.Tick(begin - start, tick)
+            end = time.perf_counter()
+            with self._statsLock:
+                self.ticks += 1
+                self._lag.Add(max(begin - deadline, 0.0))
+                self._work.Add(end - begin)
+            # Deadlines follow from the previous one rather than from the end of the tick, so ticks do not drift.
+            # The rate is read each tick, as a controller may change it.
+            if self._controller != None:
+                self.rate = self._controller.rate
+            period = 1 / self.rate
+            deadline += period
+            tick += 1
+            # Deadlines which passed while this tick ran are skipped, so a slow tick does not cause a burst of late ones.
+            if end > deadline:
+                skipped = int((end - deadline) / period) + 1
+                deadline += skipped * period
+                tick += skipped
+                with self._statsLock:
+                    self.skippedTicks += skipped
+
+    def _SendLoop(self):
+        while True:
+            with self._condition:
+                while len(self._pending) == 0 and not self._stopping.is_set():
+                    self._condition.wait()
+                if len(self._pending) == 0:
+                    return
+                limit = self._controller.batchSize if self._controller != None else None
+                if limit == None or len(self._pending) <= limit:
+                    batch = self._pending
+                    self._pending = {}
+                else:
+                    # The objects waiting longest are sent first, and the rest in the next request.
+                    batch = {key : self._pending.pop(key) for key in list(islice(self._pending, limit))}
+            messages = list(batch.values())
+            start = time.perf_counter()
+            try:
+                self._send(messages)
+                error = None
+            except Exception as e:
+                error = self.lastError = e
+            seconds = time.perf_counter() - start
+            # Failed messages go back to the front of the queue, unless a newer one for the id arrived meanwhile.
+            # Once stopping, they are given up, so Stop does not wait on a server which keeps failing.
+            if error != None and not self._stopping.is_set():
+                with self._condition:
+                    retry = {key : message for key, message in batch.items() if key not in self._pending}
+                    retry.update(self._pending)
+                    self._pending = retry
+                # Retries wait a tick, so a failing server is not sent requests back to back.
+                self._stopping.wait(1 / self.rate)
+            if self._controller != None:
+                self._controller.Record(seconds, error == None, error != None and _SizeFailure(error))
+                self._QueueInterpolation()
+            with self._statsLock:
+                self.sends += 1
+                self._latency.Add(seconds)
+                if error != None:
+                    self.sendErrors += 1
+                else:
+                    self.objectsSent += len(messages)
+
+    def _QueueInterpolation(self):
+        """
+        Queue the controller's new interpolation settings, if it has any, for every object produced within forgetAfter.
+        """
+        with self._condition:
+            # Ids not produced for forgetAfter are dropped from the front, where the least recently produced are.
+            ids = self._ids
+            expired = time.monotonic() - self.forgetAfter
+            while len(ids) > 0:
+                id = next(iter(ids))
+                if ids[id] >= expired:
+                    break
+                del ids[id]
+        interpolation = self._controller.InterpolationUpdate()
+        if interpolation == None:
+            return
+        with self._condition:
+            for id in self._ids:
+                # Keyed apart from the object's own messages, so neither replaces the other.
+                self._pending[(id, "interpolation")] = {"id" : id, "interpolation" : interpolation}
+
+    def Stats(self) -> dict[str, Any]:
+        """
+        Get the statistics since the start or the last Reset. Times are in seconds.
+        keepingUp is False when ticks were skipped, or when requests take longer than a tick on average, in which case
+        frames are being dropped and the rate or the number of objects should be lowered.
+        """
+        period = 1 / self.rate
+        with self._statsLock:
+            latency = self._latency
+            latencyMean = latency.sum / latency.count if latency.count > 0 else None
+            return {
+                "ticks" : self.ticks,
+                "skippedTicks" : self.skippedTicks,
+                "callbackErrors" : self.callbackErrors,
+                "sends" : self.sends,
+                "sendErrors" : self.sendErrors,
+                "objectsSent" : self.objectsSent,
+                "objectsDropped" : self.objectsDropped,
+                "tickLagP50" : self._lag.Percentile(50),
+                "tickLagP95" : self._lag.Percentile(95),
+                "tickLagMax" : self._lag.max,
+                "callbackP50" : self._work.Percentile(50),
+                "callbackP95" : self._work.Percentile(95),
+                "callbackMax" : self._work.max,
+                "sendLatencyMean" : latencyMean,
+                "sendLatencyP50" : latency.Percentile(50),
+                "sendLatencyP95" : latency.Percentile(95),
+                "sendLatencyP99" : latency.Percentile(99),
+                "sendLatencyMax" : latency.max,
+                "keepingUp" : self.skippedTicks == 0 and (latencyMean == None or latencyMean <= period),
+            }
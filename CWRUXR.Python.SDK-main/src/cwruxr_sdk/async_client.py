@@ -0,0 +1,312 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Optional
+import requests
+from cwruxr_sdk.anchor_message import AnchorMessage
+from cwruxr_sdk.bulk import BulkResult
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.instrumentation import Instrument
+from cwruxr_sdk.material_message import MaterialMessage
+from cwruxr_sdk.object_message import ObjectMessage
+from cwruxr_sdk.precision import PrecisionProfile
+from cwruxr_sdk.transport import Transport
+
+class AsyncClient:
+    """
+    Client class which exposes awaitable methods for interacting with the api.
+    Requests run on a bounded set of workers sharing one pooled session, so a single event loop can keep many requests in flight.
+    """
+
+    _client = None
+    _executor = None
+
+    def __init__(
+            self,
+            endpoint : str,
+            roomId : str,
+            anchorId : str,
+            maxConnections : int = 16,
+            transport : Optional[Transport] = None,
+            compression : Optional[str] = None,
+            compressionThreshold : int = 16384,
+            compressionLevel : Optional[int] = None,
+            precision : Optional[PrecisionProfile] = None,
+        ):
+        """
+        Initialization function.
+
+        Arguments:
+        endpoint -- The Api endpoint to connect to.
+        roomId -- The Room to write to and read from.
+        anchorId -- The anchor in the room to write to and read from.
+        maxConnections -- The maximum number of requests in flight at once. Further requests wait for a free connection.
+        transport -- How requests are sent, which should allow maxConnections connections. Defaults to a RequestsTransport.
+        compression -- The codec to compress request bodies with, compression.GZIP or compression.ZSTD. None sends them as is.
+        compressionThreshold -- The size in bytes from which request bodies are compressed.
+        compressionLevel -- The level to compress with. Defaults to the codec's entry in compression.DEFAULT_LEVELS.
+        precision -- How precisely poses and colors are sent, such as precision.FINE. None sends them at full precision.
+        """
+        self._client = Client(endpoint, roomId, anchorId, poolSize = maxConnections, transport = transport,
+            compression = compression, compressionThreshold = compressionThreshold, compressionLevel = compressionLevel,
+            precision = precision)
+        self._executor = ThreadPoolExecutor(
+            max_workers = maxConnections,
+            thread_name_prefix = "cwruxr-async"
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.Close()
+
+    async def Close(self):
+        """
+        Wait for requests in flight to finish, then close the pooled connections.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+        self._client.Close()
+
+    def AddInstrument(
+            self,
+            instrument : Instrument,
+        ) -> Instrument:
+        """
+        Attach an instrument, such as an instrumentation.MetricsCollector, which observes every request the client sends.
+        Returns the instrument.
+        """
+        return self._client.AddInstrument(instrument)
+
+    def RemoveInstrument(
+            self,
+            instrument : Instrument,
+        ):
+        """
+        Detach an instrument.
+        """
+        self._client.RemoveInstrument(instrument)
+
+    async def _Run(self, method, *args):
+        """
+        Run a blocking client method on the worker pool.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            partial(method, *args)
+        )
+
+    ### POST ###
+    async def PostAnchor(
+            self,
+            message : AnchorMessage,
+        ) -> requests.Response:
+        """
+        Post an anchor message to the API.
+        """
+        return await self._Run(self._client.PostAnchor, message)
+
+    async def PostObject(
+            self,
+            message : ObjectMessage,
+            previous : Optional[ObjectMessage] = None,
+        ) -> Optional[requests.Response]:
+        """
+        Post an object message to the API.
+        If previous is given, only the fields which changed since previous are sent.
+        """
+        return await self._Run(self._client.PostObject, message, previous)
+
+    async def PostObjectBulk(
+            self,
+            message,
+            previous : Optional[dict[str, Any]] = None,
+        ) -> Optional[requests.Response]:
+        """
+        Post a list of object messages to the API.
+        If previous is given as a dictionary of the last sent messages by id, only changed fields are sent for those messages.
+        """
+        return await self._Run(self._client.PostObjectBulk, message, previous)
+
+    async def PostObjectPoses(
+            self,
+            message : list,
+        ) -> requests.Response:
+        """
+        Post the pose, active and materialID of a list of object messages in the compact binary layout of binary_pose.
+        """
+        return await self._Run(self._client.PostObjectPoses, message)
+
+    async def PostMaterial(
+            self,
+            message : MaterialMessage,
+            previous : Optional[MaterialMessage] = None,
+        ) -> Optional[requests.Response]:
+        """
+        Post a material message to the API.
+        If previous is given, only the fields which changed since previous are sent.
+        """
+        return await self._Run(self._client.PostMaterial, message, previous)
+
+    async def PostMaterialBulk(
+            self,
+            message,
+            previous : Optional[dict[str, Any]] = None,
+        ) -> Optional[requests.Response]:
+        """
+        Post a list of material messages to the API.
+        If previous is given as a dictionary of the last sent messages by id, only changed fields are sent for those messages.
+        """
+        return await self._Run(self._client.PostMaterialBulk, message, previous)
+
+    async def PostObjectBulkChunked(
+            self,
+            message : list,
+            maxItems : int = 1000,
+            maxBytes : int = 1 << 20,
+            parallelism : int = 8,
+        ) -> BulkResult:
+        """
+        Post a list of object messages to the API in chunks, several chunks at a time.
+        Failed chunks are reported in the result instead of raising.
+        """
+        return await self._Run(self._client.PostObjectBulkChunked, message, maxItems, maxBytes, parallelism)
+
+    async def PostMaterialBulkChunked(
+            self,
+            message : list,
+            maxItems : int = 1000,
+            maxBytes : int = 1 << 20,
+            parallelism : int = 8,
+        ) -> BulkResult:
+        """
+        Post a list of material messages to the API in chunks, several chunks at a time.
+        Failed chunks are reported in the result instead of raising.
+        """
+        return await self._Run(self._client.PostMaterialBulkChunked, message, maxItems, maxBytes, parallelism)
+
+    ### GET ###
+    async def GetAllAnchors(
+            self,
+        ) -> list[dict[str, Any]]:
+        """
+        Get all anchors for the room.
+        """
+        return await self._Run(self._client.GetAllAnchors)
+
+    async def GetAnchor(
+            self,
+            id : str,
+        ) -> dict[str, Any]:
+        """
+        Get an anchor in the room by the ID.
+        """
+        return await self._Run(self._client.GetAnchor, id)
+
+    async def GetAllObjects(
+            self,
+        ) -> list[dict[str, Any]]:
+        """
+        Get all objects under the anchor.
+        """
+        return await self._Run(self._client.GetAllObjects)
+
+    async def GetObject(
+            self,
+            id : str,
+        ) -> dict[str, Any]:
+        """
+        Get an object under the anchor by its ID.
+        """
+        return await self._Run(self._client.GetObject, id)
+
+    async def GetAllMaterials(
+            self,
+        ) -> list[dict[str, Any]]:
+        """
+        Get all materials in the room.
+        """
+        return await self._Run(self._client.GetAllMaterials)
+
+    async def GetMaterial(
+            self,
+            id : str,
+        ) -> dict[str, Any]:
+        """
+        Get a material by the id.
+        """
+        return await self._Run(self._client.GetMaterial, id)
+
+    ### Delete ###
+    async def DeleteAllAnchors(
+            self,
+        ):
+        """
+        Delete all anchors in the room.
+        """
+        return await self._Run(self._client.DeleteAllAnchors)
+
+    async def DeleteAnchor(
+            self,
+            id : str,
+        ):
+        """
+        Delete an anchor with the given ID.
+        """
+        return await self._Run(self._client.DeleteAnchor, id)
+
+    async def DeleteAllMaterials(
+            self,
+        ):
+        """
+        Delete all materials in this room.
+        """
+        return await self._Run(self._client.DeleteAllMaterials)
+
+    async def DeleteMaterial(
+            self,
+            id : str,
+        ):
+        """
+        Delete the material with the given ID.
+        """
+        return await self._Run(self._client.DeleteMaterial, id)
+
+    async def DeleteAllObjects(
+            self,
+        ):
+        """
+        Delete all objects under the anchor.
+        """
+        return await self._Run(self._client.DeleteAllObjects)
+
+    async def DeleteObjectBulk(
+            self,
+            ids : list[str]
+        ):
+        """
+        Delete all objects with the given IDs.
+        """
+        return await self._Run(self._client.DeleteObjectBulk, ids)
+
+    async def DeleteObjectBulkChunked(
+            self,
+            ids : list[str],
+            maxItems : int = 1000,
+            maxBytes : int = 1 << 20,
+            parallelism : int = 8,
+        ) -> BulkResult:
+        """
+        Delete all objects with the given IDs in chunks, several chunks at a time.
+        Failed chunks are reported in the result instead of raising.
+        """
+        return await self._Run(self._client.DeleteObjectBulkChunked, ids, maxItems, maxBytes, parallelism)
+
+    async def DeleteObject(
+            self,
+            id : str,
+        ):
+        """
+        Delete the object with the given ID.
+        """
+        return await self._Run(self._client.DeleteObject, id)
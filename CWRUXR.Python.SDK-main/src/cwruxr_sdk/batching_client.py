@@ -0,0 +1,278 @@
+from concurrent.futures import Future
+from threading import Condition, Lock, Thread
+from typing import Any, Optional
+from cwruxr_sdk.bulk import BulkResult, SendChunked
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.material_message import MaterialMessage
+from cwruxr_sdk.object_message import ObjectMessage
+from cwruxr_sdk.precision import PrecisionProfile
+from cwruxr_sdk.transport import Transport
+
+class _PendingBatch:
+    """
+    Messages waiting to be flushed, keyed by id so that later updates replace earlier ones.
+    """
+    def __init__(self):
+        self.messages = {}
+        self.futures = {}
+
+    def Add(self, message) -> Future:
+        """
+        Queue a message, replacing any queued message with the same id.
+        """
+        key = getattr(message, "id", None)
+        if key == None:
+            key = object()
+        future = Future()
+        self.messages[key] = message
+        self.futures.setdefault(key, []).append(future)
+        return future
+
+    def __len__(self):
+        return len(self.messages)
+
+class BatchingClient(Client):
+    """
+    Client which buffers PostObject and PostMaterial calls and sends them as bulk requests from a background thread.
+    Repeated posts for the same id within one flush window collapse to the latest message.
+    Bulk posts and deletes flush the buffer before they are sent, so buffered messages never overwrite them.
+    """
+
+    _flushInterval = 0.05
+    _maxBatch = 500
+
+    def __init__(
+            self,
+            endpoint : str,
+            roomId : str,
+            anchorId : str,
+            flushInterval : float = 0.05,
+            maxBatch : int = 500,
+            poolSize : Optional[int] = None,
+            transport : Optional[Transport] = None,
+            compression : Optional[str] = None,
+            compressionThreshold : int = 16384,
+            compressionLevel : Optional[int] = None,
+            precision : Optional[PrecisionProfile] = None,
+        ):
+        """
+        Initialization function.
+
+        Arguments:
+        endpoint -- The Api endpoint to connect to.
+        roomId -- The Room to write to and read from.
+        anchorId -- The anchor in the room to write to and read from.
+        flushInterval -- The longest time in seconds a message waits in the buffer before it is sent.
+        maxBatch -- The number of buffered objects or materials which triggers an immediate flush.
+        poolSize -- The maximum number of connections kept open to the endpoint.
+        transport -- How requests are sent. Defaults to a RequestsTransport with poolSize.
+        compression -- The codec to compress request bodies with, compression.GZIP or compression.ZSTD. None sends them as is.
+        compressionThreshold -- The size in bytes from which request bodies are compressed.
+        compressionLevel -- The level to compress with. Defaults to the codec's entry in compression.DEFAULT_LEVELS.
+        precision -- How precisely poses and colors are sent, such as precision.FINE. None sends them at full precision.
+        """
+        super().__init__(endpoint, roomId, anchorId, poolSize = poolSize, transport = transport,
+            compression = compression, compressionThreshold = compressionThreshold, compressionLevel = compressionLevel,
+            precision = precision)
+        self._flushInterval = flushInterval
+        self._maxBatch = maxBatch
+        self._objects = _PendingBatch()
+        self._materials = _PendingBatch()
+        self._condition = Condition()
+        self._sendLock = Lock()
+        self._running = True
+        self._thread = Thread(target = self._FlushLoop, name = "cwruxr-batching", daemon = True)
+        self._thread.start()
+
+    def _Enqueue(self, batch : _PendingBatch, message) -> Future:
+        with self._condition:
+            if not self._running:
+                raise RuntimeError("BatchingClient is closed.")
+            future = batch.Add(message)
+            if len(batch) >= self._maxBatch:
+                self._condition.notify()
+        return future
+
+    def _Ready(self) -> bool:
+        """
+        Method to tell whether the flush thread should flush without waiting out the interval. Called holding the condition.
+        """
+        return not self._running or len(self._objects) >= self._maxBatch or len(self._materials) >= self._maxBatch
+
+    def _FlushLoop(self):
+        while True:
+            with self._condition:
+                # The buffer is checked before waiting, as it may have filled while the last flush was being sent,
+                # when no one was waiting for the notification.
+                self._condition.wait_for(self._Ready, self._flushInterval)
+                if not self._running and len(self._objects) == 0 and len(self._materials) == 0:
+                    return
+            self.Flush()
+
+    def _Send(self, batch : _PendingBatch, send):
+        """
+        Send a swapped out batch and resolve every future waiting on it.
+        """
+        if len(batch) == 0:
+            return
+        try:
+            result = send(list(batch.messages.values()))
+        except Exception as e:
+            for futures in batch.futures.values():
+                for future in futures:
+                    future.set_exception(e)
+            return
+        for futures in batch.futures.values():
+            for future in futures:
+                future.set_result(result)
+
+    def Flush(self):
+        """
+        Send everything that is buffered now, blocking until the requests complete.
+        Materials are sent before objects so that new materialIDs resolve.
+        """
+        with self._sendLock:
+            with self._condition:
+                objects, self._objects = self._objects, _PendingBatch()
+                materials, self._materials = self._materials, _PendingBatch()
+            self._Send(materials, super().PostMaterialBulk)
+            self._Send(objects, super().PostObjectBulk)
+
+    def Close(self):
+        """
+        Flush any buffered messages, stop the background thread, and close the session.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        self._thread.join()
+        self.Flush()
+        super().Close()
+
+    ### POST ###
+    def PostObject(
+            self,
+            message : ObjectMessage,
+        ) -> Future:
+        """
+        Queue an object message to be sent with the next bulk flush.
+        Returns a future which resolves to the bulk response.
+        """
+        return self._Enqueue(self._objects, message)
+
+    def PostMaterial(
+            self,
+            message : MaterialMessage,
+        ) -> Future:
+        """
+        Queue a material message to be sent with the next bulk flush.
+        Returns a future which resolves to the bulk response.
+        """
+        return self._Enqueue(self._materials, message)
+
+    def PostObjectBulk(
+            self,
+            message,
+            previous : Optional[dict[str, Any]] = None,
+        ):
+        """
+        Flush buffered messages, then post a list of object messages to the API.
+        """
+        self.Flush()
+        return super().PostObjectBulk(message, previous)
+
+    def PostObjectPoses(
+            self,
+            message : list,
+        ):
+        """
+        Flush buffered messages, then post the poses of a list of object messages in the binary layout of binary_pose.
+        """
+        self.Flush()
+        return super().PostObjectPoses(message)
+
+    def PostMaterialBulk(
+            self,
+            message,
+            previous : Optional[dict[str, Any]] = None,
+        ):
+        """
+        Flush buffered messages, then post a list of material messages to the API.
+        """
+        self.Flush()
+        return super().PostMaterialBulk(message, previous)
+
+    def PostObjectBulkChunked(
+            self,
+            message : list,
+            maxItems : int = 1000,
+            maxBytes : int = 1 << 20,
+            parallelism : int = 8,
+        ) -> BulkResult:
+        """
+        Flush buffered messages, then post a list of object messages to the API in chunks, several chunks at a time.
+        """
+        self.Flush()
+        return SendChunked(super().PostObjectBulk, message, maxItems, maxBytes, parallelism, self._precision)
+
+    def PostMaterialBulkChunked(
+            self,
+            message : list,
+            maxItems : int = 1000,
+            maxBytes : int = 1 << 20,
+            parallelism : int = 8,
+        ) -> BulkResult:
+        """
+        Flush buffered messages, then post a list of material messages to the API in chunks, several chunks at a time.
+        """
+        self.Flush()
+        return SendChunked(super().PostMaterialBulk, message, maxItems, maxBytes, parallelism, self._precision)
+
+    ### Delete ###
+    def DeleteAllMaterials(
+            self,
+        ):
+        """
+        Flush buffered messages, then delete all materials in this room.
+        """
+        self.Flush()
+        return super().DeleteAllMaterials()
+
+    def DeleteMaterial(
+            self,
+            id : str,
+        ):
+        """
+        Flush buffered messages, then delete the material with the given ID.
+        """
+        self.Flush()
+        return super().DeleteMaterial(id)
+
+    def DeleteAllObjects(
+            self,
+        ):
+        """
+        Flush buffered messages, then delete all objects under the anchor.
+        """
+        self.Flush()
+        return super().DeleteAllObjects()
+
+    def DeleteObjectBulk(
+            self,
+            ids : list[str]
+        ):
+        """
+        Flush buffered messages, then delete all objects with the given IDs.
+        """
+        self.Flush()
+        return super().DeleteObjectBulk(ids)
+
+    def DeleteObject(
+            self,
+            id : str,
+        ):
+        """
+        Flush buffered messages, then delete the object with the given ID.
+        """
+        self.Flush()
+        return super().DeleteObject(id)
@@ -0,0 +1,185 @@
+from math import sqrt
+from struct import Struct, error as StructError
+from typing import Any
+from cwruxr_sdk.common import Quaternion, Vector3
+
+# The Content-Type of bodies written by EncodePoses. Only servers which understand it, such as LocalServer, accept them.
+CONTENT_TYPE = "application/vnd.cwruxr.pose"
+
+# The first bytes of every body, holding the version of the layout.
+_MAGIC = b"CXP\x01"
+
+# Bits of the flags byte starting each record, for the fields the record holds.
+_POSITION = 1
+_ROTATION = 2
+_EULER = 4
+_SCALE = 8
+_ACTIVE = 16
+# The value of active, when _ACTIVE is set.
+_ACTIVE_ON = 32
+_MATERIAL = 64
+
+# Quaternion components are sent as 16-bit integers, which keeps them to about 3e-5.
+_ROTATION_SCALE = 32767
+
+_HEADER = Struct("<BB")
+_VECTOR = Struct("<3f")
+_QUATERNION = Struct("<4h")
+_LENGTH = Struct("<B")
+
+# Structs which write a whole record, keyed by its flags and the lengths of its id and material.
+_RECORDS = {}
+
+def _Record(flags : int, idLength : int, materialLength : int) -> Struct:
+    """
+    Method to get the struct for a record with the given fields, creating it the first time it is needed.
+    """
+    key = (flags, idLength, materialLength)
+    record = _RECORDS.get(key)
+    if record == None:
+        layout = "<BB" + str(idLength) + "s"
+        if flags & _POSITION:
+            layout += "3f"
+        if flags & _ROTATION:
+            layout += "4h"
+        if flags & _EULER:
+            layout += "3f"
+        if flags & _SCALE:
+            layout += "3f"
+        if flags & _MATERIAL:
+            layout += "B" + str(materialLength) + "s"
+        record = _RECORDS[key] = Struct(layout)
+    return record
+
+def _Get(value, key : str) -> Any:
+    """
+    Method to get a field of a message, vector or quaternion, or of a dictionary holding one.
+    """
+    if isinstance(value, dict):
+        return value.get(key)
+    return getattr(value, key, None)
+
+def _Vector(value) -> tuple:
+    if type(value) is Vector3:
+        return (value.x, value.y, value.z)
+    return (_Get(value, "x"), _Get(value, "y"), _Get(value, "z"))
+
+def _Quaternion(value) -> tuple:
+    """
+    Method to get a quaternion as unit length 16-bit integers.
+    """
+    if type(value) is Quaternion:
+        x, y, z, w = value.x, value.y, value.z, value.w
+    else:
+        x, y, z, w = _Get(value, "x"), _Get(value, "y"), _Get(value, "z"), _Get(value, "w")
+    length = sqrt(x * x + y * y + z * z + w * w)
+    scale = _ROTATION_SCALE / length if length > 0 else 0
+    return (round(x * scale), round(y * scale), round(z * scale), round(w * scale))
+
+def _EncodeRecord(message, id : bytes) -> bytes:
+    """
+    Method to write the record of one message.
+    """
+    flags = 0
+    values = []
+    pose = _Get(message, "pose")
+    if pose is not None:
+        value = _Get(pose, "position")
+        if value is not None:
+            flags |= _POSITION
+            values.extend(_Vector(value))
+        value = _Get(pose, "rotation")
+        if value is not None:
+            flags |= _ROTATION
+            values.extend(_Quaternion(value))
+        value = _Get(pose, "eulerRotation")
+        if value is not None:
+            flags |= _EULER
+            values.extend(_Vector(value))
+        value = _Get(pose, "scale")
+        if value is not None:
+            flags |= _SCALE
+            values.extend(_Vector(value))
+    active = _Get(message, "active")
+    if active is not None:
+        flags |= _ACTIVE | (_ACTIVE_ON if active else 0)
+    material = _Get(message, "materialID")
+    materialLength = 0
+    if material is not None:
+        flags |= _MATERIAL
+        material = material.encode()
+        materialLength = len(material)
+        values.append(materialLength)
+        values.append(material)
+    return _Record(flags, len(id), materialLength).pack(flags, len(id), id, *values)
+
+def EncodePoses(
+        messages : list,
+    ) -> bytes:
+    """
+    Method to write the pose, active and materialID updates of object messages in a compact binary layout, for posting
+    to the bulk object endpoint with CONTENT_TYPE at high rates. Other fields of the messages are not sent, so objects
+    should be created with PostObjectBulk first.
+    Takes ObjectMessages or their dictionary forms, such as the partial messages of delta.Diff.
+    Positions, euler angles and scales are sent as 32-bit floats, as the headset uses, and rotations are normalized and
+    sent as 16-bit integers. Ids and materialIDs must be at most 255 bytes long in utf-8.
+    Raises ValueError for a message which cannot be written, such as one without an id or with a NaN rotation.
+
+    Each record is a flags byte, the id as a length byte and utf-8 text, then each field the flags name:
+    position, rotation, eulerRotation and scale as little-endian numbers, and the materialID as a length and text.
+    """
+    parts = [_MAGIC]
+    for message in messages:
+        id = _Get(message, "id")
+        if not isinstance(id, str):
+            raise ValueError("Cannot encode the pose of a message without an id: " + repr(message))
+        try:
+            parts.append(_EncodeRecord(message, id.encode()))
+        # Rounding a NaN or infinite rotation raises ValueError or OverflowError, and a materialID which is not text AttributeError.
+        except (StructError, TypeError, ValueError, OverflowError, AttributeError) as e:
+            raise ValueError("Cannot encode the pose of " + repr(id) + ": " + str(e))
+    return b"".join(parts)
+
+def DecodePoses(
+        data : bytes,
+    ) -> list[dict[str, Any]]:
+    """
+    Method to read a body written by EncodePoses, as the partial object messages it holds in their dictionary form.
+    Raises ValueError when the body is not in the layout.
+    """
+    if data[:len(_MAGIC)] != _MAGIC:
+        raise ValueError("Not a pose body, or a version which is not supported.")
+    result = []
+    offset = len(_MAGIC)
+    try:
+        while offset < len(data):
+            flags, idLength = _HEADER.unpack_from(data, offset)
+            offset += _HEADER.size
+            message = {"id" : data[offset : offset + idLength].decode()}
+            offset += idLength
+            if flags & (_POSITION | _ROTATION | _EULER | _SCALE):
+                pose = message["pose"] = {}
+                for bit, key in ((_POSITION, "position"), (_ROTATION, "rotation"), (_EULER, "eulerRotation"), (_SCALE, "scale")):
+                    if not flags & bit:
+                        continue
+                    if bit == _ROTATION:
+                        x, y, z, w = _QUATERNION.unpack_from(data, offset)
+                        offset += _QUATERNION.size
+                        pose[key] = {"x" : x / _ROTATION_SCALE, "y" : y / _ROTATION_SCALE, "z" : z / _ROTATION_SCALE, "w" : w / _ROTATION_SCALE}
+                    else:
+                        x, y, z = _VECTOR.unpack_from(data, offset)
+                        offset += _VECTOR.size
+                        pose[key] = {"x" : x, "y" : y, "z" : z}
+            if flags & _ACTIVE:
+                message["active"] = bool(flags & _ACTIVE_ON)
+            if flags & _MATERIAL:
+                length, = _LENGTH.unpack_from(data, offset)
+                offset += _LENGTH.size
+                message["materialID"] = data[offset : offset + length].decode()
+                offset += length
+            if offset > len(data):
+                raise ValueError("The pose body ends inside a record.")
+            result.append(message)
+    except (StructError, UnicodeDecodeError) as e:
+        raise ValueError("The pose body is not valid: " + str(e))
+    return result
@@ -0,0 +1,140 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, Optional
+import requests
+from cwruxr_sdk.common import ToJson
+
+class ChunkResult:
+    """
+    The outcome of sending one chunk of a bulk request.
+    """
+    def __init__(
+            self,
+            index : int,
+            ids : list,
+            response : Optional[requests.Response] = None,
+            error : Optional[Exception] = None,
+        ):
+        """
+        Initialization function.
+
+        Arguments:
+        index -- The position of the chunk in the request.
+        ids -- The ids of the items in the chunk.
+        response -- The response of the chunk, if it was sent successfully.
+        error -- The exception raised while sending the chunk, if it failed.
+        """
+        self.index = index
+        self.ids = ids
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error == None
+
+class BulkResult:
+    """
+    The aggregated outcome of a bulk request which was sent in chunks.
+    Failed chunks are reported here instead of raising, so the rest of the request still goes through.
+    """
+    def __init__(self, chunks : list[ChunkResult]):
+        """
+        Initialization function.
+
+        Arguments:
+        chunks -- The result of every chunk, in order.
+        """
+        self.chunks = chunks
+
+    @property
+    def ok(self) -> bool:
+        return all(chunk.ok for chunk in self.chunks)
+
+    @property
+    def failures(self) -> list[ChunkResult]:
+        """
+        The chunks which failed.
+        """
+        return [chunk for chunk in self.chunks if not chunk.ok]
+
+    @property
+    def failedIds(self) -> list:
+        """
+        The ids of every item in a failed chunk, for retrying.
+        """
+        return [id for chunk in self.chunks if not chunk.ok for id in chunk.ids]
+
+    def Raise(self):
+        """
+        Raise the error of the first failed chunk, if any chunk failed.
+        """
+        for chunk in self.chunks:
+            if not chunk.ok:
+                raise chunk.error
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+def _Id(item) -> Any:
+    """
+    Method to get the id of a message, of a dictionary holding one, or of an id itself.
+    """
+    if isinstance(item, dict):
+        return item.get("id")
+    if isinstance(item, str):
+        return item
+    return getattr(item, "id", None)
+
+def Chunks(items : list, maxItems : int, maxBytes : int, precision = None) -> Iterator[tuple[bytes, list]]:
+    """
+    Method to split items into json array bodies of at most maxItems items and about maxBytes bytes each.
+    Yields each body with the ids of the items in it. An item larger than maxBytes is sent in a chunk of its own.
+    Items are serialized with precision, an optional precision.PrecisionProfile.
+    """
+    body = []
+    ids = []
+    size = 2
+    for item in items:
+        encoded = ToJson(item, precision)
+        if len(body) > 0 and (len(body) == maxItems or size + len(encoded) + 1 > maxBytes):
+            yield b"[" + b",".join(body) + b"]", ids
+            body = []
+            ids = []
+            size = 2
+        body.append(encoded)
+        ids.append(_Id(item))
+        size += len(encoded) + 1
+    if len(body) > 0:
+        yield b"[" + b",".join(body) + b"]", ids
+
+def SendChunked(
+        send : Callable[[bytes], Optional[requests.Response]],
+        items : list,
+        maxItems : int = 1000,
+        maxBytes : int = 1 << 20,
+        parallelism : int = 8,
+        precision = None,
+    ) -> BulkResult:
+    """
+    Method to send items in chunks with a bulk method, several chunks at a time.
+
+    Arguments:
+    send -- The bulk method to send each chunk's json body with, such as client.PostObjectBulk.
+    items -- The messages or ids to send.
+    maxItems -- The largest number of items in one chunk.
+    maxBytes -- The largest encoded size of one chunk, unless a single item is larger.
+    parallelism -- The number of chunks in flight at once. The client's poolSize should be at least this large.
+    precision -- The precision.PrecisionProfile to serialize the items with, as the chunks are sent as json already.
+    """
+    def Send(index : int, body : bytes, ids : list) -> ChunkResult:
+        try:
+            return ChunkResult(index, ids, response = send(body))
+        except Exception as e:
+            return ChunkResult(index, ids, error = e)
+
+    chunks = Chunks(items, maxItems, maxBytes, precision)
+    if parallelism <= 1:
+        return BulkResult([Send(index, body, ids) for index, (body, ids) in enumerate(chunks)])
+    with ThreadPoolExecutor(max_workers = parallelism, thread_name_prefix = "cwruxr-bulk") as executor:
+        futures = [executor.submit(Send, index, body, ids) for index, (body, ids) in enumerate(chunks)]
+        return BulkResult([future.result() for future in futures])
@@ -0,0 +1,356 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Optional
+import requests
+from cwruxr_sdk.anchor_message import AnchorMessage
+from cwruxr_sdk.client import ApiError, Client
+from cwruxr_sdk.common import FromJson
+from cwruxr_sdk.material_message import MaterialMessage
+from cwruxr_sdk.object_message import ObjectMessage
+from cwruxr_sdk.precision import PrecisionProfile
+from cwruxr_sdk.transport import Transport
+from cwruxr_sdk import endpoints
+
+class _CacheEntry:
+    """
+    A cached response body, with the ETag the server sent for it and when it stops being fresh.
+    """
+    __slots__ = ("content", "etag", "expires")
+
+    def __init__(self, content : bytes, etag : Optional[str], expires : float):
+        self.content = content
+        self.etag = etag
+        self.expires = expires
+
+def _Id(message) -> Optional[str]:
+    """
+    Method to get the id of a message, or of a dictionary holding one.
+    """
+    if isinstance(message, dict):
+        return message.get("id")
+    return getattr(message, "id", None)
+
+class CachingClient(Client):
+    """
+    Client which caches the results of GetObject, GetMaterial and GetAnchor, for callers which read the same ids repeatedly.
+    Entries stay fresh for ttl seconds, and the least recently used entries are dropped beyond maxEntries.
+    Stale entries are revalidated with If-None-Match when the server sent an ETag, so unchanged bodies are not downloaded again.
+    Posts and deletes made through this client invalidate the entries they affect.
+    """
+
+    _ttl = 5.0
+    _maxEntries = 1024
+
+    def __init__(
+            self,
+            endpoint : str,
+            roomId : str,
+            anchorId : str,
+            ttl : Optional[float] = 5.0,
+            maxEntries : int = 1024,
+            poolSize : Optional[int] = None,
+            transport : Optional[Transport] = None,
+            compression : Optional[str] = None,
+            compressionThreshold : int = 16384,
+            compressionLevel : Optional[int] = None,
+            precision : Optional[PrecisionProfile] = None,
+        ):
+        """
+        Initialization function.
+
+        Arguments:
+        endpoint -- The Api endpoint to connect to.
+        roomId -- The Room to write to and read from.
+        anchorId -- The anchor in the room to write to and read from.
+        ttl -- The number of seconds a cached result is used without asking the server. None keeps results until they are invalidated.
+        maxEntries -- The largest number of results to cache.
+        poolSize -- The maximum number of connections kept open to the endpoint.
+        transport -- How requests are sent. Defaults to a RequestsTransport with poolSize.
+        compression -- The codec to compress request bodies with, compression.GZIP or compression.ZSTD. None sends them as is.
+        compressionThreshold -- The size in bytes from which request bodies are compressed.
+        compressionLevel -- The level to compress with. Defaults to the codec's entry in compression.DEFAULT_LEVELS.
+        precision -- How precisely poses and colors are sent, such as precision.FINE. None sends them at full precision.
+        """
+        super().__init__(endpoint, roomId, anchorId, poolSize = poolSize, transport = transport,
+            compression = compression, compressionThreshold = compressionThreshold, compressionLevel = compressionLevel,
+            precision = precision)
+        self._ttl = ttl
+        self._maxEntries = maxEntries
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+        # Bumped by every invalidation, so a response which was in flight during one is not cached.
+        self._generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    def CacheStats(self) -> dict[str, int]:
+        """
+        Get the cache counters.
+        hits are results served without a request, revalidations are results confirmed unchanged by the server,
+        misses are results downloaded in full, and evictions are entries dropped to stay within maxEntries.
+        """
+        with self._lock:
+            return {
+                "entries" : len(self._entries),
+                "hits" : self.hits,
+                "misses" : self.misses,
+                "revalidations" : self.revalidations,
+                "evictions" : self.evictions,
+            }
+
+    def ClearCache(self):
+        """
+        Drop every cached result.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def _Invalidate(self, endpoint : str, ids = None):
+        """
+        Drop the cached results for the given ids under an endpoint, or for every id under it when ids is None.
+        """
+        with self._lock:
+            if ids == None:
+                for key in [key for key in self._entries if key[0] == endpoint]:
+                    del self._entries[key]
+            else:
+                for id in ids:
+                    self._entries.pop((endpoint, id), None)
+            self._generation += 1
+
+    def _CachedGet(self, endpoint : str, id : str, headers : dict[str, str]) -> dict[str, Any]:
+        """
+        Get a result through the cache.
+        """
+        key = (endpoint, id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry != None:
+                self._entries.move_to_end(key)
+                if self._ttl == None or entry.expires > time.monotonic():
+                    self.hits += 1
+                    return FromJson(entry.content)
+            generation = self._generation
+
+        if entry != None and entry.etag != None:
+            headers = dict(headers)
+            headers["If-None-Match"] = entry.etag
+        result = self._Request("GET", endpoint, id = id, headers = headers)
+
+        if result.status_code == 304 and entry != None:
+            content = entry.content
+            etag = result.headers.get("ETag", entry.etag)
+        elif result.status_code == 200:
+            content = result.content
+            etag = result.headers.get("ETag")
+        else:
+            raise ApiError(result.status_code, result.reason)
+
+        expires = time.monotonic() + self._ttl if self._ttl != None else 0
+        with self._lock:
+            if result.status_code == 304:
+                self.revalidations += 1
+            else:
+                self.misses += 1
+            if generation == self._generation:
+                self._entries[key] = _CacheEntry(content, etag, expires)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._maxEntries:
+                    self._entries.popitem(last = False)
+                    self.evictions += 1
+        return FromJson(content)
+
+    ### POST ###
+    def PostAnchor(
+            self,
+            message : AnchorMessage,
+        ) -> requests.Response:
+        """
+        Post an anchor message to the API, and invalidate its cached result.
+        """
+        try:
+            return super().PostAnchor(message)
+        finally:
+            self._Invalidate(endpoints.ANCHOR_ENDPOINT, [_Id(message)])
+
+    def PostObject(
+            self,
+            message : ObjectMessage,
+            previous : Optional[ObjectMessage] = None,
+        ) -> Optional[requests.Response]:
+        """
+        Post an object message to the API, and invalidate its cached result.
+        """
+        try:
+            return super().PostObject(message, previous)
+        finally:
+            self._Invalidate(endpoints.OBJECT_ENDPOINT, [_Id(message)])
+
+    def PostObjectBulk(
+            self,
+            message,
+            previous : Optional[dict[str, Any]] = None,
+        ) -> Optional[requests.Response]:
+        """
+        Post a list of object messages to the API, and invalidate their cached results.
+        """
+        try:
+            return super().PostObjectBulk(message, previous)
+        finally:
+            self._Invalidate(endpoints.OBJECT_ENDPOINT, [_Id(m) for m in message] if isinstance(message, list) else None)
+
+    def PostObjectPoses(
+            self,
+            message : list,
+        ) -> requests.Response:
+        """
+        Post the poses of a list of object messages in the binary layout, and invalidate their cached results.
+        """
+        try:
+            return super().PostObjectPoses(message)
+        finally:
+            self._Invalidate(endpoints.OBJECT_ENDPOINT, [_Id(m) for m in message])
+
+    def PostMaterial(
+            self,
+            message : MaterialMessage,
+            previous : Optional[MaterialMessage] = None,
+        ) -> Optional[requests.Response]:
+        """
+        Post a material message to the API, and invalidate its cached result.
+        """
+        try:
+            return super().PostMaterial(message, previous)
+        finally:
+            self._Invalidate(endpoints.MATERIAL_ENDPOINT, [_Id(message)])
+
+    def PostMaterialBulk(
+            self,
+            message,
+            previous : Optional[dict[str, Any]] = None,
+        ) -> Optional[requests.Response]:
+        """
+        Post a list of material messages to the API, and invalidate their cached results.
+        """
+        try:
+            return super().PostMaterialBulk(message, previous)
+        finally:
+            self._Invalidate(endpoints.MATERIAL_ENDPOINT, [_Id(m) for m in message] if isinstance(message, list) else None)
+
+    ### GET ###
+    def GetAnchor(
+            self,
+            id : str,
+        ) -> dict[str, Any]:
+        """
+        Get an anchor in the room by the ID, from the cache when possible.
+        """
+        return self._CachedGet(endpoints.ANCHOR_ENDPOINT, id, self._roomHeaders)
+
+    def GetObject(
+            self,
+            id : str,
+        ) -> dict[str, Any]:
+        """
+        Get an object under the anchor by its ID, from the cache when possible.
+        """
+        return self._CachedGet(endpoints.OBJECT_ENDPOINT, id, self._anchorHeaders)
+
+    def GetMaterial(
+            self,
+            id : str,
+        ) -> dict[str, Any]:
+        """
+        Get a material by the id, from the cache when possible.
+        """
+        return self._CachedGet(endpoints.MATERIAL_ENDPOINT, id, self._roomHeaders)
+
+    ### Delete ###
+    def DeleteAllAnchors(
+            self,
+        ):
+        """
+        Delete all anchors in the room, and clear the cache, as the objects under them go too.
+        """
+        try:
+            return super().DeleteAllAnchors()
+        finally:
+            self.ClearCache()
+
+    def DeleteAnchor(
+            self,
+            id : str,
+        ):
+        """
+        Delete an anchor with the given ID, and clear the cached objects, as the objects under it go too.
+        """
+        try:
+            return super().DeleteAnchor(id)
+        finally:
+            self._Invalidate(endpoints.ANCHOR_ENDPOINT, [id])
+            self._Invalidate(endpoints.OBJECT_ENDPOINT)
+
+    def DeleteAllMaterials(
+            self,
+        ):
+        """
+        Delete all materials in this room, and invalidate every cached material.
+        """
+        try:
+            return super().DeleteAllMaterials()
+        finally:
+            self._Invalidate(endpoints.MATERIAL_ENDPOINT)
+
+    def DeleteMaterial(
+            self,
+            id : str,
+        ):
+        """
+        Delete the material with the given ID, and invalidate its cached result.
+        """
+        try:
+            return super().DeleteMaterial(id)
+        finally:
+            self._Invalidate(endpoints.MATERIAL_ENDPOINT, [id])
+
+    def DeleteAllObjects(
+            self,
+        ):
+        """
+        Delete all objects under the anchor, and invalidate every cached object.
+        """
+        try:
+            return super().DeleteAllObjects()
+        finally:
+            self._Invalidate(endpoints.OBJECT_ENDPOINT)
+
+    def DeleteObjectBulk(
+            self,
+            ids : list[str]
+        ):
+        """
+        Delete all objects with the given IDs, and invalidate their cached results.
+        """
+        try:
+            return super().DeleteObjectBulk(ids)
+        finally:
+            # The chunks of DeleteObjectBulkChunked arrive as json already, so every cached object is invalidated for them.
+            self._Invalidate(endpoints.OBJECT_ENDPOINT, ids if isinstance(ids, list) else None)
+
+    def DeleteObject(
+            self,
+            id : str,
+        ):
+        """
+        Delete the object with the given ID, and invalidate its cached result.
+        """
+        try:
+            return super().DeleteObject(id)
+        finally:
+            self._Invalidate(endpoints.OBJECT_ENDPOINT, [id])
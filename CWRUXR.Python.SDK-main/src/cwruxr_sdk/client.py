@@ -1,12 +1,30 @@
 from logging import exception
-from typing import Optional, Any
+import time
+from typing import Optional, Any, Iterator, Union
 import requests
 from cwruxr_sdk.anchor_message import AnchorMessage
+from cwruxr_sdk.binary_pose import CONTENT_TYPE as POSE_CONTENT_TYPE, EncodePoses
+from cwruxr_sdk.bulk import BulkResult, SendChunked
 from cwruxr_sdk.common import FromJson, ToJson
+from cwruxr_sdk.compression import AcceptEncoding, Available, Compress
+from cwruxr_sdk.delta import Diff, DiffList
+from cwruxr_sdk.instrumentation import Instrument, RequestRecord
 from cwruxr_sdk.material_message import MaterialMessage
 from cwruxr_sdk.object_message import ObjectMessage
+from cwruxr_sdk.precision import PrecisionProfile
+from cwruxr_sdk.transport import Transport, RequestsTransport
 from cwruxr_sdk import endpoints
 
+class ApiError(Exception):
+    """
+    Exception raised when the api answers a request with an error status.
+    Its message is the reason phrase, such as "Not Found", and status_code holds the status, such as 404.
+    """
+    def __init__(self, status_code : int, reason : str):
+        super().__init__(reason)
+        self.status_code = status_code
+        self.reason = reason
+
 class Client:
     """
     Client class which exposes methods for interacting with the api.
@@ -16,13 +34,24 @@ class Client:
     _roomIdDefault = ""
     _anchorIdDefault = ""
 
-    _session = None
+    _transport = None
+    _instruments = None
+    _compression = None
+    _compressionThreshold = 16384
+    _compressionLevel = None
+    _precision = None
 
     def __init__(
             self,
             endpoint : str,
             roomId : str,
-            anchorId : str
+            anchorId : str,
+            poolSize : Optional[int] = None,
+            transport : Optional[Transport] = None,
+            compression : Optional[str] = None,
+            compressionThreshold : int = 16384,
+            compressionLevel : Optional[int] = None,
+            precision : Optional[PrecisionProfile] = None,
         ):
         """
         Initialization function.
@@ -31,6 +60,12 @@ class Client:
         endpoint -- The Api endpoint to connect to.
         roomId -- The Room to write to and read from.
         anchorId -- The anchor in the room to write to and read from.
+        poolSize -- The maximum number of connections kept open to the endpoint. Raise this when sharing the client between threads.
+        transport -- How requests are sent, such as a transport.Urllib3Transport. Defaults to a RequestsTransport with poolSize.
+        compression -- The codec to compress request bodies with, compression.GZIP or compression.ZSTD. None sends them as is.
+        compressionThreshold -- The size in bytes from which request bodies are compressed. Smaller bodies are not worth it.
+        compressionLevel -- The level to compress with. Defaults to the codec's entry in compression.DEFAULT_LEVELS.
+        precision -- How precisely poses and colors are sent, such as precision.FINE. None sends them at full precision.
         """
         if endpoint != None:
             self._endpointDefault = endpoint
@@ -38,7 +73,131 @@ class Client:
             self._roomIdDefault = roomId
         if anchorId != None:
             self._anchorIdDefault = anchorId
-        self._session = requests.Session()
+        self._transport = transport if transport != None else RequestsTransport(poolSize)
+        if compression != None:
+            if not Available(compression):
+                # Raised here rather than on the first large request.
+                Compress(b"", compression)
+            self._compression = compression
+            self._compressionThreshold = compressionThreshold
+            self._compressionLevel = compressionLevel
+        self._precision = precision
+
+        # The headers of every request are built once here, and shared by all requests.
+        # Large responses, such as those of GetAllObjects, may come back compressed with any codec listed in Accept-Encoding.
+        self._roomHeaders = {
+            "Content-Type" : "application/json",
+            "Accept-Encoding" : AcceptEncoding(),
+            "RoomId" : self._roomIdDefault
+        }
+        self._anchorHeaders = {
+            "Content-Type" : "application/json",
+            "Accept-Encoding" : AcceptEncoding(),
+            "RoomId" : self._roomIdDefault,
+            "AnchorId" : self._anchorIdDefault
+        }
+        self._poseHeaders = dict(self._anchorHeaders)
+        self._poseHeaders["Content-Type"] = POSE_CONTENT_TYPE
+
+    def Close(self):
+        """
+        Close the transport and any pooled connections.
+        """
+        self._transport.Close()
+
+    def AddInstrument(
+            self,
+            instrument : Instrument,
+        ) -> Instrument:
+        """
+        Attach an instrument, such as an instrumentation.MetricsCollector, which observes every request the client sends.
+        Returns the instrument.
+        """
+        # The tuple is replaced rather than changed, so threads sending requests never see it half updated.
+        self._instruments = (self._instruments or ()) + (instrument,)
+        return instrument
+
+    def RemoveInstrument(
+            self,
+            instrument : Instrument,
+        ):
+        """
+        Detach an instrument. Without any instruments, requests are sent without measuring anything.
+        """
+        instruments = tuple(i for i in (self._instruments or ()) if i is not instrument)
+        self._instruments = instruments if len(instruments) > 0 else None
+
+    def _Compress(
+            self,
+            data : bytes,
+            headers : dict[str, str],
+        ) -> tuple[bytes, dict[str, str]]:
+        """
+        Compress a request body with the client's codec. Returns the body, and a copy of the headers with its Content-Encoding.
+        """
+        headers = dict(headers)
+        headers["Content-Encoding"] = self._compression
+        return Compress(data, self._compression, self._compressionLevel), headers
+
+    def _Request(
+            self,
+            method : str,
+            endpoint : str,
+            id : str = "",
+            message = None,
+            headers : Optional[dict[str, str]] = None,
+            stream : bool = False,
+        ) -> requests.Response:
+        """
+        Send a request through the transport, with message serialized as the body if given.
+        Every request the client sends goes through here, so attached instruments see all of them.
+        """
+        instruments = self._instruments
+        if instruments is None:
+            data = None
+            if message is not None:
+                data = ToJson(message, self._precision)
+                if self._compression is not None and len(data) >= self._compressionThreshold:
+                    data, headers = self._Compress(data, headers)
+            return self._transport.Request(
+                method,
+                self._endpointDefault + endpoint + id,
+                data = data,
+                headers = headers,
+                stream = stream
+            )
+
+        record = RequestRecord(method, endpoint + "{id}" if id != "" else endpoint, self._endpointDefault + endpoint + id)
+        data = None
+        if message is not None:
+            start = time.perf_counter()
+            data = ToJson(message, self._precision)
+            record.serializeSeconds = time.perf_counter() - start
+            if self._compression is not None and len(data) >= self._compressionThreshold:
+                start = time.perf_counter()
+                data, headers = self._Compress(data, headers)
+                record.compressSeconds = time.perf_counter() - start
+            record.requestBytes = len(data)
+        for instrument in instruments:
+            instrument.BeforeRequest(record)
+        start = time.perf_counter()
+        try:
+            result = self._transport.Request(method, record.url, data = data, headers = headers, stream = stream)
+        except Exception as e:
+            record.seconds = time.perf_counter() - start
+            record.error = e
+            for instrument in instruments:
+                instrument.AfterRequest(record)
+            raise
+        record.seconds = time.perf_counter() - start
+        record.status = result.status_code
+        if stream:
+            record.responseBytes = int(result.headers.get("Content-Length", 0))
+        else:
+            record.responseBytes = len(result.content)
+        for instrument in instruments:
+            instrument.AfterRequest(record)
+        return result
 
     ### POST ###
     def PostAnchor(
@@ -48,101 +207,170 @@ class Client:
         """
         Post an anchor message to the API.
         """
-        result = self._session.post(
-            self._endpointDefault + endpoints.ANCHOR_ENDPOINT,
-            data = ToJson(message),
-            headers = { 
-                    "Content-Type" : "application/json",
-                    "RoomId" : self._roomIdDefault
-                }
+        result = self._Request(
+            "POST",
+            endpoints.ANCHOR_ENDPOINT,
+            message = message,
+            headers = self._roomHeaders
         )
         if result.status_code != 200:
-            raise Exception(result.reason)
+            raise ApiError(result.status_code, result.reason)
         return result
 
     def PostObject(
             self,
             message : ObjectMessage,
-        ) -> requests.Response:
+            previous : Optional[ObjectMessage] = None,
+        ) -> Optional[requests.Response]:
         """
         Post an object message to the API.
-        """
-        result = self._session.post(
-            self._endpointDefault + endpoints.OBJECT_ENDPOINT,
-            data = ToJson(message),
-            headers = { 
-                    "Content-Type" : "application/json",
-                    "RoomId" : self._roomIdDefault,
-                    "AnchorId" : self._anchorIdDefault
-                }
+        If previous is given, only the fields which changed since previous are sent, and nothing is sent if none changed.
+        """
+        if previous != None:
+            message = Diff(previous, message, self._precision)
+            if message == None:
+                return None
+        result = self._Request(
+            "POST",
+            endpoints.OBJECT_ENDPOINT,
+            message = message,
+            headers = self._anchorHeaders
         )
         if result.status_code != 200:
-            raise Exception(result.reason)
+            raise ApiError(result.status_code, result.reason)
         return result
 
     def PostObjectBulk(
             self,
             message,
-        ) -> requests.Response:
+            previous : Optional[dict[str, Any]] = None,
+        ) -> Optional[requests.Response]:
         """
         Post a list of object messages to the API.
-        """
+        If previous is given as a dictionary of the last sent messages by id, only changed fields are sent for those messages.
+        Unchanged messages are dropped, and nothing is sent if none changed.
+        """
+        if previous != None:
+            message = DiffList(message, previous, self._precision)
+            if len(message) == 0:
+                return None
+
+        result = self._Request(
+            "POST",
+            endpoints.OBJECT_BULK_ENDPOINT,
+            message = message,
+            headers = self._anchorHeaders
+        )
+        if result.status_code != 200:
+            raise ApiError(result.status_code, result.reason)
+        return result
 
-        result = self._session.post(
-            self._endpointDefault + endpoints.OBJECT_BULK_ENDPOINT,
-            data = ToJson(message),
-            headers = { 
-                    "Content-Type" : "application/json",
-                    "RoomId" : self._roomIdDefault,
-                    "AnchorId" : self._anchorIdDefault
-                }
+    def PostObjectPoses(
+            self,
+            message : list,
+        ) -> requests.Response:
+        """
+        Post the pose, active and materialID of a list of object messages in the compact binary layout of binary_pose,
+        which takes several times fewer bytes than json. Other fields are not sent, so create the objects with PostObjectBulk first.
+        Only servers which accept binary_pose.CONTENT_TYPE on the bulk object endpoint, such as LocalServer, can be posted to.
+        """
+        result = self._Request(
+            "POST",
+            endpoints.OBJECT_BULK_ENDPOINT,
+            message = EncodePoses(message),
+            headers = self._poseHeaders
         )
         if result.status_code != 200:
-            raise Exception(result.reason)
+            raise ApiError(result.status_code, result.reason)
         return result
 
     def PostMaterial(
             self,
             message : MaterialMessage,
-        ) -> requests.Response:
+            previous : Optional[MaterialMessage] = None,
+        ) -> Optional[requests.Response]:
         """
         Post a material message to the API.
-        """
-
-        data = ToJson(message)
-
-        result = self._session.post(
-            self._endpointDefault + endpoints.MATERIAL_ENDPOINT,
-            data = data,
-            headers = { 
-                    "Content-Type" : "application/json",
-                    "RoomId" : self._roomIdDefault
-                }
+        If previous is given, only the fields which changed since previous are sent, and nothing is sent if none changed.
+        """
+        if previous != None:
+            message = Diff(previous, message, self._precision)
+            if message == None:
+                return None
+
+        result = self._Request(
+            "POST",
+            endpoints.MATERIAL_ENDPOINT,
+            message = message,
+            headers = self._roomHeaders
         )
         if result.status_code != 200:
-            raise Exception(result.reason)
+            raise ApiError(result.status_code, result.reason)
         return result
 
     def PostMaterialBulk(
             self,
             message,
-        ) -> requests.Response:
+            previous : Optional[dict[str, Any]] = None,
+        ) -> Optional[requests.Response]:
         """
         Post a list of material messages to the API.
-        """
-
-        result = self._session.post(
-            self._endpointDefault + endpoints.MATERIAL_BULK_ENDPOINT,
-            data = ToJson(message),
-            headers = { 
-                    "Content-Type" : "application/json",
-                    "RoomId" : self._roomIdDefault
-                }
+        If previous is given as a dictionary of the last sent messages by id, only changed fields are sent for those messages.
+        Unchanged messages are dropped, and nothing is sent if none changed.
+        """
+        if previous != None:
+            message = DiffList(message, previous, self._precision)
+            if len(message) == 0:
+                return None
+
+        result = self._Request(
+            "POST",
+            endpoints.MATERIAL_BULK_ENDPOINT,
+            message = message,
+            headers = self._roomHeaders
         )
         if result.status_code != 200:
-            raise Exception(result.reason)
+            raise ApiError(result.status_code, result.reason)
         return result
 
+    def PostObjectBulkChunked(
+            self,
+            message : list,
+            maxItems : int = 1000,
+            maxBytes : int = 1 << 20,
+            parallelism : int = 8,
+        ) -> BulkResult:
+        """
+        Post a list of object messages to the API in chunks, several chunks at a time.
+        Failed chunks are reported in the result instead of raising.
+
+        Arguments:
+        message -- The object messages to post.
+        maxItems -- The largest number of messages in one request.
+        maxBytes -- The largest body of one request, unless a single message is larger.
+        parallelism -- The number of requests in flight at once. Create the client with a poolSize at least this large.
+        """
+        return SendChunked(self.PostObjectBulk, message, maxItems, maxBytes, parallelism, self._precision)
+
+    def PostMaterialBulkChunked(
+            self,
+            message : list,
+            maxItems : int = 1000,
+            maxBytes : int = 1 << 20,
+            parallelism : int = 8,
+        ) -> BulkResult:
+        """
+        Post a list of material messages to the API in chunks, several chunks at a time.
+        Failed chunks are reported in the result instead of raising.
+
+        Arguments:
+        message -- The material messages to post.
+        maxItems -- The largest number of messages in one request.
+        maxBytes -- The largest body of one request, unless a single message is larger.
+        parallelism -- The number of requests in flight at once. Create the client with a poolSize at least this large.
+        """
+        return SendChunked(self.PostMaterialBulk, message, maxItems, maxBytes, parallelism, self._precision)
+
     ### GET ###
     def GetAllAnchors(
             self,
@@ -151,15 +379,13 @@ class Client:
         Get all anchors for the room.
         """
 
-        result = self._session.get(
-            self._endpointDefault + endpoints.ANCHOR_ENDPOINT,
-            headers = { 
-                    "Content-Type" : "application/json",
-                    "RoomId" : self._roomIdDefault
-                }
+        result = self._Request(
+            "GET",
+            endpoints.ANCHOR_ENDPOINT,
+            headers = self._roomHeaders
         )
         if result.status_code != 200:
-            raise Exception(result.reason)
+            raise ApiError(result.status_code, result.reason)
         l = []
         for data in FromJson(result.content):
             l.append(data)
@@ -173,15 +399,14 @@ class Client:
         Get an anchor in the room by the ID.
         """
         
-        result = self._session.get(
-            self._endpointDefault + endpoints.ANCHOR_ENDPOINT + id,
-            headers = { 
-                    "Content-Type" : "application/json",
-                    "RoomId" : self._roomIdDefault
-                }
+        result = self._Request(
+            "GET",
+            endpoints.ANCHOR_ENDPOINT,
+            id = id,
+            headers = self._roomHeaders
         )
         if result.status_code != 200:
-            raise Exception(result.reason)
+            raise ApiError(result.status_code, result.reason)
         return FromJson(result.content)
 
     def GetAllObjects(
@@ -191,20 +416,45 @@ class Client:
         Get all objects under the anchor.
         """
 
-        result = self._session.get(
-            self._endpointDefault + endpoints.OBJECT_ENDPOINT,
-            headers = { 
-                    "Content-Type" : "application/json",
-                    "RoomId" : self._roomIdDefault,
-                    "AnchorId" : self._anchorIdDefault
-                }
+        result = self._Request(
+            "GET",
+            endpoints.OBJECT_ENDPOINT,
+            headers = self._anchorHeaders
         )
         if result.status_code != 200:
-            raise Exception(result.reason)
+            raise ApiError(result.status_code, result.reason)
         l = []
         for data in FromJson(result.content):
             l.append(data)
         return l
+
+    def IterAllObjects(
+            self,
+            typed : bool = False,
+            chunkSize : int = 65536,
+        ) -> Iterator[Union[dict[str, Any], ObjectMessage]]:
+        """
+        Get all objects under the anchor one at a time, decoding the response while it downloads.
+        Unlike GetAllObjects, the whole response is never held in memory, and the first object is ready as soon as it arrives.
+        The request is sent when iteration starts.
+
+        Arguments:
+        typed -- Yield ObjectMessage.FromDict results instead of dictionaries.
+        chunkSize -- The number of bytes to read from the response at a time.
+        """
+        # numpy is only needed when streaming, so it is imported here.
+        from cwruxr_sdk.json_stream import IterJsonArray
+
+        with self._Request(
+            "GET",
+            endpoints.OBJECT_ENDPOINT,
+            headers = self._anchorHeaders,
+            stream = True
+        ) as result:
+            if result.status_code != 200:
+                raise ApiError(result.status_code, result.reason)
+            for data in IterJsonArray(result.iter_content(chunkSize)):
+                yield ObjectMessage.FromDict(data) if typed else data
     
     def GetObject(
             self,
@@ -214,16 +464,14 @@ class Client:
         Get an object under the anchor by its ID.
         """
         
-        result = self._session.get(
-            self._endpointDefault + endpoints.OBJECT_ENDPOINT + id,
-            headers = { 
-                    "Content-Type" : "application/json",
-                    "RoomId" : self._roomIdDefault,
-                    "AnchorId" : self._anchorIdDefault
-                }
+        result = self._Request(
+            "GET",
+            endpoints.OBJECT_ENDPOINT,
+            id = id,
+            headers = self._anchorHeaders
         )
         if result.status_code != 200:
-            raise Exception(result.reason)
+            raise ApiError(result.status_code, result.reason)
         data = FromJson(result.content)
         return data
 
@@ -234,20 +482,46 @@ class Client:
         Get all materials in the room.
         """
 
-        result = self._session.get(
-            self._endpointDefault + endpoints.MATERIAL_ENDPOINT,
-            headers = { 
-                    "Content-Type" : "application/json",
-                    "RoomId" : self._roomIdDefault
-                }
+        result = self._Request(
+            "GET",
+            endpoints.MATERIAL_ENDPOINT,
+            headers = self._roomHeaders
         )
         if result.status_code != 200:
-            raise Exception(result.reason)
+            raise ApiError(result.status_code, result.reason)
         l = []
         for data in FromJson(result.content):
             l.append(data)
         return l
 
+    def IterAllMaterials(
+            self,
+            typed : bool = False,
+            chunkSize : int = 65536,
+        ) -> Iterator[Union[dict[str, Any], MaterialMessage]]:
+        """
+        Get all materials in the room one at a time, decoding the response while it downloads.
+        Unlike GetAllMaterials, the whole response is never held in memory, and the first material is ready as soon as it arrives.
+        The request is sent when iteration starts.
+
+        Arguments:
+        typed -- Yield MaterialMessage.FromDict results instead of dictionaries.
+        chunkSize -- The number of bytes to read from the response at a time.
+        """
+        # numpy is only needed when streaming, so it is imported here.
+        from cwruxr_sdk.json_stream import IterJsonArray
+
+        with self._Request(
+            "GET",
+            endpoints.MATERIAL_ENDPOINT,
+            headers = self._roomHeaders,
+            stream = True
+        ) as result:
+            if result.status_code != 200:
+                raise ApiError(result.status_code, result.reason)
+            for data in IterJsonArray(result.iter_content(chunkSize)):
+                yield MaterialMessage.FromDict(data) if typed else data
+
     def GetMaterial(
             self,
             id : str
@@ -256,15 +530,14 @@ class Client:
         Get a material by the id.
         """
         
-        result = self._session.get(
-            self._endpointDefault + endpoints.MATERIAL_ENDPOINT + id,
-            headers = { 
-                    "Content-Type" : "application/json",
-                    "RoomId" : self._roomIdDefault
-                }
+        result = self._Request(
+            "GET",
+            endpoints.MATERIAL_ENDPOINT,
+            id = id,
+            headers = self._roomHeaders
         )
         if result.status_code != 200:
-            raise Exception(result.reason)
+            raise ApiError(result.status_code, result.reason)
         data = FromJson(result.content)
 
         return data
@@ -277,16 +550,13 @@ class Client:
         Delete all anchors in the room.
         """
         
-        result = self._session.delete(
-            self._endpointDefault + endpoints.ANCHOR_ENDPOINT,
-            headers = { 
-                    "Content-Type" : "application/json",
-                    "RoomId" : self._roomIdDefault,
-                    "AnchorId" : self._anchorIdDefault
-                }
+        result = self._Request(
+            "DELETE",
+            endpoints.ANCHOR_ENDPOINT,
+            headers = self._anchorHeaders
         )
         if result.status_code != 200:
-            raise Exception(result.reason)
+            raise ApiError(result.status_code, result.reason)
         pass
 
     def DeleteAnchor(
@@ -297,16 +567,14 @@ class Client:
         Delete an anchor with the given ID.
         """
 
-        result = self._session.delete(
-            self._endpointDefault + endpoints.ANCHOR_ENDPOINT + id,
-            headers = { 
-                    "Content-Type" : "application/json",
-                    "RoomId" : self._roomIdDefault,
-                    "AnchorId" : self._anchorIdDefault
-                }
+        result = self._Request(
+            "DELETE",
+            endpoints.ANCHOR_ENDPOINT,
+            id = id,
+            headers = self._anchorHeaders
         )
         if result.status_code != 200:
-            raise Exception(result.reason)
+            raise ApiError(result.status_code, result.reason)
         pass
 
     def DeleteAllMaterials(
@@ -316,16 +584,13 @@ class Client:
         Delete all materials in this room.
         """
 
-        result = self._session.delete(
-            self._endpointDefault + endpoints.MATERIAL_ENDPOINT,
-            headers = { 
-                    "Content-Type" : "application/json",
-                    "RoomId" : self._roomIdDefault,
-                    "AnchorId" : self._anchorIdDefault
-                }
+        result = self._Request(
+            "DELETE",
+            endpoints.MATERIAL_ENDPOINT,
+            headers = self._anchorHeaders
         )
         if result.status_code != 200:
-            raise Exception(result.reason)
+            raise ApiError(result.status_code, result.reason)
         pass
 
     def DeleteMaterial(
@@ -336,15 +601,14 @@ class Client:
         Delete the material with the given ID.
         """
 
-        result = self._session.delete(
-            self._endpointDefault + endpoints.MATERIAL_ENDPOINT + id,
-            headers = { 
-                    "Content-Type" : "application/json",
-                    "RoomId" : self._roomIdDefault
-                }
+        result = self._Request(
+            "DELETE",
+            endpoints.MATERIAL_ENDPOINT,
+            id = id,
+            headers = self._roomHeaders
         )
         if result.status_code != 200:
-            raise Exception(result.reason)
+            raise ApiError(result.status_code, result.reason)
         pass
 
     def DeleteAllObjects(
@@ -354,16 +618,13 @@ class Client:
         Delete all objects under the anchor.
         """
         
-        result = self._session.delete(
-            self._endpointDefault + endpoints.OBJECT_ENDPOINT,
-            headers = { 
-                    "Content-Type" : "application/json",
-                    "RoomId" : self._roomIdDefault,
-                    "AnchorId" : self._anchorIdDefault
-                }
+        result = self._Request(
+            "DELETE",
+            endpoints.OBJECT_ENDPOINT,
+            headers = self._anchorHeaders
         )
         if result.status_code != 200:
-            raise Exception(result.reason)
+            raise ApiError(result.status_code, result.reason)
         pass
 
     def DeleteObjectBulk(
@@ -373,19 +634,35 @@ class Client:
         """
         Delete all objects with the given IDs.
         """
-        result = self._session.delete(
-            self._endpointDefault + endpoints.OBJECT_BULK_ENDPOINT,
-            data = ToJson(ids),
-            headers = { 
-                    "Content-Type" : "application/json",
-                    "RoomId" : self._roomIdDefault,
-                    "AnchorId" : self._anchorIdDefault
-                }
+        result = self._Request(
+            "DELETE",
+            endpoints.OBJECT_BULK_ENDPOINT,
+            message = ids,
+            headers = self._anchorHeaders
         )
         if result.status_code != 200:
-            raise Exception(result.reason)
+            raise ApiError(result.status_code, result.reason)
         pass
 
+    def DeleteObjectBulkChunked(
+            self,
+            ids : list[str],
+            maxItems : int = 1000,
+            maxBytes : int = 1 << 20,
+            parallelism : int = 8,
+        ) -> BulkResult:
+        """
+        Delete all objects with the given IDs in chunks, several chunks at a time.
+        Failed chunks are reported in the result instead of raising.
+
+        Arguments:
+        ids -- The IDs of the objects to delete.
+        maxItems -- The largest number of IDs in one request.
+        maxBytes -- The largest body of one request.
+        parallelism -- The number of requests in flight at once. Create the client with a poolSize at least this large.
+        """
+        return SendChunked(self.DeleteObjectBulk, ids, maxItems, maxBytes, parallelism)
+
     def DeleteObject(
             self,
             id : str,
@@ -394,14 +671,12 @@ class Client:
         Delete the object with the given ID.
         """
         
-        result = self._session.delete(
-            self._endpointDefault + endpoints.OBJECT_ENDPOINT + id,
-            headers = { 
-                    "Content-Type" : "application/json",
-                    "RoomId" : self._roomIdDefault,
-                    "AnchorId" : self._anchorIdDefault
-                }
+        result = self._Request(
+            "DELETE",
+            endpoints.OBJECT_ENDPOINT,
+            id = id,
+            headers = self._anchorHeaders
         )
         if result.status_code != 200:
-            raise Exception(result.reason)
+            raise ApiError(result.status_code, result.reason)
         pass
\ No newline at end of file
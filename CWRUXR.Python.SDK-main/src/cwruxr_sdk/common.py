@@ -1,12 +1,21 @@
 import orjson as json
+from dataclasses import dataclass
 from math import sin, cos
+from operator import attrgetter
 from typing import Any, Optional
 
+# Pose, Vector3 and Quaternion make up most of a scene. They are declared as dataclasses, keeping their own initialization and
+# comparison functions, so orjson serializes them itself from their __dict__, without a call to ToJson's default per value.
+@dataclass(init = False, eq = False, repr = False)
 class Vector3:
     """
     Class which holds an x, y and z float component.
     Can be used for position, scale, or euler rotation.
     """
+    x : float
+    y : float
+    z : float
+
     def __init__(self, x : float = 0, y : float = 0, z : float = 0):
         """
         Initialization function.
@@ -43,6 +52,8 @@ class Vector2:
     Class which holds an x and y float component.
     Can be used for position, scale, or euler rotation.
     """
+    __slots__ = ("x", "y")
+
     def __init__(self, x : float = 0, y : float = 0):
         """
         Initialization function.
@@ -71,10 +82,16 @@ class Vector2:
             return (__o.x == self.x) & (__o.y == self.y)
         return False
 
+@dataclass(init = False, eq = False, repr = False)
 class Quaternion:
     """
     Class which defines an object's rotation.
     """
+    x : float
+    y : float
+    z : float
+    w : float
+
     def __init__(self, x : float = 0, y : float = 0, z: float = 0, w : float = 1):
         """
         Initialization function.
@@ -117,10 +134,19 @@ def Euler(v3 : Vector3) -> Quaternion:
 
     return Quaternion(qx,qy,qz,qw)
 
+@dataclass(init = False, eq = False, repr = False)
 class Pose:
     """
     Class which holds the full information about position, rotation, and scale of an object.
+    Components which are None are not serialized.
     """
+    # Components which were not given are not stored on the instance, so they are left out of the __dict__ orjson serializes,
+    # and read as None.
+    position : Optional[Vector3] = None
+    rotation : Optional[Quaternion] = None
+    eulerRotation : Optional[Vector3] = None
+    scale : Optional[Vector3] = None
+
     def __init__(
             self, 
             position : Optional[Vector3] = None, 
@@ -134,35 +160,44 @@ class Pose:
         Arguments:
         position -- The Position of the object
         rotation -- The Rotation of the object
+        euler -- The Rotation of the object as euler angles
         scale -- The Scale of the object
         """
-        if position != None:
+        if position is not None:
             self.position = position
-        if rotation != None:
+        if rotation is not None:
             self.rotation = rotation
-        if euler != None:
+        if euler is not None:
             self.eulerRotation = euler
-        if scale != None:
+        if scale is not None:
             self.scale = scale
     
     @classmethod
     def FromDict(cls, data : dict):
         """
         Method to create a Pose from a dictionary.
+        Components missing from the dictionary are None, so they are not sent when the pose is posted again.
         """
         if data == None:
             return cls()
+        # Components are built inline and passed by position, as this runs once per object when decoding a room.
+        position = data.get("position")
+        rotation = data.get("rotation")
+        euler = data.get("eulerRotation")
+        scale = data.get("scale")
         return cls(
-            position = Vector3.FromDict(data.get("position")),
-            rotation = Quaternion.FromDict(data.get("rotation")),
-            euler = Vector3.FromDict(data.get("eulerRotation")),
-            scale = Vector3.FromDict(data.get("scale"))
+            None if position is None else Vector3(position.get("x"), position.get("y"), position.get("z")),
+            None if rotation is None else Quaternion(rotation.get("x"), rotation.get("y"), rotation.get("z"), rotation.get("w")),
+            None if euler is None else Vector3(euler.get("x"), euler.get("y"), euler.get("z")),
+            None if scale is None else Vector3(scale.get("x"), scale.get("y"), scale.get("z"))
         )
 
 class Color:
     """
     Class which contains the rgb components defining a color, and the alpha.
     """
+    __slots__ = ("r", "g", "b", "a")
+
     def __init__(
             self,
             r : float = 0,
@@ -194,11 +229,94 @@ class Color:
         return cls(data.get("r"), data.get("g"), data.get("b"), data.get("a"))
     
 
-def ToJson(obj) -> str:
+# Encoders registered with RegisterEncoder, keyed by the class they were registered for.
+# Vector2 and Color are slotted and have no __dict__, so they always need one.
+# Pose, Vector3 and Quaternion are dataclasses, which orjson serializes without calling an encoder.
+_ENCODERS = {
+    Vector2 : lambda v : {"x" : v.x, "y" : v.y},
+    Color : lambda c : {"r" : c.r, "g" : c.g, "b" : c.b, "a" : c.a},
+}
+
+# Encoder which serializes an object's __dict__ as is, for classes without a registered encoder.
+# attrgetter runs in C, so these objects, which are most of a scene, cost no Python call of their own.
+_GetDict = attrgetter("__dict__")
+
+# The encoder to use for each concrete class, found once from _ENCODERS the first time the class is serialized.
+_RESOLVED = {}
+
+def RegisterEncoder(cls : type, encoder):
+    """
+    Method to set how ToJson serializes instances of a class and its subclasses.
+    The encoder is called with the instance, and should return a type orjson can serialize, such as a dictionary.
+    Pass None as the encoder to serialize the instance's __dict__ as is.
+    Dataclasses, such as Pose, Vector3 and Quaternion, are serialized by orjson itself and never reach an encoder.
+    """
+    _ENCODERS[cls] = encoder
+    _RESOLVED.clear()
+
+def EncodeWithoutNone(obj) -> dict:
+    """
+    Encoder which serializes an object's attributes, skipping any which are None.
+    Use for classes whose constructors store None for optional fields.
+    """
+    data = obj.__dict__
+    if None in data.values():
+        return {key : value for key, value in data.items() if value is not None}
+    return data
+
+def _Resolve(cls : type):
+    """
+    Method to find the encoder for a class from the closest registered class in its hierarchy.
+    """
+    encoder = None
+    for base in cls.__mro__:
+        if base in _ENCODERS:
+            encoder = _ENCODERS[base]
+            break
+    if encoder is None:
+        encoder = _GetDict
+    _RESOLVED[cls] = encoder
+    return encoder
+
+def _Default(obj) -> Any:
+    """
+    Method used by ToJson to serialize any object which is not a json type.
+    """
+    encoder = _RESOLVED.get(type(obj))
+    if encoder is None:
+        encoder = _Resolve(type(obj))
+    return encoder(obj)
+
+def ToJson(obj, precision = None) -> bytes:
+    """
+    Method to turn an object into json.
+    Returns the utf-8 encoded bytes, which can be sent as a request body without another copy.
+    Bytes are taken to be json already, such as the output of ObjectBatch.ToJson, and are returned as is.
+    precision is an optional precision.PrecisionProfile which poses and colors are rounded with.
+    """
+    if isinstance(obj, bytes):
+        return obj
+    if precision is None:
+        return json.dumps(obj, default=_Default)
+    # Dataclasses are passed to the profile too, so it can round poses.
+    return json.dumps(obj, default=precision.Default, option=json.OPT_PASSTHROUGH_DATACLASS)
+
+def DecodeFields(cls : type, data : dict, fields : tuple = ()):
     """
-    Method to turn an object into a json string.
+    Method to create an instance of a class straight from a dictionary, without calling its initialization function.
+    Entries of the dictionary become attributes of the instance, skipping any which are None, as the initialization functions do.
+    fields is a precomputed table of (key, decoder) pairs for the entries which hold nested objects, such as ("pose", Pose.FromDict).
     """
-    return json.dumps(obj, default=lambda a : a.__dict__)
+    val = cls.__new__(cls)
+    if None in data.values():
+        data = {key : value for key, value in data.items() if value is not None}
+    else:
+        data = data.copy()
+    for key, decoder in fields:
+        if key in data:
+            data[key] = decoder(data[key])
+    val.__dict__ = data
+    return val
 
 def FromJson(obj) -> dict:
     """
@@ -0,0 +1,94 @@
+import zlib
+from typing import Optional
+from urllib3.util.request import ACCEPT_ENCODING
+
+# Codec for gzip, which needs nothing beyond the standard library.
+GZIP = "gzip"
+# Codec for Zstandard, which compresses about as well as gzip at several times the speed. Needs Python 3.14, backports.zstd or zstandard.
+ZSTD = "zstd"
+
+# The compression level each codec uses unless one is given.
+DEFAULT_LEVELS = {
+    GZIP : 6,
+    ZSTD : 3,
+}
+
+def _Zstd():
+    """
+    Method to get the compress and decompress functions for zstd, which is only needed for the zstd codec, so it is imported here.
+    Uses the standard library's compression.zstd from Python 3.14, then backports.zstd, then the zstandard package.
+    """
+    try:
+        from compression import zstd
+        return zstd.compress, zstd.decompress
+    except ImportError:
+        pass
+    try:
+        from backports import zstd
+        return zstd.compress, zstd.decompress
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("The zstd codec needs Python 3.14, or the backports.zstd or zstandard package: pip install backports.zstd")
+    return (
+        lambda data, level : zstandard.ZstdCompressor(level = level).compress(data),
+        lambda data : zstandard.ZstdDecompressor().decompressobj().decompress(data),
+    )
+
+def Available(codec : str) -> bool:
+    """
+    Method to check whether a codec can be used in this environment.
+    """
+    if codec == GZIP:
+        return True
+    if codec == ZSTD:
+        try:
+            _Zstd()
+            return True
+        except ImportError:
+            return False
+    return False
+
+def Compress(
+        data : bytes,
+        codec : str,
+        level : Optional[int] = None,
+    ) -> bytes:
+    """
+    Method to compress a request body with a codec, for sending with a Content-Encoding header of the codec's name.
+    """
+    if level == None:
+        level = DEFAULT_LEVELS.get(codec)
+    if codec == GZIP:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+        return compressor.compress(data) + compressor.flush()
+    if codec == ZSTD:
+        return _Zstd()[0](data, level)
+    raise ValueError("Unknown compression codec: " + str(codec))
+
+def Decompress(
+        data : bytes,
+        codec : str,
+    ) -> bytes:
+    """
+    Method to decompress a body sent with a Content-Encoding header of the codec's name.
+    """
+    if codec == GZIP:
+        return zlib.decompress(data, 47)
+    if codec == ZSTD:
+        return _Zstd()[1](data)
+    raise ValueError("Unknown compression codec: " + str(codec))
+
+def AcceptEncoding() -> str:
+    """
+    Method to get the Accept-Encoding header value listing the codecs responses can be decoded with here, zstd first when available.
+    Responses are decoded by urllib3, under both requests and Urllib3Transport, so these are the codecs urllib3 supports:
+    always gzip and deflate, as in the requests default the header replaces, and zstd and br when their packages are installed.
+    """
+    codecs = [codec.strip() for codec in ACCEPT_ENCODING.split(",")]
+    if ZSTD in codecs:
+        codecs.remove(ZSTD)
+        codecs.insert(0, ZSTD)
+    return ", ".join(codecs)
@@ -0,0 +1,89 @@
+from typing import Any, Optional
+from cwruxr_sdk.common import FromJson, ToJson
+
+# Key sets of the value types which are always sent whole (Vector2, Vector3, Quaternion, and Color).
+# The api reads these as complete values, so a partial vector would reset the missing components.
+_ATOMIC_KEYS = (
+    frozenset(("x", "y")),
+    frozenset(("x", "y", "z")),
+    frozenset(("x", "y", "z", "w")),
+    frozenset(("r", "g", "b", "a")),
+)
+
+# Keys which are always kept in a patch so the api can find and interpret the message.
+_IDENTITY_KEYS = ("id", "shader")
+
+def _ToDict(message, precision = None) -> dict[str, Any]:
+    """
+    Method to get the serialized form of a message as a dictionary.
+    """
+    if isinstance(message, dict):
+        return message
+    return FromJson(ToJson(message, precision))
+
+def _MergePatch(old : dict, new : dict) -> dict[str, Any]:
+    """
+    Method to get the keys of new which differ from old, recursing into nested objects.
+    """
+    patch = {}
+    for key, value in new.items():
+        before = old.get(key)
+        if key in old and before == value:
+            continue
+        if isinstance(value, dict) and isinstance(before, dict) and frozenset(value) not in _ATOMIC_KEYS:
+            nested = _MergePatch(before, value)
+            if len(nested) > 0:
+                patch[key] = nested
+        else:
+            patch[key] = value
+    return patch
+
+def Diff(
+        old,
+        new,
+        precision = None,
+    ) -> Optional[dict[str, Any]]:
+    """
+    Method to get the minimal partial message which turns old into new, in the style of a JSON merge patch.
+    Works on ObjectMessages, MaterialMessages, or their dictionary forms.
+    Only changed fields are kept, including fields nested in the pose, interpolation, and parameters.
+    Vectors, quaternions, and colors are sent whole when any component changes.
+    The id (and shader for materials) is always kept. Returns None when nothing changed.
+    Fields which are missing from new are left unchanged, since the api cannot unset a field.
+    With a precision.PrecisionProfile as precision, both messages are rounded first, so changes smaller than it are not sent.
+    """
+    oldDict = _ToDict(old, precision)
+    newDict = _ToDict(new, precision)
+    patch = _MergePatch(oldDict, newDict)
+    if len(patch) == 0:
+        return None
+    result = {}
+    for key in _IDENTITY_KEYS:
+        if key in newDict:
+            result[key] = newDict[key]
+    result.update(patch)
+    return result
+
+def DiffList(
+        messages : list,
+        previous : dict[str, Any],
+        precision = None,
+    ) -> list[Any]:
+    """
+    Method to diff a list of messages against the previously sent messages with the same ids.
+    Messages with no previous entry are kept whole, and messages with no changes are dropped.
+    precision is passed on to Diff.
+    """
+    result = []
+    for message in messages:
+        if isinstance(message, dict):
+            before = previous.get(message.get("id"))
+        else:
+            before = previous.get(getattr(message, "id", None))
+        if before == None:
+            result.append(message)
+            continue
+        patch = Diff(before, message, precision)
+        if patch != None:
+            result.append(patch)
+    return result
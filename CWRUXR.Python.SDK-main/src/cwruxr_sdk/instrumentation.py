@@ -0,0 +1,265 @@
+from bisect import bisect_left
+from threading import Lock
+from typing import Any, Callable, Optional
+
+class RequestRecord:
+    """
+    What is known about one request sent by a Client, passed to the instruments before and after it is sent.
+    Fields which are only known once the request finished are None in BeforeRequest.
+    """
+    __slots__ = ("method", "endpoint", "url", "requestBytes", "serializeSeconds", "compressSeconds", "status", "responseBytes", "seconds", "error")
+
+    def __init__(self, method : str, endpoint : str, url : str):
+        """
+        Initialization function.
+
+        Arguments:
+        method -- GET, POST or DELETE.
+        endpoint -- The endpoint the request was sent to, such as "object/", with any id written as {id}, such as "object/{id}".
+        url -- The full url of the request.
+        """
+        self.method = method
+        self.endpoint = endpoint
+        self.url = url
+        self.requestBytes = 0
+        # Time spent turning the message into json, or 0 when the body was given as bytes.
+        self.serializeSeconds = 0.0
+        # Time spent compressing the body, or 0 when it was sent as is. requestBytes is the size after compression.
+        self.compressSeconds = 0.0
+        self.status = None
+        # For streamed responses this is the Content-Length, as the body is read later.
+        self.responseBytes = None
+        # Time from sending the request until the response arrived, or until the headers arrived for streamed responses.
+        self.seconds = None
+        # The exception raised by the session, such as a connection error.
+        self.error = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error == None and self.status != None and self.status < 400
+
+class Instrument:
+    """
+    Parent class for instruments, which Client.AddInstrument attaches to a client to observe every request it sends.
+    Both hooks run on the thread sending the request, so they should be quick and thread safe.
+    """
+    def BeforeRequest(self, record : RequestRecord):
+        """
+        Called just before a request is sent, after its body was serialized.
+        """
+        pass
+
+    def AfterRequest(self, record : RequestRecord):
+        """
+        Called when a request finished or failed.
+        """
+        pass
+
+class CallbackInstrument(Instrument):
+    """
+    Instrument which calls the given functions, for hooks which do not need a class of their own.
+    """
+    def __init__(
+            self,
+            before : Optional[Callable[[RequestRecord], Any]] = None,
+            after : Optional[Callable[[RequestRecord], Any]] = None,
+        ):
+        """
+        Initialization function.
+
+        Arguments:
+        before -- Called with the record before each request.
+        after -- Called with the record after each request.
+        """
+        self._before = before
+        self._after = after
+
+    def BeforeRequest(self, record : RequestRecord):
+        if self._before != None:
+            self._before(record)
+
+    def AfterRequest(self, record : RequestRecord):
+        if self._after != None:
+            self._after(record)
+
+def _Buckets() -> tuple[float, ...]:
+    """
+    Method to get the upper bounds of the latency buckets, growing by a quarter each from 100 microseconds to past a minute.
+    """
+    bounds = []
+    bound = 0.0001
+    while bound < 60:
+        bounds.append(bound)
+        bound *= 1.25
+    bounds.append(bound)
+    return tuple(bounds)
+
+# Upper bounds, in seconds, of the buckets every LatencyHistogram uses.
+LATENCY_BUCKETS = _Buckets()
+
+class LatencyHistogram:
+    """
+    Counts of request latencies in fixed buckets, in the style of a Prometheus histogram.
+    Uses constant memory however many requests are recorded, and percentiles are estimated to within a bucket's width.
+    """
+    def __init__(self):
+        """
+        Initialization function.
+        """
+        # One count per bucket, and a last one for latencies beyond every bucket.
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def Add(self, seconds : float):
+        """
+        Record one latency.
+        """
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def Percentile(self, percentile : float) -> Optional[float]:
+        """
+        Get the estimated latency below which the given percentage of requests fall, such as 95 for p95.
+        Returns None when nothing was recorded.
+        """
+        if self.count == 0:
+            return None
+        rank = percentile / 100 * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count > 0 and seen + count >= rank:
+                if i == len(LATENCY_BUCKETS):
+                    return self.max
+                low = LATENCY_BUCKETS[i - 1] if i > 0 else 0.0
+                high = min(LATENCY_BUCKETS[i], self.max)
+                return low + (high - low) * max(rank - seen, 0) / count
+            seen += count
+        return self.max
+
+class _EndpointMetrics:
+    """
+    Everything a MetricsCollector counts for one method and endpoint.
+    """
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.requestBytes = 0
+        self.responseBytes = 0
+        self.serializeSeconds = 0.0
+        self.compressSeconds = 0.0
+        self.latency = LatencyHistogram()
+        self.statuses = {}
+
+class MetricsCollector(Instrument):
+    """
+    Instrument which collects, per method and endpoint, request counts, error counts, request and response bytes,
+    serialization and compression time, and a latency histogram with p50, p95 and p99.
+    Snapshot returns the current values, Export passes them to a sink such as a logger, and ToPrometheus formats them for scraping.
+    """
+    def __init__(self):
+        """
+        Initialization function.
+        """
+        self._metrics = {}
+        self._lock = Lock()
+
+    def AfterRequest(self, record : RequestRecord):
+        key = (record.method, record.endpoint)
+        with self._lock:
+            metrics = self._metrics.get(key)
+            if metrics == None:
+                metrics = self._metrics[key] = _EndpointMetrics()
+            metrics.requests += 1
+            if not record.ok:
+                metrics.errors += 1
+            metrics.requestBytes += record.requestBytes
+            metrics.responseBytes += record.responseBytes or 0
+            metrics.serializeSeconds += record.serializeSeconds
+            metrics.compressSeconds += record.compressSeconds
+            if record.seconds != None:
+                metrics.latency.Add(record.seconds)
+            status = record.status if record.status != None else type(record.error).__name__
+            metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+
+    def Reset(self):
+        """
+        Forget everything collected so far.
+        """
+        with self._lock:
+            self._metrics.clear()
+
+    def Snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Get the collected values, keyed by "METHOD endpoint", such as "POST object/bulk/". Latencies are in seconds.
+        """
+        result = {}
+        with self._lock:
+            for (method, endpoint), metrics in sorted(self._metrics.items()):
+                latency = metrics.latency
+                result[method + " " + endpoint] = {
+                    "requests" : metrics.requests,
+                    "errors" : metrics.errors,
+                    "requestBytes" : metrics.requestBytes,
+                    "responseBytes" : metrics.responseBytes,
+                    "serializeSeconds" : metrics.serializeSeconds,
+                    "compressSeconds" : metrics.compressSeconds,
+                    "latencyMean" : latency.sum / latency.count if latency.count > 0 else None,
+                    "latencyP50" : latency.Percentile(50),
+                    "latencyP95" : latency.Percentile(95),
+                    "latencyP99" : latency.Percentile(99),
+                    "latencyMax" : latency.max,
+                    "statuses" : dict(metrics.statuses),
+                }
+        return result
+
+    def Export(self, sink : Callable[[dict[str, dict[str, Any]]], Any]):
+        """
+        Pass a snapshot to a sink, such as a function which logs it or sends it to a metrics service.
+        """
+        sink(self.Snapshot())
+
+    def ToPrometheus(self, prefix : str = "cwruxr_client") -> str:
+        """
+        Get the collected values in the Prometheus text exposition format, with method and endpoint labels.
+        """
+        lines = []
+        with self._lock:
+            items = sorted(self._metrics.items())
+            for name, kind, help in (
+                    ("requests_total", "counter", "Requests sent."),
+                    ("errors_total", "counter", "Requests which failed or were answered with an error status."),
+                    ("request_bytes_total", "counter", "Bytes of request bodies sent."),
+                    ("response_bytes_total", "counter", "Bytes of response bodies received."),
+                    ("serialize_seconds_total", "counter", "Seconds spent serializing request bodies."),
+                    ("compress_seconds_total", "counter", "Seconds spent compressing request bodies."),
+                ):
+                lines.append("# HELP %s_%s %s" % (prefix, name, help))
+                lines.append("# TYPE %s_%s %s" % (prefix, name, kind))
+                attribute = {
+                    "requests_total" : "requests",
+                    "errors_total" : "errors",
+                    "request_bytes_total" : "requestBytes",
+                    "response_bytes_total" : "responseBytes",
+                    "serialize_seconds_total" : "serializeSeconds",
+                    "compress_seconds_total" : "compressSeconds",
+                }[name]
+                for (method, endpoint), metrics in items:
+                    lines.append('%s_%s{method="%s",endpoint="%s"} %s' % (prefix, name, method, endpoint, getattr(metrics, attribute)))
+
+            lines.append("# HELP %s_request_seconds Request latency." % prefix)
+            lines.append("# TYPE %s_request_seconds histogram" % prefix)
+            for (method, endpoint), metrics in items:
+                labels = 'method="%s",endpoint="%s"' % (method, endpoint)
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, metrics.latency.counts):
+                    cumulative += count
+                    lines.append('%s_request_seconds_bucket{%s,le="%.6g"} %d' % (prefix, labels, bound, cumulative))
+                lines.append('%s_request_seconds_bucket{%s,le="+Inf"} %d' % (prefix, labels, metrics.latency.count))
+                lines.append("%s_request_seconds_sum{%s} %s" % (prefix, labels, metrics.latency.sum))
+                lines.append("%s_request_seconds_count{%s} %d" % (prefix, labels, metrics.latency.count))
+        return "\n".join(lines) + "\n"
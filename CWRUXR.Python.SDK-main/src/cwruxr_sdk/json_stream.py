@@ -0,0 +1,62 @@
+from typing import Any, Iterable, Iterator
+import numpy as np
+import orjson as json
+
+_QUOTE = ord('"')
+_BACKSLASH = ord("\\")
+_COMMA = ord(",")
+
+def _ElementEnds(buffer : bytes) -> tuple[np.ndarray, int]:
+    """
+    Method to find where the elements of a json array end, given text which starts at the beginning of an element.
+    Returns the positions of the commas between elements, and the position of the closing bracket or -1 if it has not arrived yet.
+    Every character is classified at once with NumPy, so the scan stays fast however many elements a chunk holds.
+    """
+    data = np.frombuffer(buffer, dtype = np.uint8)
+    quotes = data == _QUOTE
+
+    # A quote is escaped when an odd number of backslashes comes right before it.
+    if buffer.find(b"\\") != -1:
+        index = np.arange(len(data))
+        lastOther = np.maximum.accumulate(np.where(data == _BACKSLASH, -1, index))
+        quotes[1:] &= (index[:-1] - lastOther[:-1]) % 2 == 0
+
+    outside = (np.cumsum(quotes) & 1) == 0
+    opens = (data == ord("{")) | (data == ord("["))
+    closes = (data == ord("}")) | (data == ord("]"))
+    depth = 1 + np.cumsum((opens.astype(np.int8) - closes) * outside)
+
+    ends = np.flatnonzero((data == _COMMA) & outside & (depth == 1))
+    closed = np.flatnonzero(depth == 0)
+    if len(closed) == 0:
+        return ends, -1
+    return ends[ends < closed[0]], int(closed[0])
+
+def IterJsonArray(chunks : Iterable[bytes]) -> Iterator[Any]:
+    """
+    Method to decode the elements of a json array one at a time from chunks of its text, such as a streamed response body.
+    Only the element being read is kept, so memory is bounded by the chunk size and the largest element.
+    """
+    buffer = b""
+    started = False
+    for chunk in chunks:
+        buffer += chunk
+        if not started:
+            buffer = buffer.lstrip()
+            if len(buffer) == 0:
+                continue
+            if buffer[:1] != b"[":
+                raise ValueError("Expected a json array.")
+            buffer = buffer[1:]
+            started = True
+
+        # Every element which is complete is decoded by one call, as a json array of its own.
+        ends, closed = _ElementEnds(buffer)
+        if closed != -1:
+            yield from json.loads(b"[" + buffer[:closed] + b"]")
+            return
+        if len(ends) > 0:
+            yield from json.loads(b"[" + buffer[:ends[-1]] + b"]")
+            buffer = buffer[ends[-1] + 1:]
+
+    raise ValueError("The json array ended before its closing bracket.")
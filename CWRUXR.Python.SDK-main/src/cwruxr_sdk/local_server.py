@@ -0,0 +1,330 @@
+import random
+import sys
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Any, Optional
+from urllib.parse import unquote, urlsplit
+import orjson
+from cwruxr_sdk import endpoints
+from cwruxr_sdk.binary_pose import CONTENT_TYPE as POSE_CONTENT_TYPE, DecodePoses
+from cwruxr_sdk.compression import GZIP, ZSTD, Available, Compress, Decompress
+
+# The path the server's Api is served under, as in the endpoint given to Client.
+API_PREFIX = "/api/v2/"
+
+def _Merge(stored : dict, update : dict) -> dict:
+    """
+    Method to apply a posted message to the stored one, in the style of a JSON merge patch.
+    Partial messages, such as those from delta.Diff or Palette.Recolor, only change the fields they hold.
+    """
+    result = dict(stored)
+    for key, value in update.items():
+        if isinstance(value, dict) and isinstance(result.get(key), dict):
+            result[key] = _Merge(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+class _Room:
+    """
+    Everything stored for one RoomId.
+    """
+    def __init__(self):
+        self.anchors = {}
+        self.materials = {}
+        # AnchorId to the objects under that anchor, by id.
+        self.objects = {}
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 resets connections when many pooled clients connect at once.
+    request_queue_size = 128
+
+    def handle_error(self, request, client_address):
+        """
+        Ignore clients closing kept alive connections, which is how pooled connections end.
+        """
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+class LocalServer:
+    """
+    In-memory stand-in for a CWRUXR instance, serving the v2 anchor, object and material endpoints on localhost from a background thread.
+    Rooms and anchors are kept apart by the RoomId and AnchorId headers, as the real Api does.
+    Latency, jitter, random errors and a body size limit can be set to reproduce network conditions offline.
+    Bulk object posts may also be sent in the binary layout of binary_pose, with its CONTENT_TYPE.
+
+    with LocalServer(latency = .005) as server:
+        client = Client(server.endpoint, "room", "anchor")
+    """
+    def __init__(
+            self,
+            latency : float = 0.0,
+            jitter : float = 0.0,
+            errorRate : float = 0.0,
+            maxBodyBytes : Optional[int] = None,
+            bandwidth : Optional[float] = None,
+            compressAbove : Optional[int] = None,
+            seed : Optional[int] = None,
+            host : str = "127.0.0.1",
+            port : int = 0,
+        ):
+        """
+        Initialization function.
+
+        Arguments:
+        latency -- The number of seconds each request waits before it is answered.
+        jitter -- A random number of seconds, up to this, added to the latency of each request.
+        errorRate -- The fraction of requests answered with 503 instead of being handled.
+        maxBodyBytes -- Requests with larger bodies, as sent, are answered with 413. None allows any size.
+        bandwidth -- The bytes per second each request's body and response travel at, as on a slow network. None is unlimited.
+        compressAbove -- Responses of at least this many bytes are compressed with a codec the request's Accept-Encoding lists.
+            None never compresses. Compressed request bodies are always accepted.
+        seed -- Seed for the jitter and errors, so runs can be repeated.
+        host -- The address to listen on.
+        port -- The port to listen on. 0 picks a free port.
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.errorRate = errorRate
+        self.maxBodyBytes = maxBodyBytes
+        self.bandwidth = bandwidth
+        self.compressAbove = compressAbove
+        self._host = host
+        self._port = port
+        self._random = random.Random(seed)
+        self._rooms = {}
+        self._lock = Lock()
+        self._server = None
+        self._thread = None
+
+        self.requests = 0
+        self.bytesReceived = 0
+        self.bytesSent = 0
+
+    @property
+    def endpoint(self) -> str:
+        """
+        The endpoint to give to Client while the server is running.
+        """
+        host, port = self._server.server_address[:2]
+        return "http://" + host + ":" + str(port) + API_PREFIX
+
+    def Start(self):
+        """
+        Start serving on a background thread.
+        """
+        if self._server != None:
+            return self
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _Serve(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length) if length > 0 else b""
+                status, content, headers = server.Handle(self.command, self.path, self.headers, body)
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = _Serve
+            do_POST = _Serve
+            do_DELETE = _Serve
+
+            def log_message(self, *args):
+                pass
+
+        self._server = _HTTPServer((self._host, self._port), Handler)
+        self._thread = Thread(target = self._server.serve_forever, name = "cwruxr-local-server", daemon = True)
+        self._thread.start()
+        return self
+
+    def Stop(self):
+        """
+        Stop serving. The stored rooms are kept.
+        """
+        if self._server == None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        return self.Start()
+
+    def __exit__(self, *args):
+        self.Stop()
+
+    def Reset(self):
+        """
+        Forget every room, and zero the counters.
+        """
+        with self._lock:
+            self._rooms.clear()
+            self.requests = 0
+            self.bytesReceived = 0
+            self.bytesSent = 0
+
+    def Room(
+            self,
+            roomId : str,
+        ) -> _Room:
+        """
+        Get what is stored for a room, creating it if needed. Useful for checking results in tests.
+        """
+        with self._lock:
+            return self._rooms.setdefault(roomId, _Room())
+
+    def Handle(
+            self,
+            method : str,
+            path : str,
+            headers,
+            body : bytes = b"",
+        ) -> tuple[int, bytes, dict[str, str]]:
+        """
+        Answer one request, without any networking.
+        Returns the status code, the response body, and the response headers.
+        The body is compressed when the response headers have a Content-Encoding.
+
+        Arguments:
+        method -- GET, POST or DELETE.
+        path -- The path of the request url, or the whole url.
+        headers -- The request headers, as a mapping.
+        body -- The request body.
+        """
+        delay = self.latency + (self._random.random() * self.jitter if self.jitter > 0 else 0)
+        if delay > 0:
+            time.sleep(delay)
+        with self._lock:
+            self.requests += 1
+            self.bytesReceived += len(body)
+            failed = self.errorRate > 0 and self._random.random() < self.errorRate
+        if failed:
+            return 503, b"", {}
+        if self.maxBodyBytes != None and len(body) > self.maxBodyBytes:
+            return 413, b"", {}
+        sent = len(body)
+        encoding = headers.get("Content-Encoding")
+        if encoding:
+            if encoding not in (GZIP, ZSTD) or not Available(encoding):
+                return 415, b"", {}
+            try:
+                body = Decompress(body, encoding)
+            except Exception:
+                return 400, b"", {}
+
+        path = urlsplit(path).path
+        if path.startswith(API_PREFIX):
+            path = path[len(API_PREFIX):]
+        else:
+            path = path.lstrip("/")
+        roomId = headers.get("RoomId")
+        if not roomId:
+            return 400, b"", {}
+        anchorId = headers.get("AnchorId") or ""
+
+        try:
+            if len(body) == 0:
+                data = None
+            elif (headers.get("Content-Type") or "").split(";")[0].strip() == POSE_CONTENT_TYPE:
+                data = DecodePoses(body)
+            else:
+                data = orjson.loads(body)
+        except ValueError:
+            return 400, b"", {}
+
+        with self._lock:
+            room = self._rooms.setdefault(roomId, _Room())
+            try:
+                result = self._Route(method, path, room, anchorId, data)
+            except ValueError:
+                return 400, b"", {}
+            if result == None:
+                return 404, b"", {}
+            content = orjson.dumps(result)
+
+        # Single items carry an ETag, so CachingClient can revalidate them.
+        responseHeaders = {"Content-Type" : "application/json"}
+        if method == "GET" and isinstance(result, dict):
+            etag = '"' + format(zlib.crc32(content), "08x") + '"'
+            responseHeaders["ETag"] = etag
+            if headers.get("If-None-Match") == etag:
+                return 304, b"", responseHeaders
+        if self.compressAbove != None and len(content) >= self.compressAbove:
+            accepted = [codec.strip() for codec in (headers.get("Accept-Encoding") or "").split(",")]
+            for codec in accepted:
+                if codec in (ZSTD, GZIP) and Available(codec):
+                    content = Compress(content, codec)
+                    responseHeaders["Content-Encoding"] = codec
+                    break
+        with self._lock:
+            self.bytesSent += len(content)
+        if self.bandwidth != None:
+            time.sleep((sent + len(content)) / self.bandwidth)
+        return 200, content, responseHeaders
+
+    def _Route(self, method : str, path : str, room : _Room, anchorId : str, data) -> Any:
+        """
+        Method to run a request against a room. Returns the json result, or None when the path or item does not exist.
+        Raises a ValueError when the body is not a message, or a list of them, as the request expects.
+        """
+        objects = room.objects.setdefault(anchorId, {})
+        for prefix, items, bulk in (
+                (endpoints.OBJECT_BULK_ENDPOINT, objects, True),
+                (endpoints.MATERIAL_BULK_ENDPOINT, room.materials, True),
+                (endpoints.OBJECT_ENDPOINT, objects, False),
+                (endpoints.MATERIAL_ENDPOINT, room.materials, False),
+                (endpoints.ANCHOR_ENDPOINT, room.anchors, False),
+            ):
+            if path == prefix.rstrip("/") or path.startswith(prefix):
+                id = unquote(path[len(prefix):].strip("/")) if path.startswith(prefix) else ""
+                break
+        else:
+            return None
+
+        if method == "POST":
+            messages = data if bulk else [data]
+            if not isinstance(messages, list):
+                raise ValueError("A bulk body must be a list of messages.")
+            # The whole batch is checked before any of it is stored, so a bad item leaves the room unchanged.
+            for message in messages:
+                if not isinstance(message, dict) or not isinstance(message.get("id"), str):
+                    raise ValueError("Each message must be an object with an id.")
+            for message in messages:
+                stored = items.get(message["id"])
+                items[message["id"]] = message if stored == None else _Merge(stored, message)
+            return {} if bulk else items[data["id"]]
+
+        if method == "GET" and not bulk:
+            if id == "":
+                return list(items.values())
+            return items.get(id)
+
+        if method == "DELETE":
+            if bulk:
+                if data != None and (not isinstance(data, list) or not all(isinstance(deleted, str) for deleted in data)):
+                    raise ValueError("A bulk delete body must be a list of ids.")
+                for deleted in data or ():
+                    items.pop(deleted, None)
+            elif id == "":
+                items.clear()
+                if items is room.anchors:
+                    room.objects.clear()
+            else:
+                if items.pop(id, None) == None:
+                    return None
+                if items is room.anchors:
+                    room.objects.pop(id, None)
+            return {}
+        return None
@@ -0,0 +1,156 @@
+import hashlib
+from typing import Any, Iterable, Union
+import orjson
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import ToJson, FromJson
+from cwruxr_sdk.material_message import MaterialMessage
+from cwruxr_sdk.object_message import ObjectMessage
+
+def _Canonical(value) -> Any:
+    """
+    Method to normalize decoded json so equal content serializes the same way, such as 1.0 and 1 from different senders.
+    """
+    if isinstance(value, dict):
+        return {key : _Canonical(item) for key, item in value.items() if item is not None}
+    if isinstance(value, list):
+        return [_Canonical(item) for item in value]
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+def ContentKey(material : Union[MaterialMessage, dict[str, Any]]) -> bytes:
+    """
+    Method to get a hash of everything a material renders with, which is its json without the id, with sorted keys.
+    Materials with the same key look the same, whatever their ids are.
+    """
+    data = FromJson(ToJson(material))
+    data.pop("id", None)
+    return hashlib.blake2b(orjson.dumps(_Canonical(data), option = orjson.OPT_SORT_KEYS), digest_size = 16).digest()
+
+class MaterialInterner:
+    """
+    Merges materials which differ only by id into one material, so each distinct look is posted and stored once.
+    Intern every material, then Rewrite the objects which reference them, and Flush to post only the materials the room does not hold yet.
+    The first id seen for some content is the one kept, and later ids with the same content are aliases of it.
+    """
+    def __init__(self):
+        """
+        Initialization function.
+        """
+        # Content key to the id kept for that content.
+        self._ids = {}
+        # Every interned id to the id kept for its content.
+        self._aliases = {}
+        # Content key of every id which is kept.
+        self._keys = {}
+        # Kept materials which are not in the room yet, by id.
+        self._pending = {}
+
+        self.merged = 0
+
+    def Intern(
+            self,
+            material : Union[MaterialMessage, dict[str, Any]],
+        ) -> str:
+        """
+        Add a material, and get the id to use for it, which is the id of an earlier material with the same content if there is one.
+        An id may be interned again with new content, unless other materials were merged into it, as that would change them too.
+        Raises a ValueError then, so give changed materials a new id.
+        """
+        id = material["id"] if isinstance(material, dict) else material.id
+        key = ContentKey(material)
+        kept = self._ids.get(key)
+        if kept != None:
+            if kept != id:
+                self.merged += 1
+            self._aliases[id] = kept
+            return kept
+
+        # The id is reused for new content, so its old content no longer has a material to merge into.
+        previous = self._keys.get(id)
+        if previous != None:
+            if any(kept == id and alias != id for alias, kept in self._aliases.items()):
+                raise ValueError("Material " + id + " has new content, but other materials were merged into it.")
+            del self._keys[id]
+            del self._ids[previous]
+        self._ids[key] = id
+        self._keys[id] = key
+        self._aliases[id] = id
+        self._pending[id] = material
+        return id
+
+    def InternMany(
+            self,
+            materials : Iterable[Union[MaterialMessage, dict[str, Any]]],
+        ) -> list[str]:
+        """
+        Intern every material, and get the id to use for each.
+        """
+        return [self.Intern(material) for material in materials]
+
+    def Resolve(
+            self,
+            id : str,
+        ) -> str:
+        """
+        Get the id to reference instead of the given material id. Ids which were not interned are returned as is.
+        """
+        return self._aliases.get(id, id)
+
+    def Rewrite(
+            self,
+            messages : Iterable[Union[ObjectMessage, dict[str, Any]]],
+        ) -> list[Union[ObjectMessage, dict[str, Any]]]:
+        """
+        Point the materialID of each object message at the id kept for its material. The messages are changed in place.
+        Returns the messages as a list, ready for PostObjectBulk.
+        """
+        aliases = self._aliases
+        result = []
+        for message in messages:
+            if isinstance(message, dict):
+                materialID = message.get("materialID")
+                if materialID in aliases:
+                    message["materialID"] = aliases[materialID]
+            else:
+                materialID = getattr(message, "materialID", None)
+                if materialID in aliases:
+                    message.materialID = aliases[materialID]
+            result.append(message)
+        return result
+
+    def Load(
+            self,
+            client : Client,
+        ):
+        """
+        Intern every material already in the client's room, so materials with the same content reuse them instead of being posted.
+        """
+        for data in client.GetAllMaterials():
+            self.Intern(data)
+            self._pending.pop(data["id"], None)
+
+    def Pending(self) -> list[Union[MaterialMessage, dict[str, Any]]]:
+        """
+        Get the materials which the next Flush will post.
+        """
+        return list(self._pending.values())
+
+    def Flush(
+            self,
+            client : Client,
+        ) -> list[str]:
+        """
+        Post the materials the room does not hold yet with one PostMaterialBulk call.
+        If the request fails, the materials stay pending so the next Flush retries them.
+        Returns the ids that were posted.
+        """
+        if len(self._pending) == 0:
+            return []
+        client.PostMaterialBulk(list(self._pending.values()))
+        ids = list(self._pending)
+        self._pending.clear()
+        return ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
@@ -2,12 +2,15 @@ import string
 from turtle import color
 from typing import Optional
 
-from cwruxr_sdk.common import Color, Vector2
+from cwruxr_sdk.common import Color, Vector2, RegisterEncoder, EncodeWithoutNone, DecodeFields
 
 class Parameters:
     """
     Parent class for all parameter types.
     """
+    # The entries which hold nested objects, and how to decode each. Subclasses with nested objects override this.
+    _FIELDS = ()
+
     @classmethod
     def FromDict(cls, data: dict):
         """
@@ -15,11 +18,7 @@ class Parameters:
         """
         if data == None:
             return cls()
-            
-        val = cls()
-        for key in data.keys():
-            setattr(val, key, data[key])
-        return val
+        return DecodeFields(cls, data, cls._FIELDS)
 
 # Blending option cooresponding to Unity's Zero mode.
 BLEND_ZERO = "Zero"
@@ -150,28 +149,40 @@ class MaterialMessage:
 
         self.parameters = parameters
     
+    # Materials decoded from dictionaries may leave these out, so they default to None here.
+    renderSettings = None
+    parameters = None
+
     @classmethod
     def FromDict(cls, data : dict):
         """
         Method to return a Material Message from a dictionary.
+        Returns the class registered for its shader, such as an UnlitMaterialMessage with UnlitParameters.
         """
-        val = cls(
-                id = data.get("id"),
-                shader = data.get("shader"),
-                color = Color.FromDict(data.get("color"))
-            )
-        
-        if data.get("renderSettings") != None:
-            val.renderSettings = MaterialRenderSettings.FromDict(data["renderSettings"])
-
-        if data.get("parameters") != None:
-            if val.shader.casefold() == "MrtkStandard".casefold():
-                val.parameters = MRTKStandardParameters.FromDict(data["parameters"])
-            elif val.shader.casefold() == "Unlit".casefold():
-                val.parameters = UnlitParameters.FromDict(data["parameters"])
-            else:
-                val.parameters = Parameters.FromDict(data["parameters"])
-        return val
+        messageClass, fields = _Shader(data.get("shader"))
+        if not issubclass(messageClass, cls):
+            messageClass = cls
+        return DecodeFields(messageClass, data, fields)
+
+    @classmethod
+    def FromDictList(cls, data : list[dict]) -> list:
+        """
+        Method to get material messages out of a list of dictionaries, such as the result of GetAllMaterials.
+        """
+        # The class and field table are looked up once per shader rather than once per material.
+        entries = {}
+        result = []
+        for d in data:
+            shader = d.get("shader")
+            entry = entries.get(shader)
+            if entry == None:
+                messageClass, fields = _Shader(shader)
+                entry = entries[shader] = (messageClass if issubclass(messageClass, cls) else cls, fields)
+            result.append(DecodeFields(entry[0], d, entry[1]))
+        return result
+
+# Material messages always hold renderSettings and parameters, so leave them out of the json when they are None.
+RegisterEncoder(MaterialMessage, EncodeWithoutNone)
 
 class TextureReference():
     """
@@ -222,6 +233,8 @@ class UnlitParameters(Parameters):
     """
     Extension to Parameters which supports the Unlit shader.
     """
+    _FIELDS = (("texture", TextureReference.FromDict),)
+
     def __init__(
         self,
         alphaTest : Optional[bool] = None,
@@ -243,23 +256,21 @@ class UnlitParameters(Parameters):
         if texture != None:
             self.texture = texture
 
-    @classmethod
-    def FromDict(cls, data: dict):
-        """
-        Method to return unlit parameters from a dictionary.
-        """
-        if data == None:
-            return cls()
-        val = cls()
-        val.alphaTest = data.get("alphaTest")
-        val.alphaCutoff = data.get("alphaCutoff")
-        val.texture = TextureReference.FromDict(data.get("texture"))
-        return val
-
 class MRTKStandardParameters(Parameters):
     """
     Extension to Parameters which supports the MRTK shader.
     """
+    # The numbers and flag are coerced, as the Api may send whole numbers as ints and flags as 0 or 1.
+    _FIELDS = (
+        ("metallic", float),
+        ("smoothness", float),
+        ("emissiveColor", Color.FromDict),
+        ("rimLightPower", float),
+        ("rimLightColor", Color.FromDict),
+        ("texture", TextureReference.FromDict),
+        ("triplanar", bool),
+    )
+
     def __init__(
         self,
         metallic : Optional[float] = None,
@@ -297,23 +308,6 @@ class MRTKStandardParameters(Parameters):
         if triplanar != None:
             self.triplanar = triplanar
     
-    @classmethod
-    def FromDict(cls, data: dict):
-        """
-        Method to return an MRTKStandardParameters from a dictionary.
-        """
-        if data == None:
-            return cls()
-        val = cls()
-        val.metallic = float(data.get("metallic"))
-        val.smoothness = float(data.get("smoothness"))
-        val.rimLightPower = float(data.get("rimLightPower"))
-        val.emissiveColor = Color.FromDict(data.get("emissiveColor"))
-        val.rimLightColor = Color.FromDict(data.get("rimLightColor"))
-        val.texture = TextureReference.FromDict(data.get("texture"))
-        val.triplanar = bool(data.get("triplanar"))
-        return val
-
 class SkyboxParameters(Parameters):
     """
     Extension to parameters to handle skybox materials.
@@ -417,4 +411,49 @@ class SkyboxMaterialMessage(MaterialMessage):
             color,
             render_settings,
             parameters,
-            )
\ No newline at end of file
+            )
+
+def _MaterialFields(parametersClass : type) -> tuple:
+    """
+    Method to build the field table of a material message, given the class of its parameters.
+    """
+    return (
+        ("color", Color.FromDict),
+        ("renderSettings", MaterialRenderSettings.FromDict),
+        ("parameters", parametersClass.FromDict),
+    )
+
+# The message class and field table for each shader, keyed by the shader field and by its casefolded form.
+_SHADERS = {}
+
+# The message class and field table for materials whose shader is not registered.
+_UNKNOWN_SHADER = (MaterialMessage, _MaterialFields(Parameters))
+
+def RegisterShader(shader : str, messageClass : type, parametersClass : type = Parameters):
+    """
+    Method to set which classes FromDict decodes materials with a shader into.
+    Shaders are matched without regard to case.
+
+    Arguments:
+    shader -- The shader field of the materials, such as "Unlit".
+    messageClass -- The MaterialMessage subclass to decode the materials into.
+    parametersClass -- The Parameters subclass to decode the parameters of the materials into.
+    """
+    entry = (messageClass, _MaterialFields(parametersClass))
+    _SHADERS[shader] = entry
+    _SHADERS[shader.casefold()] = entry
+
+def _Shader(shader : Optional[str]) -> tuple:
+    """
+    Method to get the message class and field table for a shader.
+    """
+    entry = _SHADERS.get(shader)
+    if entry == None and isinstance(shader, str):
+        entry = _SHADERS.get(shader.casefold())
+    if entry == None:
+        return _UNKNOWN_SHADER
+    return entry
+
+RegisterShader("Unlit", UnlitMaterialMessage, UnlitParameters)
+RegisterShader("MrtkStandard", MRTKMaterialMessage, MRTKStandardParameters)
+RegisterShader("Skybox", SkyboxMaterialMessage, SkyboxParameters)
@@ -0,0 +1,207 @@
+from typing import Optional
+import numpy as np
+import orjson as json
+
+# Numbers must be smaller than 10 ** _INTEGER_DIGITS to be written by a batch.
+_INTEGER_DIGITS = 4
+
+# The string fields a batch can hold, in the order they are written.
+_STRING_FIELDS = ("id", "type", "source", "materialID", "parentID")
+
+# The vectors written after the string fields of a row, as the text in front of each, its attribute, and its components.
+# Every component key is 5 characters wide, so the numbers of a vector sit at a fixed stride in the row.
+_VECTORS = (
+    (b'"pose":{"position":{', "position", (b' "x":', b',"y":', b',"z":')),
+    (b'},"rotation":{', "rotation", (b' "x":', b',"y":', b',"z":', b',"w":')),
+    (b'},"scale":{', "scale", (b' "x":', b',"y":', b',"z":')),
+)
+_KEY_WIDTH = 5
+_ROW_END = b'}}},'
+
+def _Column(value, count : int) -> np.ndarray:
+    """
+    Method to turn a single value or a sequence into an object array with one entry per row.
+    """
+    column = np.empty(count, dtype = object)
+    if value is None or isinstance(value, str):
+        column[:] = value
+    else:
+        column[:] = list(value)
+    return column
+
+def _Rows(value, default, width : int, count : int) -> np.ndarray:
+    """
+    Method to turn a single row or a sequence of rows into a float array of shape (count, width).
+    """
+    if value is None:
+        value = default
+    return np.array(np.broadcast_to(np.asarray(value, dtype = np.float64), (count, width)))
+
+def _NumberWidth(decimals : int) -> int:
+    """
+    Method to get the number of characters used to write each number.
+    """
+    return 1 + _INTEGER_DIGITS + (1 + decimals if decimals > 0 else 0)
+
+def _TextTable(texts : list[bytes], width : int) -> np.ndarray:
+    """
+    Method to pack equal length texts into a (len(texts), width) array of characters.
+    """
+    return np.frombuffer(b"".join(texts), dtype = np.uint8).reshape(len(texts), width)
+
+# The sign and integer part of every whole number below 10 ** _INTEGER_DIGITS, right aligned.
+# Positive numbers come first, then negative numbers, so -0.5 is written from the "-0" entry.
+_INTEGER_TEXT = _TextTable(
+    [(sign + str(i)).rjust(_INTEGER_DIGITS + 1).encode() for sign in ("", "-") for i in range(10 ** _INTEGER_DIGITS)],
+    _INTEGER_DIGITS + 1
+)
+
+# The text of every number from 0000 to 9999, used to write the decimals four digits at a time.
+_CHUNK_DIGITS = 4
+_CHUNK_TEXT = _TextTable([b"%04d" % i for i in range(10 ** _CHUNK_DIGITS)], _CHUNK_DIGITS)
+
+def _WriteNumbers(target : np.ndarray, values : np.ndarray, decimals : int):
+    """
+    Method to write an (n, k) array of numbers as fixed width json text into an (n, k, width) array of characters.
+    Numbers are right aligned, with leading spaces in front of the sign and the first digit.
+    """
+    if not np.all(np.isfinite(values)):
+        raise ValueError("ObjectBatch values must be finite.")
+    scaled = np.rint(np.abs(values) * 10.0 ** decimals).astype(np.int64)
+    integer, fraction = np.divmod(scaled, 10 ** decimals)
+    if np.any(integer >= 10 ** _INTEGER_DIGITS):
+        raise ValueError("ObjectBatch values must be smaller than 1e" + str(_INTEGER_DIGITS) + ".")
+
+    # A value which rounds to zero is written without a sign.
+    integer[(values < 0) & (scaled > 0)] += 10 ** _INTEGER_DIGITS
+    target[..., :_INTEGER_DIGITS + 1] = _INTEGER_TEXT[integer]
+    if decimals == 0:
+        return
+
+    target[..., _INTEGER_DIGITS + 1] = ord(".")
+    end = target.shape[-1]
+    for start in range(end - _CHUNK_DIGITS, _INTEGER_DIGITS + 2 - _CHUNK_DIGITS, -_CHUNK_DIGITS):
+        fraction, chunk = np.divmod(fraction, 10 ** _CHUNK_DIGITS)
+        text = _CHUNK_TEXT[chunk]
+        if start < _INTEGER_DIGITS + 2:
+            text = text[..., _INTEGER_DIGITS + 2 - start:]
+            start = _INTEGER_DIGITS + 2
+        target[..., start : end] = text
+        end = start
+
+class ObjectBatch:
+    """
+    A batch of objects stored as NumPy arrays with one row per object, for posting thousands of objects at once.
+    Arrays can be updated in place between posts, for example batch.position[mask] += offset.
+    ToJson writes the PostObjectBulk payload directly from the arrays without creating an ObjectMessage per row.
+    """
+    def __init__(
+            self,
+            ids,
+            type : Optional[str] = "Primitive",
+            source = None,
+            materialID = None,
+            parentID = None,
+            position = None,
+            rotation = None,
+            scale = None,
+            decimals : int = 4,
+        ):
+        """
+        Initialization function.
+
+        Arguments:
+        ids -- The names of the objects.
+        type -- The type of every object, or a sequence with one type per object.
+        source -- The source of every object, or a sequence with one source per object. None leaves it out.
+        materialID -- The material of every object, or a sequence with one material per object. None leaves it out.
+        parentID -- The parent of every object, or a sequence with one parent per object. None leaves it out.
+        position -- An (n, 3) array of positions, or one position for every object. Defaults to the origin.
+        rotation -- An (n, 4) array of x, y, z, w quaternions, or one rotation for every object. Defaults to no rotation.
+        scale -- An (n, 3) array of scales, or one scale for every object. Defaults to 1.
+        decimals -- The number of decimal places to send for each number. 4 keeps positions to a tenth of a millimeter.
+        """
+        self.id = _Column(ids, len(ids))
+        count = len(self.id)
+        self.type = _Column(type, count)
+        self.source = _Column(source, count)
+        self.materialID = _Column(materialID, count)
+        self.parentID = _Column(parentID, count)
+        self.position = _Rows(position, (0, 0, 0), 3, count)
+        self.rotation = _Rows(rotation, (0, 0, 0, 1), 4, count)
+        self.scale = _Rows(scale, (1, 1, 1), 3, count)
+        self.decimals = decimals
+        self._prefixSource = None
+        self._prefix = None
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def _Prefixes(self) -> np.ndarray:
+        """
+        Method to get the start of every row, holding its string fields, padded with spaces to one width.
+        The result is cached until one of the string columns changes, in place or by being replaced.
+        """
+        columns = []
+        for name in _STRING_FIELDS:
+            column = getattr(self, name)
+            # A column replaced by a single value or a list is turned back into an array, as in the initialization function.
+            if not isinstance(column, np.ndarray):
+                column = _Column(column, len(self))
+                setattr(self, name, column)
+            columns.append(column)
+        if self._prefixSource != None and all(
+                np.array_equal(old, new) for old, new in zip(self._prefixSource, columns)):
+            return self._prefix
+
+        rows = []
+        for values in zip(*columns):
+            row = b"{"
+            for name, value in zip(_STRING_FIELDS, values):
+                if value != None:
+                    row += b'"' + name.encode() + b'":' + json.dumps(value) + b","
+            rows.append(row)
+        width = max((len(row) for row in rows), default = 0)
+        prefix = np.full((len(rows), width), ord(" "), dtype = np.uint8)
+        for i, row in enumerate(rows):
+            prefix[i, :len(row)] = np.frombuffer(row, dtype = np.uint8)
+
+        self._prefixSource = [column.copy() for column in columns]
+        self._prefix = prefix
+        return prefix
+
+    def ToJson(
+            self,
+        ) -> bytes:
+        """
+        Method to get the PostObjectBulk payload for the batch as json.
+        Numbers are written with a fixed number of decimal places, and rows are padded with spaces to a fixed width.
+        """
+        count = len(self)
+        if count == 0:
+            return b"[]"
+        prefix = self._Prefixes()
+        numberWidth = _NumberWidth(self.decimals)
+        rowWidth = prefix.shape[1] + len(_ROW_END)
+        for header, name, keys in _VECTORS:
+            rowWidth += len(header) + len(keys) * (_KEY_WIDTH + numberWidth)
+
+        # One buffer holds the brackets around the rows, so the payload is copied out once.
+        buffer = np.empty(count * rowWidth + 1, dtype = np.uint8)
+        buffer[0] = ord("[")
+        rows = buffer[1:].reshape(count, rowWidth)
+        rows[:, :prefix.shape[1]] = prefix
+        start = prefix.shape[1]
+        for header, name, keys in _VECTORS:
+            rows[:, start : start + len(header)] = np.frombuffer(header, dtype = np.uint8)
+            start += len(header)
+            end = start + len(keys) * (_KEY_WIDTH + numberWidth)
+            block = rows[:, start : end].reshape(count, len(keys), _KEY_WIDTH + numberWidth)
+            block[:, :, :_KEY_WIDTH] = np.frombuffer(b"".join(keys), dtype = np.uint8).reshape(len(keys), _KEY_WIDTH)
+            _WriteNumbers(block[:, :, _KEY_WIDTH:], getattr(self, name), self.decimals)
+            start = end
+        rows[:, start:] = np.frombuffer(_ROW_END, dtype = np.uint8)
+
+        # The comma after the last row becomes the closing bracket.
+        rows[-1, -1] = ord("]")
+        return buffer.tobytes()
@@ -1,11 +1,14 @@
 from optparse import Option
 from typing import Optional, Union
-from cwruxr_sdk.common import Color, Pose
+from cwruxr_sdk.common import Color, Pose, RegisterEncoder, EncodeWithoutNone, DecodeFields
 
 class Parameters:
     """
     Parent class for all object parameter classes.
     """
+    # The entries which hold nested objects, and how to decode each. Subclasses with nested objects override this.
+    _FIELDS = ()
+
     @classmethod
     def FromDict(cls, data: dict):
         """
@@ -13,15 +16,15 @@ class Parameters:
         """
         if data == None:
             return cls()
-        val = cls()
-        for key in data.keys():
-            setattr(val, key, data[key])
-        return val
+        return DecodeFields(cls, data, cls._FIELDS)
 
 class Interpolation:
     """
     Class which defines how to interpolate the pose of an object.
     """
+    # The settings FromDict fills in when a dictionary leaves them out, the same as the initialization function's defaults.
+    _DEFAULTS = {"on" : True, "moveSpeed" : 15, "rotateSpeed" : 10, "scaleSpeed" : 15}
+
     def __init__(
             self,
             on : Optional[bool] = True,
@@ -51,13 +54,13 @@ class Interpolation:
     def FromDict(cls, data: dict):
         """
         Method to get interpolation settings from a dictionary.
+        Settings the dictionary leaves out, or holds as None, take their default values.
         """
         if data == None:
             return cls()
-
-        val = cls()
-        for key in data.keys():
-            setattr(val, key, data[key])
+        val = DecodeFields(cls, data)
+        if not cls._DEFAULTS.keys() <= val.__dict__.keys():
+            val.__dict__ = {**cls._DEFAULTS, **val.__dict__}
         return val
 
 
@@ -122,34 +125,38 @@ class ObjectMessage:
     def FromDict(cls, data : dict):
         """
         Method to get an object message out of a dictionary.
+        Returns the class registered for its type, such as a PrimitiveMessage or a TextMessage with TextParameters.
         """
         if data == None:
             return cls()
-            
-        val = cls(
-                data.get("id"),
-                data.get("anchorID"),
-                data.get("parentID"),
-                data.get("type"),
-                data.get("source"),
-                data.get("active"),
-                data.get("materialID"),
-                Pose.FromDict(data.get("pose")),
-                data.get("isManipulationOn"),
-                data.get("walkable"),
-                Interpolation.FromDict(data.get("interpolation")),
-            )
-        if data.get("isManipulating") != None:
-            val.isManipulating = data["isManipulating"]
-        if data.get("parameters") != None:
-            val.parameters = Parameters.FromDict(data["parameters"])
+        messageClass, fields = _ObjectType(data.get("type"))
+        if not issubclass(messageClass, cls):
+            messageClass = cls
+        return DecodeFields(messageClass, data, fields)
 
-        return val
+    @classmethod
+    def FromDictList(cls, data : list[dict]) -> list:
+        """
+        Method to get object messages out of a list of dictionaries, such as the result of GetAllObjects.
+        """
+        # The class and field table are looked up once per type rather than once per object.
+        entries = {}
+        result = []
+        for d in data:
+            objectType = d.get("type")
+            entry = entries.get(objectType)
+            if entry == None:
+                messageClass, fields = _ObjectType(objectType)
+                entry = entries[objectType] = (messageClass if issubclass(messageClass, cls) else cls, fields)
+            result.append(DecodeFields(entry[0], d, entry[1]))
+        return result
 
 class TextParameters(Parameters):
     """
     An extension to Parameters to use with Text object types.
     """
+    _FIELDS = (("color", Color.FromDict),)
+
     def __init__(
             self,
             text : Optional[str] = None,
@@ -201,6 +208,8 @@ class LineParameters(Parameters):
         self.endId = endId
         self.width = width
 
+RegisterEncoder(LineParameters, EncodeWithoutNone)
+
 class ImageParameters(Parameters):
     """
     A parameter class to be used for Image object types.
@@ -502,4 +511,53 @@ class ImageMessage(ObjectMessage):
                 interpolation = interpolation,
             )
         if params != None:
-            self.parameters = params
\ No newline at end of file
+            self.parameters = params
+
+
+def _ObjectFields(parametersClass : type) -> tuple:
+    """
+    Method to build the field table of an object message, given the class of its parameters.
+    """
+    return (
+        ("pose", Pose.FromDict),
+        ("interpolation", Interpolation.FromDict),
+        ("parameters", parametersClass.FromDict),
+    )
+
+# The message class and field table for each object type, keyed by the type field and by its casefolded form.
+_OBJECT_TYPES = {}
+
+# The message class and field table for objects whose type is not registered.
+_UNKNOWN_TYPE = (ObjectMessage, _ObjectFields(Parameters))
+
+def RegisterObjectType(type : str, messageClass : type, parametersClass : type = Parameters):
+    """
+    Method to set which classes FromDict decodes objects of a type into.
+
+    Arguments:
+    type -- The type field of the objects, such as "Primitive".
+    messageClass -- The ObjectMessage subclass to decode the objects into.
+    parametersClass -- The Parameters subclass to decode the parameters of the objects into.
+    """
+    entry = (messageClass, _ObjectFields(parametersClass))
+    _OBJECT_TYPES[type] = entry
+    _OBJECT_TYPES[type.casefold()] = entry
+
+def _ObjectType(type : Optional[str]) -> tuple:
+    """
+    Method to get the message class and field table for an object type.
+    """
+    entry = _OBJECT_TYPES.get(type)
+    if entry == None and isinstance(type, str):
+        entry = _OBJECT_TYPES.get(type.casefold())
+    if entry == None:
+        return _UNKNOWN_TYPE
+    return entry
+
+RegisterObjectType("Container", ContainerMessage)
+RegisterObjectType("Primitive", PrimitiveMessage)
+RegisterObjectType("Text", TextMessage, TextParameters)
+RegisterObjectType("Line", LineMessage, LineParameters)
+RegisterObjectType("File", FileMessage)
+RegisterObjectType("Addressable", AddressableMessage)
+RegisterObjectType("Image", ImageMessage, ImageParameters)
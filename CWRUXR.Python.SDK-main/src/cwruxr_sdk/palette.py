@@ -0,0 +1,175 @@
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
+import requests
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import Color
+from cwruxr_sdk.material_message import MaterialMessage, MaterialRenderSettings
+
+class Palette:
+    """
+    A fixed set of materials which differ only by color, posted once, so recoloring an object is a materialID change.
+    Values in [low, high] map to the palette like a colormap, and any Color maps to the nearest entry.
+    Recolor builds the partial object message which only sends the id and the new materialID.
+    """
+
+    # The number of colors whose nearest entry is remembered, least recently used first out.
+    _nearestCacheSize = 4096
+
+    def __init__(
+            self,
+            name : str,
+            colors : list[Color],
+            shader : str = "Unlit",
+            parameters = None,
+            render_settings : Optional[MaterialRenderSettings] = None,
+            low : float = 0.0,
+            high : float = 1.0,
+        ):
+        """
+        Initialization function.
+
+        Arguments:
+        name -- The prefix of the material ids. Entry i has the id name:i.
+        colors -- The color of each entry, from the one for low to the one for high.
+        shader -- The shader every entry uses.
+        parameters -- The shader specific parameters every entry uses.
+        render_settings -- The render settings every entry uses.
+        low -- The value which maps to the first entry. Smaller values are clamped to it.
+        high -- The value which maps to the last entry. Larger values are clamped to it.
+        """
+        if len(colors) == 0:
+            raise ValueError("A palette needs at least one color.")
+        self.name = name
+        self.colors = list(colors)
+        self.shader = shader
+        self.parameters = parameters
+        self.renderSettings = render_settings
+        self.low = low
+        self.high = high
+        self.ids = [name + ":" + str(i) for i in range(len(self.colors))]
+        self._nearest = OrderedDict()
+
+    @classmethod
+    def Gradient(
+            cls,
+            name : str,
+            stops : list[Color],
+            size : int = 256,
+            **kwargs,
+        ):
+        """
+        Method to create a palette of size entries, blending linearly between evenly spaced color stops.
+        The blended components are not rounded, so stops in any range keep every entry distinct. A client's
+        PrecisionProfile rounds them as the materials are posted.
+        Other arguments are passed to the initialization function.
+        """
+        if len(stops) == 1 or size == 1:
+            return cls(name, [stops[0]] * size, **kwargs)
+        colors = []
+        for i in range(size):
+            position = i / (size - 1) * (len(stops) - 1)
+            index = min(int(position), len(stops) - 2)
+            t = position - index
+            a = stops[index]
+            b = stops[index + 1]
+            colors.append(Color(
+                a.r + (b.r - a.r) * t,
+                a.g + (b.g - a.g) * t,
+                a.b + (b.b - a.b) * t,
+                a.a + (b.a - a.a) * t,
+            ))
+        return cls(name, colors, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.colors)
+
+    def Materials(self) -> list[MaterialMessage]:
+        """
+        Get the material message of every entry.
+        """
+        return [
+            MaterialMessage(id, self.shader, color, self.renderSettings, self.parameters)
+            for id, color in zip(self.ids, self.colors)
+        ]
+
+    def Post(
+            self,
+            client : Client,
+        ) -> Optional[requests.Response]:
+        """
+        Create every entry in the client's room with one PostMaterialBulk call.
+        """
+        return client.PostMaterialBulk(self.Materials())
+
+    def Index(
+            self,
+            value : float,
+        ) -> int:
+        """
+        Get the entry for a value between low and high. Values outside them, including infinities, are clamped.
+        Raises ValueError for NaN, which has no entry.
+        """
+        if value != value:
+            raise ValueError("A palette has no entry for NaN.")
+        t = (value - self.low) / (self.high - self.low) if self.high != self.low else 0
+        if t <= 0:
+            return 0
+        if t >= 1:
+            return len(self.colors) - 1
+        return round(t * (len(self.colors) - 1))
+
+    def Id(
+            self,
+            value : float,
+        ) -> str:
+        """
+        Get the material id of the entry for a value between low and high.
+        """
+        return self.ids[self.Index(value)]
+
+    def Nearest(
+            self,
+            color : Color,
+        ) -> str:
+        """
+        Get the material id of the entry closest to a color.
+        The answers for the most recently used colors are remembered, so animating through a few colors stays fast
+        while colors which never repeat, such as computed ones, cannot grow the cache without bound.
+        """
+        key = (color.r, color.g, color.b, color.a)
+        nearest = self._nearest
+        id = nearest.get(key)
+        if id is not None:
+            nearest.move_to_end(key)
+            return id
+        best = None
+        for i, entry in enumerate(self.colors):
+            distance = (entry.r - color.r) ** 2 + (entry.g - color.g) ** 2 + (entry.b - color.b) ** 2 + (entry.a - color.a) ** 2
+            if best == None or distance < best:
+                best = distance
+                id = self.ids[i]
+        nearest[key] = id
+        if len(nearest) > self._nearestCacheSize:
+            nearest.popitem(last = False)
+        return id
+
+    def Recolor(
+            self,
+            id : str,
+            value,
+        ) -> dict[str, Any]:
+        """
+        Get the partial object message which gives the object with the given id the entry for value.
+        value is either a number between low and high, or a Color.
+        """
+        return {"id" : id, "materialID" : self.Nearest(value) if isinstance(value, Color) else self.Id(value)}
+
+    def RecolorMany(
+            self,
+            ids : Iterable[str],
+            values : Iterable,
+        ) -> list[dict[str, Any]]:
+        """
+        Get the partial object messages for recoloring many objects, ready for PostObjectBulk.
+        """
+        return [self.Recolor(id, value) for id, value in zip(ids, values)]
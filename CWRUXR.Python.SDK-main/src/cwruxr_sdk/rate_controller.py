@@ -0,0 +1,171 @@
+from threading import Lock
+from typing import Any, Optional
+from cwruxr_sdk.object_message import Interpolation
+
+class RateController:
+    """
+    Chooses how often to send updates and how many objects to send per request from the measured round-trip time and
+    failures, in the additive increase, multiplicative decrease style of TCP congestion control.
+    The rate grows by about increase ticks per second, every second, while requests finish within a tick. It is cut by decrease
+    when the smoothed round-trip time is longer than a tick, or a request fails while the smoothed error rate is above
+    errorThreshold, at most once per round trip. A single slow or failed request among fast ones is not enough to cut it.
+    The bulk size grows by one object per successful request, and is cut by decrease only on timeouts and failures caused by
+    the size of the body, such as 413, since other errors do not get better with smaller requests.
+    Give one to AnimationScheduler as controller, or call Record after each request of a loop of one's own.
+    """
+    def __init__(
+            self,
+            rate : float = 10,
+            minRate : float = 1,
+            maxRate : float = 60,
+            batchSize : int = 1000,
+            minBatchSize : int = 10,
+            maxBatchSize : int = 5000,
+            increase : float = 1,
+            decrease : float = .5,
+            timeout : float = 1,
+            errorThreshold : float = .25,
+            interpolationScale : float = 1,
+            interpolationTolerance : float = .25,
+        ):
+        """
+        Initialization function.
+
+        Arguments:
+        rate -- The number of updates per second to start at.
+        minRate -- The lowest rate to fall to.
+        maxRate -- The highest rate to climb to.
+        batchSize -- The number of objects per request to start at.
+        minBatchSize -- The smallest number of objects per request to fall to.
+        maxBatchSize -- The largest number of objects per request to climb to.
+        increase -- The number of updates per second the rate grows by each second while requests keep up.
+        decrease -- The fraction the rate and bulk size are multiplied by when requests fall behind or fail.
+        timeout -- The number of seconds after which a request which succeeded is counted as timed out.
+        errorThreshold -- The smoothed fraction of failed or timed out requests above which failures cut the rate.
+        interpolationScale -- The move and scale speeds of InterpolationUpdate are the rate times this, so the headset
+            smooths over the gap between updates. The rotate speed is two thirds of it, as in the Interpolation defaults.
+        interpolationTolerance -- The fraction the rate must change by before InterpolationUpdate returns new settings.
+        """
+        self.rate = float(rate)
+        self.minRate = minRate
+        self.maxRate = maxRate
+        self.batchSize = batchSize
+        self.minBatchSize = minBatchSize
+        self.maxBatchSize = maxBatchSize
+        self.increase = increase
+        self.decrease = decrease
+        self.timeout = timeout
+        self.errorThreshold = errorThreshold
+        self.interpolationScale = interpolationScale
+        self.interpolationTolerance = interpolationTolerance
+        self._lock = Lock()
+        self._interpolationRate = None
+        self.Reset()
+
+    def Reset(self):
+        """
+        Forget the measured round-trip times and zero the counters. The rate and bulk size are kept.
+        """
+        with self._lock:
+            # Smoothed round-trip time and its variation, as TCP estimates them.
+            self.rtt = None
+            self.rttVariation = None
+            self.minRtt = None
+            # Smoothed fraction of requests which failed or timed out.
+            self.errorRate = 0.0
+            self.requests = 0
+            self.errors = 0
+            self.timeouts = 0
+            self.decreases = 0
+            self._sinceDecrease = None
+
+    def Record(
+            self,
+            seconds : float,
+            ok : bool = True,
+            sizeFailure : bool = False,
+        ):
+        """
+        Adjust the rate and bulk size after a request.
+
+        Arguments:
+        seconds -- How long the request took.
+        ok -- Whether it succeeded.
+        sizeFailure -- Whether it failed because of the size of its body, such as with 413 or a timeout.
+        """
+        with self._lock:
+            self.requests += 1
+            if ok:
+                if self.rtt == None:
+                    self.rtt = seconds
+                    self.rttVariation = seconds / 2
+                else:
+                    self.rttVariation += (abs(self.rtt - seconds) - self.rttVariation) / 4
+                    self.rtt += (seconds - self.rtt) / 8
+                self.minRtt = seconds if self.minRtt == None else min(self.minRtt, seconds)
+
+            timedOut = ok and seconds > self.timeout
+            failed = not ok or timedOut
+            if not ok:
+                self.errors += 1
+            if timedOut:
+                self.timeouts += 1
+            self.errorRate += ((1.0 if failed else 0.0) - self.errorRate) / 8
+
+            # Only one cut per round trip, as the requests already in flight were sent at the old rate.
+            if self._sinceDecrease != None:
+                self._sinceDecrease += seconds
+            canDecrease = self._sinceDecrease == None or self._sinceDecrease >= (self.rtt or seconds)
+
+            # The rate is cut when requests fall behind or keep failing, and the bulk size for those which were too large.
+            # Falling behind is judged by the smoothed round-trip time, so one slow request does not cut the rate.
+            period = 1 / self.rate
+            cutRate = (self.rtt != None and self.rtt > period) or (failed and self.errorRate > self.errorThreshold)
+            cutBatch = timedOut or (not ok and sizeFailure)
+            if cutRate or cutBatch:
+                if canDecrease:
+                    if cutRate:
+                        self.rate = max(self.minRate, self.rate * self.decrease)
+                    if cutBatch:
+                        self.batchSize = max(self.minBatchSize, int(self.batchSize * self.decrease))
+                    self.decreases += 1
+                    self._sinceDecrease = 0.0
+            elif not failed and seconds <= period:
+                # One increase per request, and about rate requests per second, so the rate grows by about increase each second.
+                self.rate = min(self.maxRate, self.rate + self.increase / self.rate)
+                self.batchSize = min(self.maxBatchSize, self.batchSize + 1)
+
+    def InterpolationUpdate(
+            self,
+            force : bool = False,
+        ) -> Optional[Interpolation]:
+        """
+        Get interpolation settings which smooth over the gaps at the current rate, or None when the rate changed by less than
+        interpolationTolerance since they were last returned. Pass force to always get them.
+        """
+        with self._lock:
+            last = self._interpolationRate
+            if not force and last != None and abs(self.rate - last) <= last * self.interpolationTolerance:
+                return None
+            self._interpolationRate = self.rate
+            speed = self.rate * self.interpolationScale
+        return Interpolation(on = True, moveSpeed = speed, rotateSpeed = speed * 2 / 3, scaleSpeed = speed)
+
+    def Stats(self) -> dict[str, Any]:
+        """
+        Get the current rate, bulk size and round-trip estimates, and the counters since the start or the last Reset.
+        Times are in seconds.
+        """
+        with self._lock:
+            return {
+                "rate" : self.rate,
+                "batchSize" : self.batchSize,
+                "rtt" : self.rtt,
+                "rttVariation" : self.rttVariation,
+                "minRtt" : self.minRtt,
+                "errorRate" : self.errorRate,
+                "requests" : self.requests,
+                "errors" : self.errors,
+                "timeouts" : self.timeouts,
+                "decreases" : self.decreases,
+            }
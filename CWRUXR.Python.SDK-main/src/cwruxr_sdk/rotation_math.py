@@ -0,0 +1,229 @@
+from typing import Union
+import numpy as np
+from cwruxr_sdk.common import Vector3, Quaternion
+
+# Quaternions are arrays of shape (..., 4) in x, y, z, w order, the same as Quaternion and ObjectBatch.rotation.
+# Vectors and euler angles are arrays of shape (..., 3). Every function works on one value or on many at once,
+# and accepts Quaternion and Vector3 objects, or lists of them, in place of arrays.
+
+def AsArray(value) -> np.ndarray:
+    """
+    Method to turn a Quaternion, a Vector3, a list of them, or any array-like into a float array.
+    """
+    if isinstance(value, Quaternion):
+        return np.array((value.x, value.y, value.z, value.w), dtype = np.float64)
+    if isinstance(value, Vector3):
+        return np.array((value.x, value.y, value.z), dtype = np.float64)
+    if isinstance(value, (list, tuple)) and len(value) > 0:
+        if isinstance(value[0], Quaternion):
+            return np.array([(q.x, q.y, q.z, q.w) for q in value], dtype = np.float64)
+        if isinstance(value[0], Vector3):
+            return np.array([(v.x, v.y, v.z) for v in value], dtype = np.float64)
+    return np.asarray(value, dtype = np.float64)
+
+def ToQuaternions(array) -> Union[Quaternion, list[Quaternion]]:
+    """
+    Method to turn an array of shape (4,) into a Quaternion, or an array of shape (n, 4) into a list of Quaternions.
+    """
+    array = np.asarray(array)
+    if array.ndim == 1:
+        return Quaternion(*array.tolist())
+    return [Quaternion(x, y, z, w) for x, y, z, w in array.tolist()]
+
+def ToVector3s(array) -> Union[Vector3, list[Vector3]]:
+    """
+    Method to turn an array of shape (3,) into a Vector3, or an array of shape (n, 3) into a list of Vector3s.
+    """
+    array = np.asarray(array)
+    if array.ndim == 1:
+        return Vector3(*array.tolist())
+    return [Vector3(x, y, z) for x, y, z in array.tolist()]
+
+### Conversions ###
+def EulerToQuaternion(angles) -> np.ndarray:
+    """
+    Method to create quaternions from euler angles in radians, using the same convention as common.Euler.
+    """
+    half = AsArray(angles) * .5
+    c = np.cos(half)
+    s = np.sin(half)
+    cr, cp, cy = c[..., 0], c[..., 1], c[..., 2]
+    sr, sp, sy = s[..., 0], s[..., 1], s[..., 2]
+    return np.stack((
+        sr * cp * cy - cr * sp * sy,
+        cr * sp * cy + sr * cp * sy,
+        cr * cp * sy - sr * sp * cy,
+        cr * cp * cy + sr * sp * sy,
+    ), axis = -1)
+
+def QuaternionToEuler(quaternions) -> np.ndarray:
+    """
+    Method to get the euler angles in radians of quaternions. The inverse of EulerToQuaternion.
+    """
+    q = AsArray(quaternions)
+    x, y, z, w = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    return np.stack((
+        np.arctan2(2 * (w * x + y * z), 1 - 2 * (x * x + y * y)),
+        np.arcsin(np.clip(2 * (w * y - z * x), -1, 1)),
+        np.arctan2(2 * (w * z + x * y), 1 - 2 * (y * y + z * z)),
+    ), axis = -1)
+
+def AxisAngleToQuaternion(axis, angle) -> np.ndarray:
+    """
+    Method to create quaternions which rotate by angle radians around axis.
+    """
+    axis = AsArray(axis)
+    half = np.asarray(angle, dtype = np.float64)[..., None] * .5
+    axis = axis / np.linalg.norm(axis, axis = -1, keepdims = True)
+    vector = axis * np.sin(half)
+    return np.concatenate((vector, np.broadcast_to(np.cos(half), vector.shape[:-1] + (1,))), axis = -1)
+
+def QuaternionToAxisAngle(quaternions) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Method to get the unit axis and the angle in radians of quaternions.
+    Rotations by no angle get the x axis.
+    """
+    q = Normalize(quaternions)
+    w = np.clip(q[..., 3], -1, 1)
+    s = np.sqrt(1 - w * w)[..., None]
+    axis = np.where(s > 1e-9, q[..., :3] / np.maximum(s, 1e-9), (1, 0, 0))
+    return axis, 2 * np.arccos(w)
+
+def QuaternionToMatrix(quaternions) -> np.ndarray:
+    """
+    Method to get the rotation matrices, of shape (..., 3, 3), of unit quaternions.
+    """
+    q = AsArray(quaternions)
+    x, y, z, w = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    return np.stack((
+        1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w),
+        2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w),
+        2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y),
+    ), axis = -1).reshape(q.shape[:-1] + (3, 3))
+
+def MatrixToQuaternion(matrices) -> np.ndarray:
+    """
+    Method to get the unit quaternions of rotation matrices of shape (..., 3, 3), with w never negative.
+    Uses Shepperd's method: the largest of w, x, y and z is found from the trace or a diagonal entry, which keeps it well
+    away from zero, and the others are derived from the sums and differences of the off-diagonal entries. This keeps the
+    signs of the axis for rotations by 180 degrees, where the differences alone are all zero.
+    """
+    m = AsArray(matrices)
+    m00, m01, m02 = m[..., 0, 0], m[..., 0, 1], m[..., 0, 2]
+    m10, m11, m12 = m[..., 1, 0], m[..., 1, 1], m[..., 1, 2]
+    m20, m21, m22 = m[..., 2, 0], m[..., 2, 1], m[..., 2, 2]
+    # Four times the square of each of w, x, y and z, of which the largest is taken.
+    squares = np.stack((
+        1 + m00 + m11 + m22,
+        1 + m00 - m11 - m22,
+        1 - m00 + m11 - m22,
+        1 - m00 - m11 + m22,
+    ), axis = -1)
+    largest = np.argmax(squares, axis = -1)
+    # Each candidate is a multiple of the quaternion, scaled by four times its largest component, so normalizing gives it.
+    candidates = np.stack((
+        np.stack((m21 - m12, m02 - m20, m10 - m01, squares[..., 0]), axis = -1),
+        np.stack((squares[..., 1], m01 + m10, m02 + m20, m21 - m12), axis = -1),
+        np.stack((m01 + m10, squares[..., 2], m12 + m21, m02 - m20), axis = -1),
+        np.stack((m02 + m20, m12 + m21, squares[..., 3], m10 - m01), axis = -1),
+    ), axis = -2)
+    q = np.take_along_axis(candidates, largest[..., None, None], axis = -2)[..., 0, :]
+    q = np.where(q[..., 3:] < 0, -q, q)
+    return Normalize(q)
+
+def LookRotation(forward, up = (0, 1, 0)) -> np.ndarray:
+    """
+    Method to create quaternions whose z axis points along forward and whose y axis points as close to up as possible.
+    Where forward is parallel to up, no direction is closest, so the x axis is taken from the shortest rotation of the z axis
+    onto forward instead, as Unity's Quaternion.LookRotation does.
+    """
+    forward = AsArray(forward)
+    forward = forward / np.linalg.norm(forward, axis = -1, keepdims = True)
+    right = np.cross(AsArray(up), forward)
+    length = np.linalg.norm(right, axis = -1, keepdims = True)
+    parallel = length < 1e-6
+    right = right / np.where(parallel, 1, length)
+    if np.any(parallel):
+        # The shortest rotation from z to forward, as a quaternion of their cross product and one plus their dot product.
+        # Turning z onto -z has no shortest rotation, so it turns about the y axis.
+        fromZ = np.concatenate((np.cross((0, 0, 1), forward), 1 + forward[..., 2:]), axis = -1)
+        fromZ = np.where(fromZ[..., 3:] < 1e-6, (0, 1, 0, 0), fromZ)
+        right = np.where(parallel, Rotate(Normalize(fromZ), (1, 0, 0)), right)
+    return MatrixToQuaternion(np.stack((right, np.cross(forward, right), forward), axis = -1))
+
+### Operations ###
+def Normalize(quaternions) -> np.ndarray:
+    """
+    Method to scale quaternions to unit length.
+    """
+    q = AsArray(quaternions)
+    return q / np.linalg.norm(q, axis = -1, keepdims = True)
+
+def Conjugate(quaternions) -> np.ndarray:
+    """
+    Method to get the conjugates of quaternions, which are their inverses when they are unit length.
+    """
+    return AsArray(quaternions) * (-1, -1, -1, 1)
+
+def Inverse(quaternions) -> np.ndarray:
+    """
+    Method to get the inverses of quaternions.
+    """
+    q = AsArray(quaternions)
+    return Conjugate(q) / np.sum(q * q, axis = -1, keepdims = True)
+
+def Multiply(a, b) -> np.ndarray:
+    """
+    Method to compose rotations. The result rotates by b first, then by a.
+    """
+    a = AsArray(a)
+    b = AsArray(b)
+    ax, ay, az, aw = a[..., 0], a[..., 1], a[..., 2], a[..., 3]
+    bx, by, bz, bw = b[..., 0], b[..., 1], b[..., 2], b[..., 3]
+    return np.stack((
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+        aw * bw - ax * bx - ay * by - az * bz,
+    ), axis = -1)
+
+def Rotate(quaternions, vectors) -> np.ndarray:
+    """
+    Method to rotate vectors by unit quaternions.
+    """
+    q = AsArray(quaternions)
+    v = AsArray(vectors)
+    u = q[..., :3]
+    t = 2 * np.cross(u, v)
+    return v + q[..., 3:] * t + np.cross(u, t)
+
+def Nlerp(a, b, t) -> np.ndarray:
+    """
+    Method to interpolate between unit quaternions along the shortest path, normalizing a linear blend.
+    Cheaper than Slerp, but does not turn at a constant speed.
+    """
+    a = AsArray(a)
+    b = AsArray(b)
+    t = np.asarray(t, dtype = np.float64)[..., None]
+    b = np.where(np.sum(a * b, axis = -1, keepdims = True) < 0, -b, b)
+    return Normalize(a + (b - a) * t)
+
+def Slerp(a, b, t) -> np.ndarray:
+    """
+    Method to interpolate between unit quaternions along the shortest path at a constant speed.
+    t can be one value for every pair, or one value per pair.
+    """
+    a = AsArray(a)
+    b = AsArray(b)
+    t = np.asarray(t, dtype = np.float64)[..., None]
+    dot = np.sum(a * b, axis = -1, keepdims = True)
+    b = np.where(dot < 0, -b, b)
+    dot = np.abs(dot)
+
+    # Nearly equal rotations fall back to a linear blend, where the slerp weights divide by almost zero.
+    close = dot > .9995
+    angle = np.arccos(np.minimum(dot, 1))
+    sinAngle = np.where(close, 1, np.sin(angle))
+    weightA = np.where(close, 1 - t, np.sin((1 - t) * angle) / sinAngle)
+    weightB = np.where(close, t, np.sin(t * angle) / sinAngle)
+    return Normalize(weightA * a + weightB * b)
@@ -0,0 +1,112 @@
+from typing import Optional
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import ToJson
+from cwruxr_sdk.object_message import ObjectMessage
+from cwruxr_sdk.precision import PrecisionProfile
+
+class Scene:
+    """
+    Local registry of the objects under an anchor, keyed by id.
+    Remembers what was last sent for each object so that Sync only posts objects whose content changed, and deletes objects that were removed.
+    """
+    def __init__(
+            self,
+            precision : Optional[PrecisionProfile] = None,
+        ):
+        """
+        Initialization function.
+
+        Arguments:
+        precision -- How precisely poses and colors are sent, such as precision.FINE. Objects whose rounded content did not change
+            are not posted again, so movements smaller than it are never sent. None uses the precision of the client given to Sync.
+        """
+        self._precision = precision
+        self._objects = {}
+        self._sent = {}
+        self._touched = set()
+        self._removed = set()
+
+    def Set(
+            self,
+            message : ObjectMessage,
+        ):
+        """
+        Add an object to the scene or replace the object with the same id.
+        The object is only sent on the next Sync if its content differs from what was last sent.
+        """
+        self._objects[message.id] = message
+        self._touched.add(message.id)
+        self._removed.discard(message.id)
+
+    def Remove(
+            self,
+            id : str,
+        ):
+        """
+        Remove an object from the scene. It will be deleted on the next Sync.
+        """
+        self._objects.pop(id, None)
+        self._touched.discard(id)
+        if id in self._sent:
+            self._removed.add(id)
+
+    def Get(
+            self,
+            id : str,
+        ) -> Optional[ObjectMessage]:
+        """
+        Get the current object with the given id, or None.
+        """
+        return self._objects.get(id)
+
+    def __contains__(self, id : str) -> bool:
+        return id in self._objects
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __iter__(self):
+        return iter(self._objects.values())
+
+    def Sync(
+            self,
+            client : Client,
+        ) -> tuple[list[str], list[str]]:
+        """
+        Post changed objects with one PostObjectBulk call, and delete removed objects with one DeleteObjectBulk call.
+        Returns the ids that were posted and the ids that were deleted.
+        If a request fails, the scene keeps its pending changes so the next Sync retries them.
+        The scene's precision is used when it has one, and the client's otherwise.
+        """
+        precision = self._precision if self._precision != None else client._precision
+        changed = {}
+        for id in self._touched:
+            data = ToJson(self._objects[id], precision)
+            if self._sent.get(id) != data:
+                changed[id] = data
+
+        if len(changed) > 0:
+            # The objects were serialized for the comparison already, so the body is joined from them.
+            client.PostObjectBulk(b"[" + b",".join(changed.values()) + b"]")
+            self._sent.update(changed)
+        self._touched.clear()
+
+        removed = list(self._removed)
+        if len(removed) > 0:
+            client.DeleteObjectBulk(removed)
+            for id in removed:
+                del self._sent[id]
+            self._removed.clear()
+
+        return list(changed), removed
+
+    def Reset(
+            self,
+        ):
+        """
+        Forget what was last sent, so the next Sync posts every object again.
+        Use this after the room was cleared or changed outside of this scene.
+        """
+        self._sent.clear()
+        self._removed.clear()
+        self._touched = set(self._objects)
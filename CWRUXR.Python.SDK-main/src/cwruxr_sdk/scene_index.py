@@ -0,0 +1,244 @@
+from copy import copy
+from typing import Any, Iterable, Optional, Union
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.object_message import ObjectMessage
+
+def _Get(message, key : str) -> Any:
+    """
+    Method to read a field from a message or from a dictionary.
+    """
+    if isinstance(message, dict):
+        return message.get(key)
+    return getattr(message, key, None)
+
+def _Merge(stored, update):
+    """
+    Method to apply a message to the stored message with the same id, as the server does.
+    Fields the message does not hold keep their stored values, and nested values such as a partial pose are merged too,
+    whether they are dictionaries or objects like Pose.
+    Returns a new message of the stored message's kind, leaving both unchanged.
+    """
+    fields = update if isinstance(update, dict) else vars(update)
+    if isinstance(stored, dict):
+        result = dict(stored)
+        for key, value in fields.items():
+            if isinstance(value, dict) and isinstance(result.get(key), dict):
+                result[key] = _Merge(result[key], value)
+            else:
+                result[key] = value
+        return result
+    result = copy(stored)
+    for key, value in fields.items():
+        current = getattr(result, key, None)
+        # Slotted values such as Color have no fields to merge, and are replaced whole.
+        if hasattr(current, "__dict__") and (isinstance(value, dict) or hasattr(value, "__dict__")):
+            value = _Merge(current, value)
+        setattr(result, key, value)
+    return result
+
+class SceneIndex:
+    """
+    Local index of the object hierarchy under an anchor, by id, parent, type and material.
+    Fill it from GetAllObjects with Load, or keep it up to date by calling Add with the messages you post.
+    Children, Subtree, Ancestors, ByType and ByMaterial take time proportional to their result, not to the size of the scene.
+    """
+    def __init__(self):
+        """
+        Initialization function.
+        """
+        self._nodes = {}
+        self._parents = {}
+
+        # Dictionaries with None values are used as ordered sets, so results come back in the order objects were added.
+        self._children = {}
+        self._byType = {}
+        self._byMaterial = {}
+
+    @staticmethod
+    def _Link(index : dict, key, id : str):
+        if key != None:
+            index.setdefault(key, {})[id] = None
+
+    @staticmethod
+    def _Unlink(index : dict, key, id : str):
+        if key != None:
+            ids = index.get(key)
+            if ids != None:
+                ids.pop(id, None)
+                if len(ids) == 0:
+                    del index[key]
+
+    def Add(
+            self,
+            message : Union[ObjectMessage, dict[str, Any]],
+        ):
+        """
+        Add an object, or update the object with the same id and move it in the index.
+        An update only changes the fields it holds, as on the server, so a partial message such as one from delta.Diff
+        keeps the object's parent, type and material unless it holds new ones.
+        Its children stay under it, and objects can be added before their parent.
+        """
+        id = _Get(message, "id")
+        previous = self._nodes.get(id)
+        if previous != None:
+            self._Unlink(self._children, self._parents[id], id)
+            self._Unlink(self._byType, _Get(previous, "type"), id)
+            self._Unlink(self._byMaterial, _Get(previous, "materialID"), id)
+            message = _Merge(previous, message)
+        parentID = _Get(message, "parentID")
+        self._nodes[id] = message
+        self._parents[id] = parentID
+        self._Link(self._children, parentID, id)
+        self._Link(self._byType, _Get(message, "type"), id)
+        self._Link(self._byMaterial, _Get(message, "materialID"), id)
+
+    def AddMany(
+            self,
+            messages : Iterable[Union[ObjectMessage, dict[str, Any]]],
+        ):
+        """
+        Add every object in messages, such as the result of GetAllObjects or IterAllObjects, or a list posted with PostObjectBulk.
+        """
+        for message in messages:
+            self.Add(message)
+
+    def Load(
+            self,
+            client : Client,
+        ):
+        """
+        Replace the contents of the index with every object under the client's anchor.
+        """
+        self.Clear()
+        self.AddMany(client.GetAllObjects())
+
+    def Remove(
+            self,
+            id : str,
+        ) -> bool:
+        """
+        Remove a single object from the index. Its children are detached from it and become roots, until they are added again.
+        Returns whether the object was in the index.
+        """
+        message = self._nodes.pop(id, None)
+        if message == None:
+            return False
+        self._Unlink(self._children, self._parents.pop(id), id)
+        for child in self._children.pop(id, ()):
+            self._parents[child] = None
+        self._Unlink(self._byType, _Get(message, "type"), id)
+        self._Unlink(self._byMaterial, _Get(message, "materialID"), id)
+        return True
+
+    def Clear(self):
+        """
+        Remove every object from the index.
+        """
+        self._nodes.clear()
+        self._parents.clear()
+        self._children.clear()
+        self._byType.clear()
+        self._byMaterial.clear()
+
+    def Get(
+            self,
+            id : str,
+        ) -> Optional[Union[ObjectMessage, dict[str, Any]]]:
+        """
+        Get the object with the given id, or None.
+        """
+        return self._nodes.get(id)
+
+    def __contains__(self, id : str) -> bool:
+        return id in self._nodes
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __iter__(self):
+        return iter(self._nodes.values())
+
+    def Roots(self) -> list[str]:
+        """
+        Get the ids of the objects without a parent, or whose parent is not in the index.
+        """
+        return [id for id, parentID in self._parents.items() if parentID == None or parentID not in self._nodes]
+
+    def Children(
+            self,
+            id : str,
+        ) -> list[str]:
+        """
+        Get the ids of the objects directly under the object with the given id.
+        """
+        return list(self._children.get(id, ()))
+
+    def Subtree(
+            self,
+            id : str,
+            includeRoot : bool = True,
+        ) -> list[str]:
+        """
+        Get the ids of the object with the given id and everything under it, parents before their children.
+        """
+        result = [id] if includeRoot else []
+        stack = [id]
+        visited = {id}
+        while len(stack) > 0:
+            for child in self._children.get(stack.pop(), ()):
+                # Guards against parent cycles, which the server may not reject.
+                if child not in visited:
+                    visited.add(child)
+                    result.append(child)
+                    stack.append(child)
+        return result
+
+    def Ancestors(
+            self,
+            id : str,
+        ) -> list[str]:
+        """
+        Get the ids of the parents of the object with the given id, from its parent up to the root.
+        """
+        result = []
+        visited = {id}
+        parentID = self._parents.get(id)
+        while parentID != None and parentID not in visited:
+            result.append(parentID)
+            visited.add(parentID)
+            parentID = self._parents.get(parentID)
+        return result
+
+    def ByType(
+            self,
+            type : str,
+        ) -> list[str]:
+        """
+        Get the ids of the objects of the given type, such as "Primitive".
+        """
+        return list(self._byType.get(type, ()))
+
+    def ByMaterial(
+            self,
+            materialID : str,
+        ) -> list[str]:
+        """
+        Get the ids of the objects using the given material.
+        """
+        return list(self._byMaterial.get(materialID, ()))
+
+    def DeleteSubtree(
+            self,
+            client : Client,
+            id : str,
+        ) -> list[str]:
+        """
+        Delete the object with the given id and everything under it with a single DeleteObjectBulk call, and remove them from the index.
+        The index is left unchanged if the request fails.
+        Returns the ids that were deleted.
+        """
+        ids = self.Subtree(id)
+        client.DeleteObjectBulk(ids)
+        for deleted in ids:
+            self.Remove(deleted)
+        return ids
@@ -0,0 +1,217 @@
+from http.client import responses
+from typing import Any, Iterator, Optional
+import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+from cwruxr_sdk.common import FromJson
+from cwruxr_sdk.compression import Decompress
+
+class Response:
+    """
+    Response returned by the transports other than RequestsTransport.
+    Has the parts of requests.Response the SDK uses: status_code, reason, headers, content, json, iter_content, and use in a with statement.
+    """
+    def __init__(
+            self,
+            status_code : int,
+            headers,
+            content : Optional[bytes] = None,
+            raw : Optional[urllib3.BaseHTTPResponse] = None,
+            reason : Optional[str] = None,
+        ):
+        """
+        Initialization function.
+
+        Arguments:
+        status_code -- The status code of the response.
+        headers -- The response headers, as a mapping.
+        content -- The response body, when it was read already.
+        raw -- The urllib3 response to read the body from when it is needed, for streamed responses.
+        reason -- The reason phrase. Defaults to the standard one for the status code.
+        """
+        self.status_code = status_code
+        self.headers = headers
+        self.reason = reason if reason else responses.get(status_code, "")
+        self._content = content
+        self._raw = raw
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def content(self) -> bytes:
+        if self._content is None:
+            self._content = self._raw.data if self._raw != None else b""
+        return self._content
+
+    def json(self) -> Any:
+        return FromJson(self.content)
+
+    def iter_content(self, chunkSize : int = 1) -> Iterator[bytes]:
+        """
+        Yield the body in pieces of up to chunkSize bytes, reading it from the connection as it arrives when streamed.
+        """
+        if self._content is None and self._raw != None:
+            yield from self._raw.stream(chunkSize)
+            return
+        content = self.content
+        for start in range(0, len(content), chunkSize):
+            yield content[start:start + chunkSize]
+
+    def close(self):
+        """
+        Return the connection of a streamed response to the pool, discarding any unread body.
+        """
+        if self._raw != None:
+            self._raw.drain_conn()
+            self._raw.release_conn()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+class Transport:
+    """
+    Parent class for transports, which send the requests of a Client.
+    Pass one to Client as transport to replace how requests are sent, such as with an InMemoryTransport in tests.
+    """
+    def Request(
+            self,
+            method : str,
+            url : str,
+            data : Optional[bytes] = None,
+            headers : Optional[dict[str, str]] = None,
+            stream : bool = False,
+        ):
+        """
+        Send a request and return its response, which should behave like a requests.Response for status_code, reason, headers,
+        content and iter_content. With stream, the body should be read from the connection as iter_content asks for it.
+        The headers dictionary is shared between requests, so it must not be changed.
+        """
+        raise NotImplementedError()
+
+    def Close(self):
+        """
+        Release any connections the transport holds.
+        """
+        pass
+
+class RequestsTransport(Transport):
+    """
+    Transport which sends requests with a requests.Session. This is the default transport of Client.
+    """
+    def __init__(
+            self,
+            poolSize : Optional[int] = None,
+        ):
+        """
+        Initialization function.
+
+        Arguments:
+        poolSize -- The maximum number of connections kept open to each host. None uses the requests default.
+        """
+        self.session = requests.Session()
+        if poolSize != None:
+            adapter = HTTPAdapter(pool_maxsize = poolSize, pool_block = True)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+
+    def Request(
+            self,
+            method : str,
+            url : str,
+            data : Optional[bytes] = None,
+            headers : Optional[dict[str, str]] = None,
+            stream : bool = False,
+        ) -> requests.Response:
+        return self.session.request(method, url, data = data, headers = headers, stream = stream)
+
+    def Close(self):
+        self.session.close()
+
+class Urllib3Transport(Transport):
+    """
+    Transport which sends requests straight to a urllib3 connection pool, skipping the hooks, cookies, header merging and redirect
+    handling of requests.Session. Worth it for the small, frequent requests of animation loops.
+    Redirects are not followed and nothing is retried, as the Api answers directly.
+    """
+    def __init__(
+            self,
+            poolSize : Optional[int] = None,
+            timeout : Optional[float] = None,
+        ):
+        """
+        Initialization function.
+
+        Arguments:
+        poolSize -- The maximum number of connections kept open to each host. Callers beyond it wait for a free connection.
+        timeout -- The number of seconds to wait for a connection or a response. None waits forever, as requests does.
+        """
+        self._pool = urllib3.PoolManager(
+            maxsize = poolSize if poolSize != None else 10,
+            block = poolSize != None,
+            timeout = urllib3.Timeout(total = timeout) if timeout != None else urllib3.Timeout(connect = None, read = None),
+            retries = False,
+        )
+
+    def Request(
+            self,
+            method : str,
+            url : str,
+            data : Optional[bytes] = None,
+            headers : Optional[dict[str, str]] = None,
+            stream : bool = False,
+        ) -> Response:
+        result = self._pool.urlopen(
+            method,
+            url,
+            body = data,
+            headers = headers,
+            redirect = False,
+            preload_content = not stream,
+        )
+        if stream:
+            return Response(result.status, result.headers, raw = result, reason = result.reason)
+        return Response(result.status, result.headers, result.data, reason = result.reason)
+
+    def Close(self):
+        self._pool.clear()
+
+class InMemoryTransport(Transport):
+    """
+    Transport which answers requests with a LocalServer directly, without sockets or threads.
+    The server does not need to be started. Its latency, jitter, error and body size settings still apply.
+    """
+    def __init__(
+            self,
+            server = None,
+        ):
+        """
+        Initialization function.
+
+        Arguments:
+        server -- The local_server.LocalServer to answer requests with. A new one is created if not given.
+        """
+        if server == None:
+            # Imported here, as the local server is only needed when this transport is used.
+            from cwruxr_sdk.local_server import LocalServer
+            server = LocalServer()
+        self.server = server
+
+    def Request(
+            self,
+            method : str,
+            url : str,
+            data : Optional[bytes] = None,
+            headers : Optional[dict[str, str]] = None,
+            stream : bool = False,
+        ) -> Response:
+        status, content, responseHeaders = self.server.Handle(method, url, headers or {}, data or b"")
+        # Decoded here, as urllib3 does for the other transports.
+        encoding = responseHeaders.get("Content-Encoding")
+        if encoding:
+            content = Decompress(content, encoding)
+        return Response(status, responseHeaders, content)
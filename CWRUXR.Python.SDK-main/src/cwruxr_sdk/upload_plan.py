@@ -0,0 +1,173 @@
+from typing import Any, Iterable, Optional
+from cwruxr_sdk.bulk import BulkResult
+
+def _Get(item, key : str) -> Any:
+    """
+    Method to read a field from a message or from a dictionary.
+    """
+    if isinstance(item, dict):
+        return item.get(key)
+    return getattr(item, key, None)
+
+def References(message) -> list[str]:
+    """
+    Method to get the ids of the objects a message needs to exist before it is posted.
+    These are its parentID, and the startId and endId of a line's parameters.
+    """
+    references = []
+    parentID = _Get(message, "parentID")
+    if parentID != None:
+        references.append(parentID)
+    parameters = _Get(message, "parameters")
+    if parameters != None:
+        for key in ("startId", "endId"):
+            id = _Get(parameters, key)
+            if id != None:
+                references.append(id)
+    return references
+
+def _Cycles(ids : Iterable[str], byId : dict) -> list[list[str]]:
+    """
+    Method to find the groups of messages which reference each other in a cycle, among messages which could not be placed.
+    Messages which only reference a cycle are left out. Finds the strongly connected components with Tarjan's algorithm,
+    without recursion so deep hierarchies do not reach the recursion limit.
+    """
+    ids = set(ids)
+    references = {id : [reference for reference in References(byId[id]) if reference in ids] for id in ids}
+    index = {}
+    low = {}
+    stack = []
+    onStack = set()
+    cycles = []
+    for root in ids:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        onStack.add(root)
+        work = [(root, iter(references[root]))]
+        while len(work) > 0:
+            id, remaining = work[-1]
+            for reference in remaining:
+                if reference not in index:
+                    index[reference] = low[reference] = len(index)
+                    stack.append(reference)
+                    onStack.add(reference)
+                    work.append((reference, iter(references[reference])))
+                    break
+                if reference in onStack:
+                    low[id] = min(low[id], index[reference])
+            else:
+                work.pop()
+                if len(work) > 0:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[id])
+                if low[id] == index[id]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        onStack.discard(member)
+                        component.append(member)
+                        if member == id:
+                            break
+                    if len(component) > 1 or id in references[id]:
+                        cycles.append(sorted(map(str, component)))
+    return sorted(cycles)
+
+class UploadPlan:
+    """
+    Object messages grouped into levels, where every message only references objects in earlier levels or already on the server.
+    Messages in the same level don't depend on each other, so each level can be sent with as much parallelism as wanted.
+    """
+    def __init__(
+            self,
+            levels : list[list],
+            missing : dict[str, list[str]],
+        ):
+        """
+        Initialization function.
+
+        Arguments:
+        levels -- The messages of each level, in upload order.
+        missing -- For each referenced id which is neither in the plan nor known to exist, the ids of the messages referencing it.
+        """
+        self.levels = levels
+        self.missing = missing
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def Upload(
+            self,
+            client,
+            maxItems : int = 1000,
+            maxBytes : int = 1 << 20,
+            parallelism : int = 8,
+        ) -> list[BulkResult]:
+        """
+        Post the plan level by level, with each level sent in parallel chunks by PostObjectBulkChunked.
+        Stops after the first level with a failed chunk, as later levels may reference the objects which failed.
+        Returns the result of every level which was sent.
+        """
+        results = []
+        for level in self.levels:
+            result = client.PostObjectBulkChunked(level, maxItems, maxBytes, parallelism)
+            results.append(result)
+            if not result.ok:
+                break
+        return results
+
+def PlanUpload(
+        messages : Iterable,
+        existing : Optional[Iterable[str]] = None,
+        strict : bool = False,
+    ) -> UploadPlan:
+    """
+    Method to sort object messages into dependency levels from their parentID and line references.
+    A later message with the same id as an earlier one replaces it.
+    Raises a ValueError listing the ids on each cycle if references form cycles.
+
+    Arguments:
+    messages -- The object messages or dictionaries to upload.
+    existing -- Ids of objects already on the server, which messages may reference.
+    strict -- Raise a ValueError if a message references an id which is neither in messages nor in existing.
+    """
+    byId = {}
+    for message in messages:
+        byId[_Get(message, "id")] = message
+    existing = set(existing) if existing != None else set()
+
+    # Count, for every message, the references still waiting on a message in the plan, and who waits on each id.
+    waiting = {}
+    dependents = {}
+    missing = {}
+    for id, message in byId.items():
+        count = 0
+        for reference in References(message):
+            if reference in byId:
+                count += 1
+                dependents.setdefault(reference, []).append(id)
+            elif reference not in existing:
+                missing.setdefault(reference, []).append(id)
+        waiting[id] = count
+    if strict and len(missing) > 0:
+        raise ValueError("Messages reference ids which do not exist: " + ", ".join(sorted(map(str, missing))))
+
+    levels = []
+    current = [id for id, count in waiting.items() if count == 0]
+    placed = 0
+    while len(current) > 0:
+        levels.append([byId[id] for id in current])
+        placed += len(current)
+        next = []
+        for id in current:
+            for dependent in dependents.get(id, ()):
+                waiting[dependent] -= 1
+                if waiting[dependent] == 0:
+                    next.append(dependent)
+        current = next
+
+    if placed < len(byId):
+        cycles = _Cycles([id for id, count in waiting.items() if count > 0], byId)
+        raise ValueError("Messages reference each other in a cycle: " + "; ".join(", ".join(cycle) for cycle in cycles))
+    return UploadPlan(levels, missing)
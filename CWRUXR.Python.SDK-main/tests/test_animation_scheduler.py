@@ -0,0 +1,150 @@
+import time
+
+import pytest
+from requests.exceptions import ConnectTimeout, ReadTimeout
+from urllib3.exceptions import ConnectTimeoutError, ReadTimeoutError
+
+from cwruxr_sdk import animation_scheduler
+from cwruxr_sdk.animation_scheduler import AnimationScheduler, _SizeFailure
+from cwruxr_sdk.client import ApiError, Client
+from cwruxr_sdk.local_server import LocalServer
+from cwruxr_sdk.object_message import ObjectMessage
+from cwruxr_sdk.rate_controller import RateController
+from cwruxr_sdk.transport import InMemoryTransport
+
+def MakeClient(server : LocalServer) -> Client:
+    return Client("http://localhost/api/v2/", "room", "anchor", transport = InMemoryTransport(server))
+
+def WaitFor(condition, timeout : float = 5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            pytest.fail("Timed out waiting for the scheduler.")
+        time.sleep(.005)
+
+def Once(messages : list):
+    """
+    Callback which returns the messages on the first tick it runs in, whichever thread runs it.
+    """
+    items = [messages]
+    return lambda t, tick : items.pop() if len(items) > 0 else None
+
+class _FailFirst:
+    """
+    Send function which fails its first request, after running during, and posts every later one.
+    """
+    def __init__(self, client : Client):
+        self.client = client
+        self.sent = []
+        self.during = None
+
+    def __call__(self, messages : list):
+        self.sent.append([(m.id, m.active) for m in messages])
+        if len(self.sent) == 1:
+            if self.during != None:
+                self.during()
+            raise Exception("Service Unavailable")
+        self.client.PostObjectBulk(messages)
+
+def Stored(server : LocalServer) -> dict:
+    return {id : message["active"] for id, message in server.Room("room").objects.get("anchor", {}).items()}
+
+def test_sends_every_tick():
+    server = LocalServer()
+    scheduler = AnimationScheduler(MakeClient(server), rate = 200)
+    scheduler.Add(lambda t, tick : [ObjectMessage(id = "cube", active = True)])
+    with scheduler:
+        WaitFor(lambda : scheduler.Stats()["objectsSent"] >= 3)
+    stats = scheduler.Stats()
+    assert (stats["callbackErrors"], stats["sendErrors"]) == (0, 0)
+    assert Stored(server) == {"cube" : True}
+
+def test_failed_messages_are_retried():
+    server = LocalServer()
+    send = _FailFirst(MakeClient(server))
+    scheduler = AnimationScheduler(send.client, rate = 200, send = send)
+    scheduler.Add(Once([ObjectMessage(id = "a", active = True), ObjectMessage(id = "b", active = True)]))
+    with scheduler:
+        WaitFor(lambda : scheduler.Stats()["objectsSent"] >= 2)
+    assert send.sent == [[("a", True), ("b", True)]] * 2
+    assert scheduler.Stats()["sendErrors"] == 1
+    assert Stored(server) == {"a" : True, "b" : True}
+
+def test_retry_keeps_newer_messages():
+    server = LocalServer()
+    send = _FailFirst(MakeClient(server))
+    scheduler = AnimationScheduler(send.client, rate = 200, send = send)
+    scheduler.Add(Once([ObjectMessage(id = "a", active = True), ObjectMessage(id = "b", active = True)]))
+
+    def During():
+        # A newer message for b is queued while the request holding the old one fails.
+        scheduler.Add(Once([ObjectMessage(id = "b", active = False)]))
+        scheduler.Tick(0, 0)
+    send.during = During
+
+    with scheduler:
+        WaitFor(lambda : scheduler.Stats()["objectsSent"] >= 2)
+    assert sorted(send.sent[1]) == [("a", True), ("b", False)]
+    assert Stored(server) == {"a" : True, "b" : False}
+
+def test_stop_gives_up_on_failures():
+    server = LocalServer(errorRate = 1)
+    scheduler = AnimationScheduler(MakeClient(server), rate = 200)
+    scheduler.Add(Once([ObjectMessage(id = "a", active = True)]))
+    scheduler.Start()
+    WaitFor(lambda : scheduler.Stats()["sendErrors"] >= 2)
+    scheduler.Stop()
+    assert isinstance(scheduler.lastError, Exception)
+    assert scheduler.Stats()["objectsSent"] == 0
+
+def test_forget_drops_waiting_messages():
+    server = LocalServer()
+    scheduler = AnimationScheduler(MakeClient(server), controller = RateController())
+    scheduler.Add(Once([ObjectMessage(id = "a", active = True), ObjectMessage(id = "b", active = True)]))
+    scheduler.Tick(0, 0)
+    scheduler.Forget(["a"])
+    scheduler.Start()
+    scheduler.Stop()
+    assert Stored(server) == {"b" : True}
+
+def test_interpolation_only_for_recent_ids(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(animation_scheduler.time, "monotonic", lambda : now[0])
+    server = LocalServer()
+    scheduler = AnimationScheduler(MakeClient(server), controller = RateController(), forgetAfter = 5)
+    scheduler.Add(Once([ObjectMessage(id = "a", active = True)]))
+    scheduler.Tick(0, 0)
+    now[0] += 7
+    scheduler.Add(Once([ObjectMessage(id = "b", active = True)]))
+    scheduler.Tick(0, 1)
+    # The first send gives the controller's first interpolation settings, which go to b only.
+    scheduler.Start()
+    scheduler.Stop()
+    objects = server.Room("room").objects["anchor"]
+    assert "interpolation" in objects["b"]
+    assert "interpolation" not in objects["a"]
+
+@pytest.mark.parametrize("error, expected", [
+    (ApiError(413, "Request Entity Too Large"), True),
+    (ApiError(413, "Content Too Large"), True),
+    (ReadTimeout(), True),
+    (ReadTimeoutError(None, "/", "Read timed out."), True),
+    (ConnectTimeout(), False),
+    (ConnectTimeoutError(), False),
+    (TimeoutError(), False),
+    (ApiError(503, "Service Unavailable"), False),
+    (Exception("Request Entity Too Large"), False),
+    (ValueError(), False),
+])
+def test_size_failures(error : Exception, expected : bool):
+    assert _SizeFailure(error) == expected
+
+def test_413_shrinks_the_batch():
+    server = LocalServer(maxBodyBytes = 200)
+    controller = RateController(rate = 100, minRate = 50, maxRate = 100, batchSize = 100, minBatchSize = 1)
+    scheduler = AnimationScheduler(MakeClient(server), controller = controller)
+    scheduler.Add(Once([ObjectMessage(id = "cube" + str(i), active = True) for i in range(20)]))
+    with scheduler:
+        WaitFor(lambda : scheduler.Stats()["objectsSent"] >= 20)
+    assert controller.batchSize < 20
+    assert len(Stored(server)) == 20
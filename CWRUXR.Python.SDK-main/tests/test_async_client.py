@@ -0,0 +1,97 @@
+import asyncio
+import threading
+
+import pytest
+
+from cwruxr_sdk.async_client import AsyncClient
+from cwruxr_sdk.client import ApiError
+from cwruxr_sdk.local_server import LocalServer
+from cwruxr_sdk.object_message import PrimitiveMessage
+from cwruxr_sdk.transport import InMemoryTransport
+
+ENDPOINT = "http://localhost/api/v2/"
+
+def Stored(server : LocalServer) -> dict:
+    return server.Room("room").objects.get("anchor", {})
+
+class _CountingTransport(InMemoryTransport):
+    """
+    Tracks how many requests are in flight at once, and whether it was closed.
+    """
+    def __init__(self, server : LocalServer):
+        super().__init__(server)
+        self._lock = threading.Lock()
+        self.inFlight = 0
+        self.mostInFlight = 0
+        self.closed = False
+
+    def Request(self, method, url, data = None, headers = None, stream = False):
+        with self._lock:
+            self.inFlight += 1
+            self.mostInFlight = max(self.mostInFlight, self.inFlight)
+        try:
+            return super().Request(method, url, data, headers, stream)
+        finally:
+            with self._lock:
+                self.inFlight -= 1
+
+    def Close(self):
+        self.closed = True
+
+def test_concurrent_calls():
+    server = LocalServer(latency = .02)
+
+    async def Run():
+        async with AsyncClient(ENDPOINT, "room", "anchor", maxConnections = 8, transport = InMemoryTransport(server)) as client:
+            results = await asyncio.gather(*[client.PostObject(PrimitiveMessage(str(i))) for i in range(8)])
+            objects = await client.GetAllObjects()
+        return results, objects
+
+    results, objects = asyncio.run(Run())
+    assert [result.status_code for result in results] == [200] * 8
+    assert sorted(object["id"] for object in objects) == [str(i) for i in range(8)]
+
+def test_requests_in_flight_are_bounded():
+    server = LocalServer(latency = .01)
+    transport = _CountingTransport(server)
+
+    async def Run():
+        async with AsyncClient(ENDPOINT, "room", "anchor", maxConnections = 3, transport = transport) as client:
+            await asyncio.gather(*[client.PostObject(PrimitiveMessage(str(i))) for i in range(12)])
+
+    asyncio.run(Run())
+    assert transport.mostInFlight == 3
+    assert len(Stored(server)) == 12
+
+def test_close_waits_for_requests_in_flight():
+    server = LocalServer(latency = .05)
+    transport = _CountingTransport(server)
+
+    async def Run():
+        client = AsyncClient(ENDPOINT, "room", "anchor", maxConnections = 2, transport = transport)
+        tasks = [asyncio.ensure_future(client.PostObject(PrimitiveMessage(str(i)))) for i in range(2)]
+        # Let the requests reach the workers before closing.
+        await asyncio.sleep(.01)
+        await client.Close()
+        assert transport.inFlight == 0
+        assert transport.closed
+        assert [task.result().status_code for task in tasks] == [200, 200]
+        with pytest.raises(RuntimeError):
+            await client.PostObject(PrimitiveMessage("late"))
+
+    asyncio.run(Run())
+    assert sorted(Stored(server)) == ["0", "1"]
+
+def test_worker_exception_reaches_caller():
+    server = LocalServer()
+
+    async def Run():
+        async with AsyncClient(ENDPOINT, "room", "anchor", transport = InMemoryTransport(server)) as client:
+            with pytest.raises(ApiError) as error:
+                await client.GetObject("missing")
+            assert error.value.status_code == 404
+            # The failure does not affect later calls.
+            await client.PostObject(PrimitiveMessage("cube"))
+            return await client.GetObject("cube")
+
+    assert asyncio.run(Run())["id"] == "cube"
@@ -0,0 +1,147 @@
+import threading
+
+import pytest
+
+from cwruxr_sdk.batching_client import BatchingClient
+from cwruxr_sdk.common import Color
+from cwruxr_sdk.local_server import LocalServer
+from cwruxr_sdk.material_message import UnlitMaterialMessage, UnlitParameters
+from cwruxr_sdk.object_message import ObjectMessage, PrimitiveMessage
+from cwruxr_sdk.transport import InMemoryTransport
+
+ENDPOINT = "http://localhost/api/v2/"
+
+def MakeClient(server : LocalServer, flushInterval : float = 60, maxBatch : int = 500) -> BatchingClient:
+    return BatchingClient(ENDPOINT, "room", "anchor", flushInterval = flushInterval, maxBatch = maxBatch, transport = InMemoryTransport(server))
+
+def Stored(server : LocalServer) -> dict:
+    return server.Room("room").objects.get("anchor", {})
+
+def test_flush_on_size():
+    server = LocalServer()
+    client = MakeClient(server, maxBatch = 3)
+    try:
+        futures = [client.PostObject(PrimitiveMessage(str(i))) for i in range(2)]
+        assert not any(future.done() for future in futures)
+        futures.append(client.PostObject(PrimitiveMessage("2")))
+        for future in futures:
+            assert future.result(timeout = 5).status_code == 200
+        assert server.requests == 1
+        assert sorted(Stored(server)) == ["0", "1", "2"]
+    finally:
+        client.Close()
+
+def test_flush_on_interval():
+    server = LocalServer()
+    client = MakeClient(server, flushInterval = .02)
+    try:
+        future = client.PostObject(PrimitiveMessage("cube"))
+        assert future.result(timeout = 5).status_code == 200
+        assert list(Stored(server)) == ["cube"]
+    finally:
+        client.Close()
+
+def test_repeated_posts_collapse():
+    server = LocalServer()
+    client = MakeClient(server)
+    try:
+        first = client.PostObject(PrimitiveMessage("cube", active = True))
+        second = client.PostObject(PrimitiveMessage("cube", active = False))
+        material = client.PostMaterial(UnlitMaterialMessage("red", Color(1, 0, 0, 1), UnlitParameters()))
+        client.Flush()
+        assert first.result(timeout = 0) is second.result(timeout = 0)
+        assert material.result(timeout = 0).status_code == 200
+        # One bulk request for the materials and one for the objects.
+        assert server.requests == 2
+        assert Stored(server)["cube"]["active"] == False
+        assert list(server.Room("room").materials) == ["red"]
+    finally:
+        client.Close()
+
+def test_errors_resolve_futures():
+    server = LocalServer(errorRate = 1)
+    client = MakeClient(server)
+    try:
+        futures = [client.PostObject(PrimitiveMessage(str(i))) for i in range(3)]
+        client.Flush()
+        for future in futures:
+            with pytest.raises(Exception, match = "Service Unavailable"):
+                future.result(timeout = 0)
+    finally:
+        server.errorRate = 0
+        client.Close()
+
+def test_close_flushes_and_rejects_posts():
+    server = LocalServer()
+    client = MakeClient(server)
+    future = client.PostObject(PrimitiveMessage("cube"))
+    client.Close()
+    assert future.result(timeout = 0).status_code == 200
+    with pytest.raises(RuntimeError):
+        client.PostObject(PrimitiveMessage("late"))
+
+def test_bulk_posts_flush_first():
+    server = LocalServer()
+    client = MakeClient(server)
+    try:
+        client.PostObject(PrimitiveMessage("cube", active = True))
+        client.PostObjectBulk([ObjectMessage(id = "cube", active = False)])
+        assert Stored(server)["cube"]["active"] == False
+
+        client.PostObject(PrimitiveMessage("cube", active = True))
+        result = client.PostObjectBulkChunked([ObjectMessage(id = "cube", active = False)])
+        assert result.ok
+        assert Stored(server)["cube"]["active"] == False
+
+        client.PostObject(PrimitiveMessage("cube", active = True))
+        client.PostObjectPoses([ObjectMessage(id = "cube", active = False)])
+        assert Stored(server)["cube"]["active"] == False
+
+        client.PostMaterial(UnlitMaterialMessage("red", Color(1, 0, 0, 1), UnlitParameters()))
+        client.PostMaterialBulkChunked([UnlitMaterialMessage("red", Color(0, 1, 0, 1), UnlitParameters())])
+        client.Flush()
+        assert server.Room("room").materials["red"]["color"]["g"] == 1
+    finally:
+        client.Close()
+
+def test_deletes_flush_first():
+    server = LocalServer()
+    client = MakeClient(server)
+    try:
+        client.PostObject(PrimitiveMessage("cube"))
+        client.DeleteObject("cube")
+        client.Flush()
+        assert Stored(server) == {}
+    finally:
+        client.Close()
+
+class _BlockingTransport(InMemoryTransport):
+    """
+    Holds every request until released, so the buffer can be filled while a flush is in flight.
+    """
+    def __init__(self, server : LocalServer):
+        super().__init__(server)
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def Request(self, method, url, data = None, headers = None, stream = False):
+        self.started.set()
+        self.release.wait(5)
+        return super().Request(method, url, data, headers, stream)
+
+def test_buffer_filled_during_flush_is_sent_at_once():
+    server = LocalServer()
+    transport = _BlockingTransport(server)
+    client = BatchingClient(ENDPOINT, "room", "anchor", flushInterval = 60, maxBatch = 3, transport = transport)
+    try:
+        first = [client.PostObject(PrimitiveMessage(str(i))) for i in range(3)]
+        assert transport.started.wait(5)
+        # The flush thread is sending the first batch, so it misses the notification for this one.
+        second = [client.PostObject(PrimitiveMessage(str(i))) for i in range(3, 6)]
+        transport.release.set()
+        for future in first + second:
+            assert future.result(timeout = 2).status_code == 200
+        assert sorted(Stored(server)) == [str(i) for i in range(6)]
+    finally:
+        transport.release.set()
+        client.Close()
@@ -0,0 +1,97 @@
+import math
+
+import pytest
+
+from cwruxr_sdk.binary_pose import DecodePoses, EncodePoses
+from cwruxr_sdk.common import Euler, FromJson, Pose, Quaternion, ToJson, Vector3
+from cwruxr_sdk.object_message import ObjectMessage
+
+def AssertClose(expected : dict, actual : dict, tolerance : float):
+    assert expected.keys() == actual.keys()
+    for component, value in expected.items():
+        assert actual[component] == pytest.approx(value, abs = tolerance * max(1, abs(value)))
+
+def AssertRoundTrip(messages : list):
+    """
+    Checks that every message decodes from the binary layout to its json form, to within the 32-bit floats and
+    16-bit rotations sent.
+    """
+    decoded = DecodePoses(EncodePoses(messages))
+    assert len(decoded) == len(messages)
+    for message, binary in zip(messages, decoded):
+        expected = FromJson(ToJson(message))
+        assert expected.keys() == binary.keys()
+        assert binary["id"] == expected["id"]
+        assert binary.get("active") == expected.get("active")
+        assert binary.get("materialID") == expected.get("materialID")
+        if "pose" in expected:
+            assert expected["pose"].keys() == binary["pose"].keys()
+            for key, values in expected["pose"].items():
+                AssertClose(values, binary["pose"][key], 1e-4 if key == "rotation" else 1e-6)
+
+def Messages() -> list[ObjectMessage]:
+    return [
+        ObjectMessage(id = "position", pose = Pose(Vector3(1.5, -2.25, 1e5))),
+        ObjectMessage(id = "rotation", pose = Pose(rotation = Quaternion(0, .7071068, 0, .7071068))),
+        ObjectMessage(id = "euler", pose = Pose(euler = Vector3(10, 20.5, -30))),
+        ObjectMessage(id = "scale", pose = Pose(scale = Vector3(.05, .05, .05))),
+        ObjectMessage(id = "on", active = True),
+        ObjectMessage(id = "off", active = False),
+        ObjectMessage(id = "material", materialID = "red"),
+        ObjectMessage(
+            id = "everything",
+            pose = Pose(Vector3(1, 2, 3), Euler(Vector3(0, 90, 0)), Vector3(0, 90, 0), Vector3(2, 2, 2)),
+            active = False,
+            materialID = "blue",
+        ),
+        ObjectMessage(id = "empty"),
+    ]
+
+def test_round_trip():
+    AssertRoundTrip(Messages())
+
+def test_round_trip_dicts():
+    AssertRoundTrip([FromJson(ToJson(message)) for message in Messages()])
+
+def test_unicode_ids():
+    AssertRoundTrip([ObjectMessage(id = "kugel-ä-球", materialID = "grün")])
+
+def test_rotation_is_normalized():
+    decoded = DecodePoses(EncodePoses([ObjectMessage(id = "a", pose = Pose(rotation = Quaternion(0, 0, 0, 2)))]))
+    AssertClose({"x" : 0, "y" : 0, "z" : 0, "w" : 1}, decoded[0]["pose"]["rotation"], 1e-4)
+
+def test_empty_list():
+    assert DecodePoses(EncodePoses([])) == []
+
+def test_truncated_body():
+    body = EncodePoses(Messages())
+    for length in (len(body) - 1, len(body) - 13, 6):
+        with pytest.raises(ValueError):
+            DecodePoses(body[:length])
+
+def test_bad_magic():
+    with pytest.raises(ValueError):
+        DecodePoses(b"{}")
+
+def test_long_ids():
+    EncodePoses([ObjectMessage(id = "a" * 255, materialID = "m" * 255)])
+    with pytest.raises(ValueError):
+        EncodePoses([ObjectMessage(id = "a" * 256)])
+    with pytest.raises(ValueError):
+        EncodePoses([ObjectMessage(id = "a", materialID = "m" * 256)])
+    # Multi-byte characters count by their utf-8 length.
+    with pytest.raises(ValueError):
+        EncodePoses([ObjectMessage(id = "ä" * 128)])
+
+def test_bad_messages():
+    for message in (
+            ObjectMessage(active = True),
+            {"id" : None, "active" : True},
+            {"id" : 5},
+            ObjectMessage(id = "a", pose = Pose(rotation = Quaternion(math.nan, 0, 0, 1))),
+            ObjectMessage(id = "a", pose = Pose(rotation = Quaternion(math.inf, 0, 0, 1))),
+            ObjectMessage(id = "a", pose = Pose(Vector3("x", 0, 0))),
+            {"id" : "a", "materialID" : 5},
+        ):
+        with pytest.raises(ValueError):
+            EncodePoses([message])
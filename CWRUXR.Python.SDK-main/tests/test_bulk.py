@@ -0,0 +1,92 @@
+import threading
+
+import orjson
+import pytest
+
+from cwruxr_sdk.bulk import Chunks, SendChunked
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.local_server import LocalServer
+from cwruxr_sdk.object_message import PrimitiveMessage
+from cwruxr_sdk.transport import InMemoryTransport
+
+def Items(count : int) -> list[dict]:
+    return [{"id" : "item" + str(i), "value" : i} for i in range(count)]
+
+def test_chunks_obey_max_items():
+    chunks = list(Chunks(Items(10), maxItems = 3, maxBytes = 1 << 20))
+    assert [len(ids) for _, ids in chunks] == [3, 3, 3, 1]
+    assert [item for body, _ in chunks for item in orjson.loads(body)] == Items(10)
+    assert [id for _, ids in chunks for id in ids] == ["item" + str(i) for i in range(10)]
+
+def test_chunks_obey_max_bytes():
+    items = Items(50)
+    itemBytes = len(orjson.dumps(items[0]))
+    maxBytes = itemBytes * 4 + 5
+    chunks = list(Chunks(items, maxItems = 1000, maxBytes = maxBytes))
+    assert all(len(body) <= maxBytes for body, _ in chunks)
+    assert all(len(ids) >= 3 for _, ids in chunks[:-1])
+    assert [item for body, _ in chunks for item in orjson.loads(body)] == items
+
+def test_oversized_item_is_sent_alone():
+    items = Items(2) + [{"id" : "big", "value" : "x" * 500}] + Items(2)
+    chunks = list(Chunks(items, maxItems = 1000, maxBytes = 100))
+    assert ["big"] in [ids for _, ids in chunks]
+    big = next(body for body, ids in chunks if ids == ["big"])
+    assert len(big) > 100
+    assert all(len(body) <= 100 for body, ids in chunks if ids != ["big"])
+    assert [item for body, _ in chunks for item in orjson.loads(body)] == items
+
+def test_chunks_of_ids():
+    chunks = list(Chunks(["a", "b", "c"], maxItems = 2, maxBytes = 1 << 20))
+    assert chunks == [(b'["a","b"]', ["a", "b"]), (b'["c"]', ["c"])]
+
+def test_empty_items():
+    assert list(Chunks([], maxItems = 10, maxBytes = 100)) == []
+    assert len(SendChunked(lambda body : None, [])) == 0
+
+@pytest.mark.parametrize("parallelism", [1, 4])
+def test_partial_failures_are_kept_apart(parallelism : int):
+    lock = threading.Lock()
+    sent = []
+
+    def Send(body : bytes):
+        items = orjson.loads(body)
+        with lock:
+            sent.append(items)
+        if any(item["value"] % 7 == 3 for item in items):
+            raise Exception("Bad chunk")
+        return len(items)
+
+    result = SendChunked(Send, Items(20), maxItems = 4, parallelism = parallelism)
+    assert len(result) == 5
+    assert [chunk.index for chunk in result.chunks] == [0, 1, 2, 3, 4]
+    # Items 3, 10 and 17 are in chunks 0, 2 and 4.
+    assert [chunk.ok for chunk in result.chunks] == [False, True, False, True, False]
+    assert not result.ok
+    assert [chunk.index for chunk in result.failures] == [0, 2, 4]
+    assert result.failedIds == ["item" + str(i) for i in (0, 1, 2, 3, 8, 9, 10, 11, 16, 17, 18, 19)]
+    assert all(chunk.response == 4 and chunk.error == None for chunk in result.chunks if chunk.ok)
+    assert all(str(chunk.error) == "Bad chunk" and chunk.response == None for chunk in result.failures)
+    # Every chunk is sent, however many fail.
+    assert sorted(item["value"] for items in sent for item in items) == list(range(20))
+    with pytest.raises(Exception, match = "Bad chunk"):
+        result.Raise()
+
+def test_all_ok():
+    result = SendChunked(lambda body : "ok", Items(5), maxItems = 2)
+    assert result.ok and result.failures == [] and result.failedIds == []
+    result.Raise()
+
+def test_client_chunked_against_local_server():
+    server = LocalServer(maxBodyBytes = 2000)
+    client = Client("http://localhost/api/v2/", "room", "anchor", transport = InMemoryTransport(server))
+    messages = [PrimitiveMessage("cube" + str(i)) for i in range(100)]
+    # The body limit fails the oversized chunk alone.
+    messages.insert(50, PrimitiveMessage("x" * 3000))
+    result = client.PostObjectBulkChunked(messages, maxItems = 10, maxBytes = 1500, parallelism = 4)
+    assert result.failedIds == ["x" * 3000]
+    assert len(client.GetAllObjects()) == 100
+
+    result = client.DeleteObjectBulkChunked(["cube" + str(i) for i in range(100)], maxItems = 30)
+    assert result.ok and len(result) == 4
+    assert client.GetAllObjects() == []
@@ -0,0 +1,164 @@
+import pytest
+
+from cwruxr_sdk import caching_client
+from cwruxr_sdk.anchor_message import AnchorMessage
+from cwruxr_sdk.caching_client import CachingClient
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import Color
+from cwruxr_sdk.local_server import LocalServer
+from cwruxr_sdk.material_message import UnlitMaterialMessage, UnlitParameters
+from cwruxr_sdk.object_message import ObjectMessage, PrimitiveMessage
+from cwruxr_sdk.transport import InMemoryTransport
+
+ENDPOINT = "http://localhost/api/v2/"
+
+class Clock:
+    """
+    Stands in for time.monotonic, so entries expire without waiting.
+    """
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(caching_client.time, "monotonic", clock)
+    return clock
+
+@pytest.fixture
+def server() -> LocalServer:
+    server = LocalServer()
+    # Another writer in the same room and anchor, which the cache cannot see.
+    other = Client(ENDPOINT, "room", "anchor", transport = InMemoryTransport(server))
+    other.PostObjectBulk([PrimitiveMessage(id, active = True) for id in ("a", "b", "c")])
+    other.PostMaterial(UnlitMaterialMessage("red", Color(1, 0, 0, 1), UnlitParameters()))
+    other.PostAnchor(AnchorMessage("anchor", []))
+    server.requests = 0
+    return server
+
+def MakeClient(server : LocalServer, **kwargs) -> CachingClient:
+    return CachingClient(ENDPOINT, "room", "anchor", transport = InMemoryTransport(server), **kwargs)
+
+def Other(server : LocalServer) -> Client:
+    return Client(ENDPOINT, "room", "anchor", transport = InMemoryTransport(server))
+
+def test_hits_within_ttl(server : LocalServer, clock : Clock):
+    client = MakeClient(server, ttl = 5)
+    assert client.GetObject("a")["active"] == True
+    assert client.GetObject("a")["active"] == True
+    assert client.GetMaterial("red")["id"] == "red"
+    assert client.GetMaterial("red")["id"] == "red"
+    assert server.requests == 2
+    stats = client.CacheStats()
+    assert (stats["hits"], stats["misses"]) == (2, 2)
+
+def test_stale_entries_are_revalidated(server : LocalServer, clock : Clock):
+    client = MakeClient(server, ttl = 5)
+    client.GetObject("a")
+    clock.now += 6
+    assert client.GetObject("a")["active"] == True
+    assert client.CacheStats()["revalidations"] == 1
+    assert server.requests == 2
+
+    # A change made elsewhere is only seen once the entry goes stale.
+    Other(server).PostObject(ObjectMessage(id = "a", active = False))
+    assert client.GetObject("a")["active"] == True
+    clock.now += 6
+    assert client.GetObject("a")["active"] == False
+    assert client.CacheStats()["misses"] == 2
+
+def test_lru_eviction(server : LocalServer, clock : Clock):
+    client = MakeClient(server, ttl = None, maxEntries = 2)
+    client.GetObject("a")
+    client.GetObject("b")
+    client.GetObject("a")
+    client.GetObject("c")
+    stats = client.CacheStats()
+    assert (stats["entries"], stats["evictions"]) == (2, 1)
+
+    requests = server.requests
+    client.GetObject("a")
+    client.GetObject("c")
+    assert server.requests == requests
+    client.GetObject("b")
+    assert server.requests == requests + 1
+
+@pytest.mark.parametrize("write", [
+    lambda client : client.PostObject(ObjectMessage(id = "a", active = False)),
+    lambda client : client.PostObjectBulk([ObjectMessage(id = "a", active = False)]),
+    lambda client : client.PostObjectBulk(b'[{"id":"a","active":false}]'),
+    lambda client : client.PostObjectBulkChunked([ObjectMessage(id = "a", active = False)]),
+    lambda client : client.PostObjectPoses([ObjectMessage(id = "a", active = False)]),
+])
+def test_object_posts_invalidate(server : LocalServer, clock : Clock, write):
+    client = MakeClient(server, ttl = None)
+    assert client.GetObject("a")["active"] == True
+    write(client)
+    assert client.GetObject("a")["active"] == False
+
+@pytest.mark.parametrize("delete", [
+    lambda client : client.DeleteObject("a"),
+    lambda client : client.DeleteObjectBulk(["a"]),
+    lambda client : client.DeleteObjectBulkChunked(["a"]),
+    lambda client : client.DeleteAllObjects(),
+    lambda client : client.DeleteAnchor("anchor"),
+    lambda client : client.DeleteAllAnchors(),
+])
+def test_object_deletes_invalidate(server : LocalServer, clock : Clock, delete):
+    client = MakeClient(server, ttl = None)
+    client.GetObject("a")
+    delete(client)
+    with pytest.raises(Exception, match = "Not Found"):
+        client.GetObject("a")
+
+def test_material_and_anchor_writes_invalidate(server : LocalServer, clock : Clock):
+    client = MakeClient(server, ttl = None)
+    client.GetMaterial("red")
+    client.PostMaterial(UnlitMaterialMessage("red", Color(0, 1, 0, 1), UnlitParameters()))
+    assert client.GetMaterial("red")["color"]["g"] == 1
+    client.PostMaterialBulk([UnlitMaterialMessage("red", Color(0, 0, 1, 1), UnlitParameters())])
+    assert client.GetMaterial("red")["color"]["b"] == 1
+    client.DeleteMaterial("red")
+    with pytest.raises(Exception, match = "Not Found"):
+        client.GetMaterial("red")
+
+    client.GetAnchor("anchor")
+    client.PostAnchor(AnchorMessage("anchor", [{"id" : 0, "asaGuid" : "guid"}]))
+    assert client.GetAnchor("anchor")["asaAnchors"] == [{"id" : 0, "asaGuid" : "guid"}]
+
+def test_failed_write_still_invalidates(server : LocalServer, clock : Clock):
+    client = MakeClient(server, ttl = None)
+    client.GetObject("a")
+    # The server may have applied a write whose response was lost, so the entry cannot be trusted either way.
+    Other(server).PostObject(ObjectMessage(id = "a", active = False))
+    server.errorRate = 1
+    with pytest.raises(Exception):
+        client.PostObject(ObjectMessage(id = "a", active = False))
+    server.errorRate = 0
+    assert client.GetObject("a")["active"] == False
+
+class _WriteDuringGet(InMemoryTransport):
+    """
+    Answers the first GET, then runs a write before handing the old response back, as when a write lands while a read is in flight.
+    """
+    def __init__(self, server : LocalServer):
+        super().__init__(server)
+        self.write = None
+
+    def Request(self, method, url, data = None, headers = None, stream = False):
+        response = super().Request(method, url, data, headers, stream)
+        if method == "GET" and self.write != None:
+            write, self.write = self.write, None
+            write()
+        return response
+
+def test_read_in_flight_during_write_is_not_cached(server : LocalServer, clock : Clock):
+    transport = _WriteDuringGet(server)
+    client = CachingClient(ENDPOINT, "room", "anchor", ttl = None, transport = transport)
+    transport.write = lambda : client.PostObject(ObjectMessage(id = "a", active = False))
+    # The read returns what the server held when it answered.
+    assert client.GetObject("a")["active"] == True
+    assert client.GetObject("a")["active"] == False
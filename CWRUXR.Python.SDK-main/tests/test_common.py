@@ -0,0 +1,121 @@
+import pytest
+
+from cwruxr_sdk import common
+from cwruxr_sdk.anchor_message import AnchorMessage, ASAAnchor
+from cwruxr_sdk.common import Color, EncodeWithoutNone, Euler, Pose, Quaternion, RegisterEncoder, ToJson, Vector3
+from cwruxr_sdk.material_message import MRTKMaterialMessage, MRTKStandardParameters, UnlitMaterialMessage, UnlitParameters
+from cwruxr_sdk.object_message import (
+    ContainerMessage, Interpolation, LineMessage, LineParameters, ObjectMessage, PrimitiveMessage, PRIMITIVE_CUBE,
+    PRIMITIVE_SPHERE, TextMessage, TextParameters,
+)
+
+# Messages and the json the SDK wrote for them before the value types changed, which must stay byte for byte the same.
+BASELINE = [
+    (
+        PrimitiveMessage(id = "cube", source = PRIMITIVE_CUBE, materialID = "red",
+            pose = Pose(Vector3(1.5, -2, 0.1), Quaternion(0, .7071068, 0, .7071068), scale = Vector3(.1, .1, .1))),
+        b'{"id":"cube","type":"Primitive","source":"Cube","materialID":"red","pose":{"position":{"x":1.5,"y":-2,"z":0.1},'
+        b'"rotation":{"x":0,"y":0.7071068,"z":0,"w":0.7071068},"scale":{"x":0.1,"y":0.1,"z":0.1}}}',
+    ),
+    (
+        PrimitiveMessage(id = "sphere", source = PRIMITIVE_SPHERE, pose = Pose(euler = Vector3(0, 90, 0)), active = False),
+        b'{"id":"sphere","type":"Primitive","source":"Sphere","active":false,"pose":{"eulerRotation":{"x":0,"y":90,"z":0}}}',
+    ),
+    (
+        ObjectMessage(id = "partial", pose = Pose(Vector3(0, 1, 0))),
+        b'{"id":"partial","pose":{"position":{"x":0,"y":1,"z":0}}}',
+    ),
+    (
+        ObjectMessage(id = "moving", pose = Pose(Vector3(1e-7, 123456.789, -0.0), Euler(Vector3(0, 1.5, 0))),
+            interpolation = Interpolation(True, 15, 10, 15), isManipulationOn = True, walkable = False),
+        b'{"id":"moving","pose":{"position":{"x":1e-7,"y":123456.789,"z":-0.0},'
+        b'"rotation":{"x":0.0,"y":0.6816387600233341,"z":0.0,"w":0.7316888688738209}},"isManipulationOn":true,"walkable":false,'
+        b'"interpolation":{"on":true,"moveSpeed":15,"rotateSpeed":10,"scaleSpeed":15}}',
+    ),
+    (
+        TextMessage(id = "label", pose = Pose(Vector3(0, 2, 0)), params = TextParameters("hi", 3, 1, .5, Color(64, 64, 64, 255))),
+        b'{"id":"label","type":"Text","pose":{"position":{"x":0,"y":2,"z":0}},'
+        b'"parameters":{"text":"hi","fontSize":3,"width":1,"height":0.5,"color":{"r":64,"g":64,"b":64,"a":255}}}',
+    ),
+    (
+        LineMessage(id = "line", params = LineParameters("cube", "sphere")),
+        b'{"id":"line","type":"Line","isManipulationOn":false,"parameters":{"startId":"cube","endId":"sphere","width":0.01}}',
+    ),
+    (
+        ContainerMessage(id = "box", parentID = "root", pose = Pose()),
+        b'{"id":"box","parentID":"root","type":"Container","pose":{}}',
+    ),
+]
+
+def test_object_messages_match_baseline():
+    for message, expected in BASELINE:
+        assert ToJson(message) == expected
+    # Serializing again, and as one list, gives the same bytes.
+    messages = [message for message, _ in BASELINE]
+    assert ToJson(messages) == b"[" + b",".join(expected for _, expected in BASELINE) + b"]"
+    assert ToJson(messages) == ToJson(messages)
+
+def test_pose_components_read_as_none():
+    pose = Pose(Vector3(1, 2, 3))
+    assert pose.rotation is None and pose.eulerRotation is None and pose.scale is None
+    pose.scale = Vector3(2, 2, 2)
+    assert ToJson(pose) == b'{"position":{"x":1,"y":2,"z":3},"scale":{"x":2,"y":2,"z":2}}'
+
+class _Base:
+    def __init__(self, value = None):
+        self.value = value
+
+class _Child(_Base):
+    pass
+
+class _Grandchild(_Child):
+    pass
+
+@pytest.fixture
+def registry():
+    """
+    Removes the test classes from the registry afterwards, so other tests serialize as before.
+    """
+    yield
+    for cls in (_Base, _Child, _Grandchild):
+        common._ENCODERS.pop(cls, None)
+    common._RESOLVED.clear()
+
+def test_unregistered_classes_send_their_dict(registry):
+    assert ToJson(_Child(1)) == b'{"value":1}'
+    assert ToJson(_Child()) == b'{"value":null}'
+
+def test_subclasses_use_the_closest_registered_encoder(registry):
+    RegisterEncoder(_Base, lambda obj : {"base" : obj.value})
+    RegisterEncoder(_Child, lambda obj : {"child" : obj.value})
+    assert ToJson([_Base(1), _Child(2), _Grandchild(3)]) == b'[{"base":1},{"child":2},{"child":3}]'
+
+def test_registering_clears_resolved_encoders(registry):
+    # Serializing resolves and caches the encoder of each class.
+    assert ToJson(_Grandchild(3)) == b'{"value":3}'
+    RegisterEncoder(_Base, lambda obj : [obj.value])
+    assert ToJson(_Grandchild(3)) == b'[3]'
+    RegisterEncoder(_Grandchild, None)
+    assert ToJson([_Child(2), _Grandchild(3)]) == b'[[2],{"value":3}]'
+
+def test_encode_without_none(registry):
+    obj = _Base()
+    obj.zero = 0
+    obj.empty = ""
+    obj.off = False
+    assert EncodeWithoutNone(obj) == {"zero" : 0, "empty" : "", "off" : False}
+    # Objects without None values are returned as they are.
+    full = _Base(1)
+    assert EncodeWithoutNone(full) is full.__dict__
+    RegisterEncoder(_Child, EncodeWithoutNone)
+    assert ToJson([_Base(), _Child(), _Grandchild(), _Grandchild(5)]) == b'[{"value":null},{},{},{"value":5}]'
+
+def test_none_fields_are_left_out():
+    # These were sent as null before, and are now left out of the json.
+    assert ToJson(UnlitMaterialMessage("red", Color(1, 0, 0, 1), UnlitParameters())) == (
+        b'{"id":"red","shader":"Unlit","color":{"r":1,"g":0,"b":0,"a":1},"parameters":{}}')
+    assert ToJson(MRTKMaterialMessage("m", Color(1, 0, 0, 1), MRTKStandardParameters())) == (
+        b'{"id":"m","shader":"MrtkStandard","color":{"r":1,"g":0,"b":0,"a":1},"parameters":{}}')
+    assert ToJson(AnchorMessage("anchor", [ASAAnchor(0), ASAAnchor(1, "guid")])) == (
+        b'{"id":"anchor","asaAnchors":[{"id":0},{"id":1,"asaGuid":"guid"}]}')
+    assert ToJson(LineParameters("cube", "sphere", width = None)) == b'{"startId":"cube","endId":"sphere"}'
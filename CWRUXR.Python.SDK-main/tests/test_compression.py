@@ -0,0 +1,43 @@
+import pytest
+import requests.utils
+
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import ToJson
+from cwruxr_sdk.compression import GZIP, ZSTD, AcceptEncoding, Available, Compress, Decompress
+from cwruxr_sdk.local_server import LocalServer
+from cwruxr_sdk.object_message import PrimitiveMessage
+from cwruxr_sdk.transport import InMemoryTransport
+
+def Codecs(header : str) -> set[str]:
+    return {codec.strip() for codec in header.split(",")}
+
+def test_accept_encoding_keeps_the_requests_default():
+    accepted = Codecs(AcceptEncoding())
+    assert {"gzip", "deflate"} <= accepted
+    assert Codecs(requests.utils.DEFAULT_ACCEPT_ENCODING) <= accepted
+    if ZSTD in accepted:
+        assert AcceptEncoding().startswith(ZSTD)
+
+@pytest.mark.parametrize("codec", [GZIP, ZSTD])
+def test_round_trip(codec : str):
+    if not Available(codec):
+        pytest.skip(codec + " is not installed")
+    data = b'{"id":"cube"}' * 1000
+    compressed = Compress(data, codec)
+    assert len(compressed) < len(data)
+    assert Decompress(compressed, codec) == data
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        Compress(b"", "br")
+
+def test_client_against_local_server():
+    server = LocalServer(compressAbove = 1000)
+    client = Client("http://localhost/api/v2/", "room", "anchor", transport = InMemoryTransport(server), compression = GZIP, compressionThreshold = 1000)
+    messages = [PrimitiveMessage("cube" + str(i)) for i in range(100)]
+    size = len(ToJson(messages))
+    client.PostObjectBulk(messages)
+    assert server.bytesReceived < size / 2
+    assert len(client.GetAllObjects()) == 100
+    # The response was compressed too, with a codec from the client's Accept-Encoding.
+    assert server.bytesSent - 2 < size / 2
@@ -0,0 +1,105 @@
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import Color, Pose, Quaternion, Vector3
+from cwruxr_sdk.delta import Diff, DiffList
+from cwruxr_sdk.local_server import LocalServer
+from cwruxr_sdk.material_message import UnlitMaterialMessage, UnlitParameters
+from cwruxr_sdk.object_message import Interpolation, PrimitiveMessage
+from cwruxr_sdk.precision import PrecisionProfile
+from cwruxr_sdk.transport import InMemoryTransport
+
+ENDPOINT = "http://localhost/api/v2/"
+
+def MakeCube(x : float = 0, active : bool = True) -> PrimitiveMessage:
+    return PrimitiveMessage(
+        id = "cube",
+        active = active,
+        pose = Pose(Vector3(x, 1, 2), Quaternion(0, 0, 0, 1), scale = Vector3(1, 1, 1)),
+        interpolation = Interpolation(),
+    )
+
+def test_vectors_are_sent_whole():
+    assert Diff(MakeCube(), MakeCube(x = 5)) == {"id" : "cube", "pose" : {"position" : {"x" : 5, "y" : 1, "z" : 2}}}
+
+    old = UnlitMaterialMessage("red", Color(1, 0, 0, 1), UnlitParameters())
+    new = UnlitMaterialMessage("red", Color(1, 0, 0, .5), UnlitParameters())
+    assert Diff(old, new) == {"id" : "red", "shader" : "Unlit", "color" : {"r" : 1, "g" : 0, "b" : 0, "a" : .5}}
+
+def test_nested_fields_are_diffed():
+    old = MakeCube()
+    new = MakeCube(active = False)
+    new.interpolation = Interpolation(moveSpeed = 30)
+    assert Diff(old, new) == {"id" : "cube", "active" : False, "interpolation" : {"moveSpeed" : 30}}
+
+def test_id_is_always_kept():
+    assert Diff({"id" : "cube", "active" : True}, {"id" : "cube", "active" : False}) == {"id" : "cube", "active" : False}
+    # The id is kept first, though it did not change.
+    patch = Diff(MakeCube(), MakeCube(active = False))
+    assert list(patch) == ["id", "active"]
+
+def test_unchanged_returns_none():
+    assert Diff(MakeCube(), MakeCube()) == None
+    assert Diff({"id" : "cube", "pose" : {"position" : {"x" : 1}}}, {"id" : "cube", "pose" : {"position" : {"x" : 1}}}) == None
+
+def test_precision_hides_small_changes():
+    profile = PrecisionProfile(position = 2)
+    assert Diff(MakeCube(), MakeCube(x = .001), profile) == None
+    assert Diff(MakeCube(), MakeCube(x = .01), profile) == {"id" : "cube", "pose" : {"position" : {"x" : .01, "y" : 1, "z" : 2}}}
+
+def test_removed_fields_are_left_unchanged():
+    old = MakeCube()
+    new = PrimitiveMessage(id = "cube", active = True, pose = Pose(Vector3(0, 1, 2)))
+    # Nothing was added or changed, and the api cannot unset the rotation, scale or interpolation, so nothing is sent.
+    assert Diff(old, new) == None
+    new = PrimitiveMessage(id = "cube", active = True, pose = Pose(Vector3(3, 1, 2)))
+    assert Diff(old, new) == {"id" : "cube", "pose" : {"position" : {"x" : 3, "y" : 1, "z" : 2}}}
+
+def test_diff_list():
+    previous = {"a" : MakeCube(), "b" : {"id" : "b", "active" : True}}
+    a = MakeCube(x = 1)
+    a.id = "a"
+    messages = [a, {"id" : "b", "active" : True}, {"id" : "c", "active" : False}]
+    assert DiffList(messages, previous) == [
+        {"id" : "a", "pose" : {"position" : {"x" : 1, "y" : 1, "z" : 2}}},
+        {"id" : "c", "active" : False},
+    ]
+
+def test_client_posts_only_changes():
+    server = LocalServer()
+    client = Client(ENDPOINT, "room", "anchor", transport = InMemoryTransport(server))
+    client.PostObject(MakeCube())
+    assert client.PostObject(MakeCube(), previous = MakeCube()) == None
+    assert server.requests == 1
+
+    received = server.bytesReceived
+    client.PostObject(MakeCube(x = 5, active = False), previous = MakeCube())
+    assert server.bytesReceived - received == len(b'{"id":"cube","active":false,"pose":{"position":{"x":5,"y":1,"z":2}}}')
+    stored = client.GetObject("cube")
+    assert stored["active"] == False
+    # The merge patch keeps the fields the partial message left out.
+    assert stored["pose"] == {
+        "position" : {"x" : 5, "y" : 1, "z" : 2},
+        "rotation" : {"x" : 0, "y" : 0, "z" : 0, "w" : 1},
+        "scale" : {"x" : 1, "y" : 1, "z" : 1},
+    }
+    assert stored["source"] == "Cube" and stored["interpolation"]["on"] == True
+
+def test_client_bulk_posts_only_changes():
+    server = LocalServer()
+    client = Client(ENDPOINT, "room", "anchor", transport = InMemoryTransport(server))
+    materials = [UnlitMaterialMessage(str(i), Color(1, 0, 0, 1), UnlitParameters()) for i in range(3)]
+    client.PostMaterialBulk(materials)
+    previous = {material.id : material for material in materials}
+    assert client.PostMaterialBulk(materials, previous = previous) == None
+
+    changed = [UnlitMaterialMessage(str(i), Color(1, 0, 0, 1), UnlitParameters()) for i in range(3)]
+    changed[1].color = Color(0, 1, 0, 1)
+    received = server.bytesReceived
+    client.PostMaterialBulk(changed, previous = previous)
+    assert server.bytesReceived - received == len(b'[{"id":"1","shader":"Unlit","color":{"r":0,"g":1,"b":0,"a":1}}]')
+    assert server.Room("room").materials["1"]["color"] == {"r" : 0, "g" : 1, "b" : 0, "a" : 1}
+    assert server.Room("room").materials["0"]["color"] == {"r" : 1, "g" : 0, "b" : 0, "a" : 1}
+
+    cubes = [MakeCube(x = i) for i in range(2)]
+    cubes[1].id = "other"
+    client.PostObjectBulk(cubes)
+    assert client.PostObjectBulk(cubes, previous = {"cube" : cubes[0], "other" : cubes[1]}) == None
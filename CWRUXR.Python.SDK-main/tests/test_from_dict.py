@@ -0,0 +1,38 @@
+from cwruxr_sdk.common import Color, ToJson
+from cwruxr_sdk.material_message import MaterialMessage, MRTKMaterialMessage, MRTKStandardParameters
+from cwruxr_sdk.object_message import Interpolation, ObjectMessage, PrimitiveMessage, TextMessage, TextParameters
+
+def test_object_types():
+    message = ObjectMessage.FromDict({"id" : "a", "type" : "Primitive", "pose" : {"position" : {"x" : 1, "y" : 2, "z" : 3}}})
+    assert isinstance(message, PrimitiveMessage)
+    assert message.pose.position.x == 1 and message.pose.rotation is None
+    text = ObjectMessage.FromDict({"id" : "t", "type" : "text", "parameters" : {"text" : "hi"}})
+    assert isinstance(text, TextMessage) and isinstance(text.parameters, TextParameters)
+    assert type(ObjectMessage.FromDict({"id" : "u", "type" : "Unknown"})) is ObjectMessage
+
+def test_partial_interpolation_takes_defaults():
+    message = ObjectMessage.FromDict({"id" : "a", "interpolation" : {"on" : False, "moveSpeed" : 30, "rotateSpeed" : None}})
+    interpolation = message.interpolation
+    assert isinstance(interpolation, Interpolation)
+    assert (interpolation.on, interpolation.moveSpeed, interpolation.rotateSpeed, interpolation.scaleSpeed) == (False, 30, 10, 15)
+    assert ToJson(Interpolation.FromDict({})) == ToJson(Interpolation())
+
+def test_full_interpolation_is_kept():
+    data = {"on" : True, "moveSpeed" : 1, "rotateSpeed" : 2, "scaleSpeed" : 3}
+    assert Interpolation.FromDict(data).__dict__ == data
+
+def test_mrtk_parameters_are_coerced():
+    material = MaterialMessage.FromDict({
+        "id" : "m",
+        "shader" : "MrtkStandard",
+        "color" : {"r" : 1, "g" : 0, "b" : 0, "a" : 1},
+        "parameters" : {"metallic" : 1, "smoothness" : 0, "rimLightPower" : 2, "triplanar" : 1, "emissiveColor" : {"r" : 0, "g" : 1, "b" : 0, "a" : 1}},
+    })
+    assert isinstance(material, MRTKMaterialMessage)
+    parameters = material.parameters
+    assert isinstance(parameters, MRTKStandardParameters)
+    assert type(parameters.metallic) is float and type(parameters.smoothness) is float and type(parameters.rimLightPower) is float
+    assert parameters.triplanar is True
+    assert isinstance(parameters.emissiveColor, Color)
+    # Fields the dictionary leaves out stay unset, so they are not sent when the material is posted back.
+    assert not hasattr(parameters, "rimLightColor") and not hasattr(parameters, "texture")
@@ -0,0 +1,167 @@
+import pytest
+
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.compression import GZIP
+from cwruxr_sdk.instrumentation import CallbackInstrument, LATENCY_BUCKETS, LatencyHistogram, MetricsCollector, RequestRecord
+from cwruxr_sdk.local_server import LocalServer
+from cwruxr_sdk.object_message import PrimitiveMessage
+from cwruxr_sdk.transport import InMemoryTransport
+
+ENDPOINT = "http://localhost/api/v2/"
+
+class _FailingTransport(InMemoryTransport):
+    def Request(self, method, url, data = None, headers = None, stream = False):
+        raise ConnectionError("refused")
+
+def Record(method : str, endpoint : str, seconds : float, status = 200, requestBytes : int = 0, responseBytes : int = 0) -> RequestRecord:
+    record = RequestRecord(method, endpoint, ENDPOINT + endpoint)
+    record.seconds = seconds
+    record.status = status
+    record.requestBytes = requestBytes
+    record.responseBytes = responseBytes
+    return record
+
+def Bucket(seconds : float) -> tuple[float, float]:
+    """
+    The bounds of the bucket a latency is counted in.
+    """
+    for i, bound in enumerate(LATENCY_BUCKETS):
+        if seconds <= bound:
+            return (LATENCY_BUCKETS[i - 1] if i > 0 else 0.0, bound)
+
+def test_percentiles_fall_in_the_right_bucket():
+    histogram = LatencyHistogram()
+    assert histogram.Percentile(50) == None
+    for i in range(1, 101):
+        histogram.Add(i / 1000)
+    assert histogram.count == 100
+    assert histogram.sum == pytest.approx(5.05)
+    assert histogram.max == .1
+    for percentile in (1, 50, 95, 99):
+        low, high = Bucket(percentile / 1000)
+        assert low <= histogram.Percentile(percentile) <= high
+    assert histogram.Percentile(100) == .1
+
+def test_percentiles_of_one_value_do_not_pass_the_max():
+    histogram = LatencyHistogram()
+    for _ in range(10):
+        histogram.Add(.0123)
+    low, _ = Bucket(.0123)
+    assert all(low <= histogram.Percentile(percentile) <= .0123 for percentile in (0, 50, 99, 100))
+
+def test_latencies_beyond_the_buckets_report_the_max():
+    histogram = LatencyHistogram()
+    histogram.Add(.001)
+    histogram.Add(LATENCY_BUCKETS[-1] * 2)
+    assert histogram.counts[-1] == 1
+    assert histogram.Percentile(99) == LATENCY_BUCKETS[-1] * 2
+    assert histogram.Percentile(10) <= .001
+
+def test_collector_counts_client_requests():
+    server = LocalServer()
+    client = Client(ENDPOINT, "room", "anchor", transport = InMemoryTransport(server))
+    collector = client.AddInstrument(MetricsCollector())
+    client.PostObject(PrimitiveMessage("cube"))
+    client.PostObject(PrimitiveMessage("sphere"))
+    client.GetObject("cube")
+    with pytest.raises(Exception):
+        client.GetObject("missing")
+
+    snapshot = collector.Snapshot()
+    assert list(snapshot) == ["GET object/{id}", "POST object/"]
+    posts = snapshot["POST object/"]
+    assert posts["requests"] == 2 and posts["errors"] == 0
+    assert posts["requestBytes"] == server.bytesReceived
+    assert posts["serializeSeconds"] > 0 and posts["compressSeconds"] == 0
+    assert posts["statuses"] == {200 : 2}
+    assert 0 < posts["latencyP50"] <= posts["latencyP99"] <= posts["latencyMax"]
+    gets = snapshot["GET object/{id}"]
+    assert gets["requests"] == 2 and gets["errors"] == 1
+    assert gets["statuses"] == {200 : 1, 404 : 1}
+    assert gets["responseBytes"] == server.bytesSent - posts["responseBytes"]
+
+    client.RemoveInstrument(collector)
+    client.PostObject(PrimitiveMessage("cube"))
+    assert collector.Snapshot()["POST object/"]["requests"] == 2
+
+def test_collector_counts_compression_and_transport_errors():
+    client = Client(ENDPOINT, "room", "anchor", transport = _FailingTransport(), compression = GZIP, compressionThreshold = 0)
+    collector = client.AddInstrument(MetricsCollector())
+    with pytest.raises(ConnectionError):
+        client.PostObject(PrimitiveMessage("cube"))
+    metrics = collector.Snapshot()["POST object/"]
+    assert metrics["errors"] == 1
+    assert metrics["statuses"] == {"ConnectionError" : 1}
+    assert metrics["compressSeconds"] > 0
+    assert metrics["responseBytes"] == 0
+
+def test_export_and_reset():
+    collector = MetricsCollector()
+    collector.AfterRequest(Record("POST", "object/", .01))
+    exported = []
+    collector.Export(exported.append)
+    assert exported == [collector.Snapshot()]
+    assert exported[0]["POST object/"]["latencyMean"] == .01
+    collector.Reset()
+    assert collector.Snapshot() == {}
+
+def test_callback_instrument():
+    seen = []
+    client = Client(ENDPOINT, "room", "anchor", transport = InMemoryTransport())
+    client.AddInstrument(CallbackInstrument(
+        before = lambda record : seen.append(("before", record.status, record.requestBytes)),
+        after = lambda record : seen.append(("after", record.status, record.ok)),
+    ))
+    client.PostObject(PrimitiveMessage("cube"))
+    assert seen[0][0] == "before" and seen[0][1] == None and seen[0][2] > 0
+    assert seen[1] == ("after", 200, True)
+
+def Samples(text : str) -> dict[str, str]:
+    """
+    The samples of a Prometheus exposition, by name and labels.
+    """
+    samples = {}
+    for line in text.splitlines():
+        if not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = value
+    return samples
+
+def test_prometheus_format():
+    collector = MetricsCollector()
+    collector.AfterRequest(Record("POST", "object/", .002, requestBytes = 100, responseBytes = 2))
+    collector.AfterRequest(Record("POST", "object/", .02, status = 503, requestBytes = 50))
+    collector.AfterRequest(Record("GET", "object/{id}", .5, responseBytes = 10))
+    text = collector.ToPrometheus(prefix = "test")
+    assert text.endswith("\n")
+
+    lines = text.splitlines()
+    assert "# TYPE test_requests_total counter" in lines
+    assert "# HELP test_request_seconds Request latency." in lines
+    assert "# TYPE test_request_seconds histogram" in lines
+    samples = Samples(text)
+    post = 'method="POST",endpoint="object/"'
+    get = 'method="GET",endpoint="object/{id}"'
+    assert samples["test_requests_total{" + post + "}"] == "2"
+    assert samples["test_errors_total{" + post + "}"] == "1"
+    assert samples["test_request_bytes_total{" + post + "}"] == "150"
+    assert samples["test_response_bytes_total{" + get + "}"] == "10"
+    assert samples["test_request_seconds_count{" + post + "}"] == "2"
+    assert float(samples["test_request_seconds_sum{" + post + "}"]) == pytest.approx(.022)
+
+    # Buckets are cumulative, end at the count, and are ordered by their bound.
+    prefix = "test_request_seconds_bucket{" + post + ',le="'
+    buckets = [(key[len(prefix):-2], int(value)) for key, value in samples.items() if key.startswith(prefix)]
+    assert len(buckets) == len(LATENCY_BUCKETS) + 1
+    assert buckets[-1] == ("+Inf", 2)
+    bounds = [float(bound) for bound, _ in buckets[:-1]]
+    assert bounds == sorted(bounds)
+    counts = [count for _, count in buckets]
+    assert counts == sorted(counts)
+    assert counts[[i for i, bound in enumerate(bounds) if bound >= .002][0]] == 1
+    assert counts[[i for i, bound in enumerate(bounds) if bound >= .02][0]] == 2
+
+def test_prometheus_without_requests():
+    text = MetricsCollector().ToPrometheus()
+    assert "# TYPE cwruxr_client_requests_total counter" in text
+    assert Samples(text) == {}
@@ -0,0 +1,58 @@
+import orjson
+import pytest
+
+from cwruxr_sdk.json_stream import IterJsonArray
+
+def Chunks(data : bytes, size : int) -> list[bytes]:
+    return [data[start:start + size] for start in range(0, len(data), size)]
+
+def Decode(data : bytes, size : int) -> list:
+    return list(IterJsonArray(Chunks(data, size)))
+
+TEXT = (
+    b' [ {"id":"a,b","text":"[not] {an} array"},'
+    b'{"id":"quote\\"d","path":"C:\\\\dir\\\\","nested":{"list":[1,[2,{"x":3}]],"empty":{}}},'
+    b'"\\\\\\"",'
+    b'"\xc3\xa4\xe7\x90\x83\\u00e4",'
+    b'[], {}, 1.5e3, -2, true, false, null ]'
+)
+
+@pytest.mark.parametrize("size", range(1, 24))
+def test_split_at_every_boundary(size : int):
+    assert Decode(TEXT, size) == orjson.loads(TEXT)
+
+def test_whole_body():
+    assert Decode(TEXT, len(TEXT)) == orjson.loads(TEXT)
+
+def test_empty_arrays():
+    assert Decode(b"[]", 1) == []
+    assert Decode(b"  [ \n ]  ", 2) == []
+
+def test_empty_chunks():
+    assert list(IterJsonArray([b"", b"[", b"", b"1", b"", b",2]", b""])) == [1, 2]
+
+def test_yields_before_the_end():
+    def Source():
+        yield b'[{"id":"a"},{"id":"b"},'
+        raise AssertionError("Read past the complete elements.")
+    elements = IterJsonArray(Source())
+    assert next(elements) == {"id" : "a"}
+    assert next(elements) == {"id" : "b"}
+
+@pytest.mark.parametrize("data", [
+    b"",
+    b"   ",
+    b'{"id":"a"}',
+    b"[1,2",
+    b'[{"id":"a"}',
+    b'["unterminated]',
+    b'["escaped quote\\"]',
+])
+def test_incomplete_or_not_an_array(data : bytes):
+    with pytest.raises(ValueError):
+        Decode(data, 3)
+
+@pytest.mark.parametrize("data", [b"[1,,2]", b"[tru]", b'[{"id":}]', b"[1 2]"])
+def test_malformed_elements(data : bytes):
+    with pytest.raises(ValueError):
+        Decode(data, 2)
@@ -0,0 +1,141 @@
+import pytest
+
+from cwruxr_sdk.anchor_message import AnchorMessage
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import Color, Pose, Vector3
+from cwruxr_sdk.local_server import LocalServer
+from cwruxr_sdk.material_message import UnlitMaterialMessage, UnlitParameters
+from cwruxr_sdk.object_message import PrimitiveMessage
+from cwruxr_sdk.transport import InMemoryTransport
+
+ENDPOINT = "http://localhost/api/v2/"
+
+def MakeClient(server : LocalServer, roomId : str = "room", anchorId : str = "anchor") -> Client:
+    return Client(ENDPOINT, roomId, anchorId, transport = InMemoryTransport(server))
+
+@pytest.fixture
+def server() -> LocalServer:
+    return LocalServer()
+
+@pytest.fixture
+def client(server : LocalServer) -> Client:
+    return MakeClient(server)
+
+def test_anchor_crud(client : Client):
+    client.PostAnchor(AnchorMessage("anchor", []))
+    client.PostAnchor(AnchorMessage("other", []))
+    assert client.GetAnchor("anchor") == {"id" : "anchor", "asaAnchors" : []}
+    assert sorted(anchor["id"] for anchor in client.GetAllAnchors()) == ["anchor", "other"]
+
+    client.DeleteAnchor("other")
+    assert [anchor["id"] for anchor in client.GetAllAnchors()] == ["anchor"]
+    with pytest.raises(Exception, match = "Not Found"):
+        client.GetAnchor("other")
+
+    client.DeleteAllAnchors()
+    assert client.GetAllAnchors() == []
+
+def test_object_crud(client : Client):
+    client.PostObject(PrimitiveMessage("cube", pose = Pose(Vector3(1, 2, 3))))
+    assert client.GetObject("cube")["pose"]["position"] == {"x" : 1, "y" : 2, "z" : 3}
+
+    # A partial message only changes the fields it holds.
+    client.PostObject(PrimitiveMessage("cube", source = None, active = False))
+    stored = client.GetObject("cube")
+    assert stored["active"] == False
+    assert stored["source"] == "Cube"
+    assert stored["pose"]["position"] == {"x" : 1, "y" : 2, "z" : 3}
+
+    client.PostObjectBulk([PrimitiveMessage("a"), PrimitiveMessage("b"), PrimitiveMessage("c")])
+    assert sorted(o["id"] for o in client.GetAllObjects()) == ["a", "b", "c", "cube"]
+    assert sorted(o["id"] for o in client.IterAllObjects()) == ["a", "b", "c", "cube"]
+
+    client.DeleteObjectBulk(["a", "b"])
+    client.DeleteObject("cube")
+    assert [o["id"] for o in client.GetAllObjects()] == ["c"]
+    with pytest.raises(Exception, match = "Not Found"):
+        client.DeleteObject("cube")
+
+    client.DeleteAllObjects()
+    assert client.GetAllObjects() == []
+
+def test_material_crud(client : Client):
+    client.PostMaterial(UnlitMaterialMessage("red", Color(1, 0, 0, 1), UnlitParameters()))
+    client.PostMaterialBulk([UnlitMaterialMessage(str(i), Color(0, 0, 1, 1), UnlitParameters()) for i in range(3)])
+    assert client.GetMaterial("red")["color"] == {"r" : 1, "g" : 0, "b" : 0, "a" : 1}
+    assert sorted(m["id"] for m in client.GetAllMaterials()) == ["0", "1", "2", "red"]
+    assert sorted(m["id"] for m in client.IterAllMaterials()) == ["0", "1", "2", "red"]
+
+    client.DeleteMaterial("red")
+    with pytest.raises(Exception, match = "Not Found"):
+        client.GetMaterial("red")
+
+    client.DeleteAllMaterials()
+    assert client.GetAllMaterials() == []
+
+def test_rooms_and_anchors_are_isolated(server : LocalServer):
+    first = MakeClient(server, "room", "anchor")
+    otherAnchor = MakeClient(server, "room", "other")
+    otherRoom = MakeClient(server, "other", "anchor")
+
+    first.PostObject(PrimitiveMessage("cube"))
+    first.PostMaterial(UnlitMaterialMessage("red", Color(1, 0, 0, 1), UnlitParameters()))
+
+    assert [o["id"] for o in first.GetAllObjects()] == ["cube"]
+    assert otherAnchor.GetAllObjects() == []
+    assert otherRoom.GetAllObjects() == []
+    # Materials belong to the room, so every anchor in it sees them.
+    assert [m["id"] for m in otherAnchor.GetAllMaterials()] == ["red"]
+    assert otherRoom.GetAllMaterials() == []
+
+    otherRoom.DeleteAllObjects()
+    otherAnchor.DeleteAllObjects()
+    assert [o["id"] for o in first.GetAllObjects()] == ["cube"]
+
+def test_injected_errors_raise_reason(server : LocalServer, client : Client):
+    server.errorRate = 1
+    with pytest.raises(Exception, match = "Service Unavailable"):
+        client.PostObject(PrimitiveMessage("cube"))
+    with pytest.raises(Exception, match = "Service Unavailable"):
+        client.GetAllObjects()
+    server.errorRate = 0
+    assert client.GetAllObjects() == []
+
+def test_body_size_limit(server : LocalServer, client : Client):
+    server.maxBodyBytes = 200
+    client.PostObject(PrimitiveMessage("small"))
+    with pytest.raises(Exception, match = "Request Entity Too Large"):
+        client.PostObjectBulk([PrimitiveMessage("cube" + str(i)) for i in range(20)])
+    assert [o["id"] for o in client.GetAllObjects()] == ["small"]
+
+def test_bad_bulk_item_stores_nothing(server : LocalServer, client : Client):
+    client.PostObject(PrimitiveMessage("a", pose = Pose(Vector3(1, 1, 1))))
+    with pytest.raises(Exception, match = "Bad Request"):
+        client.PostObjectBulk([{"id" : "a", "active" : False}, {"id" : "b"}, {"active" : True}])
+    assert client.GetAllObjects() == [client.GetObject("a")]
+    assert "active" not in client.GetObject("a")
+
+def test_missing_room_is_rejected(server : LocalServer):
+    status, _, _ = server.Handle("GET", ENDPOINT + "object/", {})
+    assert status == 400
+
+@pytest.mark.parametrize("path, body", [
+    ("object/", b"{not json"),
+    ("object/", b"[1, 2]"),
+    ("object/", b'{"active" : true}'),
+    ("object/", b'{"id" : 5}'),
+    ("object/bulk", b'{"id" : "cube"}'),
+    ("object/bulk", b'[{"id" : "cube"}, "cube"]'),
+    ("material/bulk", b"[null]"),
+])
+def test_malformed_post_is_rejected(server : LocalServer, path : str, body : bytes):
+    status, _, _ = server.Handle("POST", ENDPOINT + path, {"RoomId" : "room", "AnchorId" : "anchor"}, body)
+    assert status == 400
+    assert server.Room("room").objects.get("anchor", {}) == {}
+    assert server.Room("room").materials == {}
+
+def test_malformed_bulk_delete_is_rejected(server : LocalServer, client : Client):
+    client.PostObject(PrimitiveMessage("cube"))
+    status, _, _ = server.Handle("DELETE", ENDPOINT + "object/bulk", {"RoomId" : "room", "AnchorId" : "anchor"}, b'{"ids" : ["cube"]}')
+    assert status == 400
+    assert [o["id"] for o in client.GetAllObjects()] == ["cube"]
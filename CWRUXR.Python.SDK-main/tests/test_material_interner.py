@@ -0,0 +1,103 @@
+import pytest
+
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import Color
+from cwruxr_sdk.local_server import LocalServer
+from cwruxr_sdk.material_interner import ContentKey, MaterialInterner
+from cwruxr_sdk.material_message import UnlitMaterialMessage, UnlitParameters
+from cwruxr_sdk.object_message import PrimitiveMessage
+from cwruxr_sdk.transport import InMemoryTransport
+
+ENDPOINT = "http://localhost/api/v2/"
+
+def Unlit(id : str, r : float = 1) -> UnlitMaterialMessage:
+    return UnlitMaterialMessage(id, Color(r, 0, 0, 1), UnlitParameters())
+
+def test_same_content_is_aliased():
+    interner = MaterialInterner()
+    assert interner.InternMany([Unlit("red"), Unlit("crimson"), Unlit("blue", r = 0), Unlit("scarlet")]) == ["red", "red", "blue", "red"]
+    assert interner.merged == 2
+    assert len(interner) == 2
+    assert interner.Resolve("scarlet") == "red"
+    assert interner.Resolve("unknown") == "unknown"
+    assert [material.id for material in interner.Pending()] == ["red", "blue"]
+
+def test_equal_json_values_share_a_key():
+    message = Unlit("red")
+    data = {"id" : "other", "shader" : "Unlit", "color" : {"r" : 1.0, "g" : 0.0, "b" : 0.0, "a" : 1.0}, "parameters" : {}}
+    assert ContentKey(message) == ContentKey(data)
+    # None values are the same as leaving the key out, as they are not serialized.
+    assert ContentKey(data) == ContentKey({**data, "renderSettings" : None, "parameters" : {"texture" : None}})
+    assert ContentKey(data) != ContentKey({**data, "color" : {"r" : 1, "g" : 0, "b" : 0, "a" : .5}})
+
+    interner = MaterialInterner()
+    assert interner.Intern(message) == "red"
+    assert interner.Intern(data) == "red"
+
+def test_load_then_flush_posts_only_new_materials():
+    server = LocalServer()
+    client = Client(ENDPOINT, "room", "anchor", transport = InMemoryTransport(server))
+    client.PostMaterialBulk([Unlit("red"), Unlit("blue", r = 0)])
+
+    interner = MaterialInterner()
+    interner.Load(client)
+    assert interner.Pending() == []
+    assert interner.InternMany([Unlit("crimson"), Unlit("green", r = .5), Unlit("navy", r = 0)]) == ["red", "green", "blue"]
+
+    requests = server.requests
+    assert interner.Flush(client) == ["green"]
+    assert server.requests == requests + 1
+    assert sorted(server.Room("room").materials) == ["blue", "green", "red"]
+    assert interner.Flush(client) == []
+    assert server.requests == requests + 1
+
+def test_failed_flush_keeps_materials_pending():
+    server = LocalServer(errorRate = 1)
+    client = Client(ENDPOINT, "room", "anchor", transport = InMemoryTransport(server))
+    interner = MaterialInterner()
+    interner.Intern(Unlit("red"))
+    with pytest.raises(Exception):
+        interner.Flush(client)
+    server.errorRate = 0
+    assert interner.Flush(client) == ["red"]
+
+def test_rewrite():
+    interner = MaterialInterner()
+    interner.InternMany([Unlit("red"), Unlit("crimson")])
+    messages = [
+        PrimitiveMessage("a", materialID = "crimson"),
+        {"id" : "b", "materialID" : "crimson"},
+        {"id" : "c", "materialID" : "unknown"},
+        {"id" : "d"},
+        PrimitiveMessage("e"),
+    ]
+    result = interner.Rewrite(message for message in messages)
+    assert result == messages
+    assert messages[0].materialID == "red"
+    assert messages[1] == {"id" : "b", "materialID" : "red"}
+    assert messages[2] == {"id" : "c", "materialID" : "unknown"}
+    assert messages[3] == {"id" : "d"}
+    assert getattr(messages[4], "materialID", None) == None
+
+def test_new_content_for_an_id():
+    interner = MaterialInterner()
+    interner.Intern(Unlit("red"))
+    # Nothing was merged into red, so it can change.
+    assert interner.Intern(Unlit("red", r = .9)) == "red"
+    assert interner.Pending()[0].color.r == .9
+    assert interner.Intern(Unlit("other")) == "other"
+    assert len(interner) == 2
+
+def test_new_content_for_a_merged_id_raises():
+    interner = MaterialInterner()
+    interner.InternMany([Unlit("red"), Unlit("crimson")])
+    with pytest.raises(ValueError):
+        interner.Intern(Unlit("red", r = .5))
+    # The interner is unchanged.
+    assert interner.Resolve("crimson") == "red"
+    assert interner.Intern(Unlit("scarlet")) == "red"
+    assert interner.Pending()[0].color.r == 1
+
+    # An alias given new content becomes a material of its own, leaving the others as they were.
+    assert interner.Intern(Unlit("crimson", r = .5)) == "crimson"
+    assert interner.Resolve("scarlet") == "red"
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from cwruxr_sdk.common import FromJson
+from cwruxr_sdk.object_batch import ObjectBatch
+
+def Poses(batch : ObjectBatch) -> list[list[float]]:
+    return [
+        [*row["pose"]["position"].values(), *row["pose"]["rotation"].values(), *row["pose"]["scale"].values()]
+        for row in FromJson(batch.ToJson())
+    ]
+
+def test_round_trip():
+    random = np.random.default_rng(3)
+    position = random.uniform(-100, 100, (50, 3))
+    batch = ObjectBatch(["cube" + str(i) for i in range(50)], source = "Cube", materialID = "red", position = position)
+    rows = FromJson(batch.ToJson())
+    assert [row["id"] for row in rows] == ["cube" + str(i) for i in range(50)]
+    assert rows[0]["type"] == "Primitive" and rows[0]["source"] == "Cube" and rows[0]["materialID"] == "red"
+    assert "parentID" not in rows[0]
+    np.testing.assert_allclose([list(row["pose"]["position"].values()) for row in rows], position, atol = .5e-4)
+    assert all(row["pose"]["rotation"] == {"x" : 0, "y" : 0, "z" : 0, "w" : 1} for row in rows)
+    assert all(row["pose"]["scale"] == {"x" : 1, "y" : 1, "z" : 1} for row in rows)
+
+def test_rows_have_one_width():
+    batch = ObjectBatch(["a", "longer name"], materialID = ["red", None], position = [[1, -2, 3], [-1000, 5.5, 0]])
+    body = batch.ToJson()
+    rows = body[1:-1].split(b"},{")
+    assert len(rows[0]) == len(rows[1])
+    assert len(FromJson(body)) == 2
+
+def test_negative_values_rounding_to_zero_have_no_sign():
+    batch = ObjectBatch(["a"], position = [-.00004, -.00005, -.00006], decimals = 4)
+    body = batch.ToJson()
+    assert b"-0.0000" not in body
+    assert Poses(batch)[0][:3] == [0, 0, -.0001]
+
+    batch = ObjectBatch(["a"], position = [-.4, -.5, -.6], decimals = 0)
+    body = batch.ToJson()
+    assert b"-0" not in body
+    # Halves round to even, as in numpy.rint.
+    assert Poses(batch)[0][:3] == [0, 0, -1]
+
+def test_no_decimals():
+    batch = ObjectBatch(["a", "b"], position = [[1.4, -2.6, 9999.4], [0, -9999, 12]], scale = (2, 2, 2), decimals = 0)
+    body = batch.ToJson()
+    assert b"." not in body
+    assert [pose[:3] for pose in Poses(batch)] == [[1, -3, 9999], [0, -9999, 12]]
+    assert all(isinstance(value, int) for pose in Poses(batch) for value in pose)
+
+@pytest.mark.parametrize("decimals", [1, 4, 5, 6, 9])
+def test_decimals(decimals : int):
+    values = [1.23456789, -0.987654321, 42.000000001]
+    batch = ObjectBatch(["a"], position = values, decimals = decimals)
+    assert Poses(batch)[0][:3] == [round(value, decimals) for value in values]
+
+@pytest.mark.parametrize("value", [10000, -10000, 9999.99996, -9999.99996])
+def test_values_too_large_for_the_field_are_rejected(value : float):
+    batch = ObjectBatch(["a"], position = [0, value, 0])
+    with pytest.raises(ValueError):
+        batch.ToJson()
+
+def test_largest_value_fits():
+    batch = ObjectBatch(["a"], position = [9999.9999, -9999.9999, 0])
+    assert Poses(batch)[0][:3] == [9999.9999, -9999.9999, 0]
+
+def test_values_must_be_finite():
+    batch = ObjectBatch(["a"], position = [np.nan, 0, 0])
+    with pytest.raises(ValueError):
+        batch.ToJson()
+
+def test_in_place_updates_are_sent():
+    batch = ObjectBatch(["a", "b"], position = [[0, 0, 0], [1, 1, 1]])
+    batch.ToJson()
+    batch.position[1] += 1
+    batch.rotation[0] = (0, 1, 0, 0)
+    assert Poses(batch) == [[0, 0, 0, 0, 1, 0, 0, 1, 1, 1], [2, 2, 2, 0, 0, 0, 1, 1, 1, 1]]
+
+def test_prefix_cache_follows_string_columns():
+    batch = ObjectBatch(["a", "b"], materialID = "red")
+    first = batch.ToJson()
+    assert batch.ToJson() == first
+
+    batch.id[1] = "renamed"
+    batch.materialID[0] = None
+    rows = FromJson(batch.ToJson())
+    assert [row["id"] for row in rows] == ["a", "renamed"]
+    assert "materialID" not in rows[0] and rows[1]["materialID"] == "red"
+
+    batch.materialID[:] = "a much longer material name"
+    batch.parentID[0] = "root"
+    rows = FromJson(batch.ToJson())
+    assert [row["materialID"] for row in rows] == ["a much longer material name"] * 2
+    assert rows[0]["parentID"] == "root" and "parentID" not in rows[1]
+
+def test_replaced_string_columns_are_sent():
+    batch = ObjectBatch(["a", "b"], materialID = "red")
+    batch.ToJson()
+    batch.materialID = "blue"
+    batch.parentID = ["root", None]
+    rows = FromJson(batch.ToJson())
+    assert [row["materialID"] for row in rows] == ["blue", "blue"]
+    assert rows[0]["parentID"] == "root" and "parentID" not in rows[1]
+    batch.materialID = None
+    assert all("materialID" not in row for row in FromJson(batch.ToJson()))
+
+def test_empty_batch():
+    assert ObjectBatch([]).ToJson() == b"[]"
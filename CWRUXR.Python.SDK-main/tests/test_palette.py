@@ -0,0 +1,60 @@
+import math
+
+import pytest
+
+from cwruxr_sdk.common import Color
+from cwruxr_sdk.palette import Palette
+
+def MakePalette() -> Palette:
+    return Palette.Gradient("heat", [Color(0, 0, 255, 255), Color(255, 0, 0, 255)], size = 5, low = 10, high = 20)
+
+def test_index_maps_and_clamps():
+    palette = MakePalette()
+    assert [palette.Index(value) for value in (10, 12.5, 15, 17.5, 20)] == [0, 1, 2, 3, 4]
+    assert palette.Index(-100) == 0 and palette.Index(100) == 4
+    assert palette.Index(-math.inf) == 0 and palette.Index(math.inf) == 4
+    assert palette.Id(15) == "heat:2"
+
+def test_index_nan():
+    with pytest.raises(ValueError):
+        MakePalette().Index(math.nan)
+    with pytest.raises(ValueError):
+        MakePalette().Recolor("cube", math.nan)
+
+def test_single_value_range():
+    palette = Palette("flat", [Color(1, 1, 1, 1), Color(0, 0, 0, 1)], low = 1, high = 1)
+    assert palette.Index(1) == 0 and palette.Index(5) == 0
+
+def test_nearest():
+    palette = MakePalette()
+    assert palette.Nearest(Color(250, 0, 10, 255)) == "heat:4"
+    assert palette.Nearest(Color(0, 0, 250, 255)) == "heat:0"
+    assert palette.Recolor("cube", Color(250, 0, 10, 255)) == {"id" : "cube", "materialID" : "heat:4"}
+
+def test_nearest_cache_is_bounded():
+    palette = MakePalette()
+    palette._nearestCacheSize = 10
+    first = Color(0, 0, 250, 255)
+    palette.Nearest(first)
+    for i in range(100):
+        palette.Nearest(Color(i * 2.5, 0, 255 - i * 2.5, 255))
+        # Used again, so it stays while the others are dropped.
+        palette.Nearest(first)
+    assert len(palette._nearest) == 10
+    assert (first.r, first.g, first.b, first.a) in palette._nearest
+    # NaN keys never match, so they must not pile up either.
+    for _ in range(100):
+        palette.Nearest(Color(math.nan, 0, 0, 255))
+    assert len(palette._nearest) == 10
+
+def test_gradient_with_fractional_stops():
+    palette = Palette.Gradient("unit", [Color(0, 0, 1, 1), Color(1, 0, 0, 1)], size = 256)
+    colors = {(color.r, color.g, color.b, color.a) for color in palette.colors}
+    assert len(colors) == 256
+    assert palette.colors[0].b == 1 and palette.colors[-1].r == 1
+    assert palette.colors[128].r == pytest.approx(128 / 255)
+    assert palette.Nearest(Color(.5, 0, .5, 1)) in ("unit:127", "unit:128")
+
+def test_gradient_between_stops():
+    palette = Palette.Gradient("grey", [Color(0, 0, 0, 255), Color(255, 255, 255, 255), Color(0, 0, 0, 255)], size = 5)
+    assert [color.r for color in palette.colors] == [0, 127.5, 255, 127.5, 0]
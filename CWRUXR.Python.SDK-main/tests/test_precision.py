@@ -0,0 +1,58 @@
+import pytest
+
+from cwruxr_sdk.common import Color, FromJson, Pose, Quaternion, ToJson, Vector3
+from cwruxr_sdk.material_message import UnlitMaterialMessage, UnlitParameters
+from cwruxr_sdk.object_message import PrimitiveMessage
+from cwruxr_sdk.precision import COARSE, FINE, PrecisionProfile
+
+def test_fine_and_coarse_positions():
+    pose = Pose(Vector3(1.234567, -2.000049, 3), scale = Vector3(.123456, 1, 1))
+    assert FINE.EncodePose(pose) == {"position" : {"x" : 1.2346, "y" : -2.0, "z" : 3.0}, "scale" : {"x" : .1235, "y" : 1.0, "z" : 1.0}}
+    assert COARSE.EncodePose(pose)["position"] == {"x" : 1.235, "y" : -2.0, "z" : 3.0}
+
+def test_rotations_are_normalized_then_rounded():
+    rotation = FINE.EncodeRotation(Quaternion(0, 0, 0, 2))
+    assert rotation == {"x" : 0, "y" : 0, "z" : 0, "w" : 1}
+    rotation = PrecisionProfile(normalize = False).EncodeRotation(Quaternion(0, 0, 0, 2))
+    assert rotation["w"] == 2
+    assert FINE.EncodePose(Pose(euler = Vector3(10.123456, 0, 0)))["eulerRotation"]["x"] == 10.1235
+
+def test_none_fields_are_kept_at_full_precision():
+    profile = PrecisionProfile(position = None, color = None)
+    pose = Pose(Vector3(1.23456789, 0, 0))
+    assert profile.EncodePose(pose)["position"]["x"] == 1.23456789
+    assert profile.EncodeColor(Color(64.5, 0, 0, 255)) == {"r" : 64.5, "g" : 0, "b" : 0, "a" : 255}
+    # A None component is skipped over rather than rounded.
+    assert FINE.EncodeVector(Vector3(1.23456, None, 0), 1e4) == {"x" : 1.2346, "y" : None, "z" : 0.0}
+
+def test_colors_are_quantized_in_the_0_to_255_range():
+    assert FINE.EncodeColor(Color(64.12345, 200.987654, .4, 255)) == {"r" : 64, "g" : 201, "b" : 0, "a" : 255}
+    # 4 bits leave 16 levels, 17 apart.
+    assert PrecisionProfile(color = 4).EncodeColor(Color(64.1, 200.9, 0, 255)) == {"r" : 68, "g" : 204, "b" : 0, "a" : 255}
+    # More than 8 bits keep enough decimal places to tell the levels apart.
+    color = PrecisionProfile(color = 10).EncodeColor(Color(64.12345, 0, 0, 255))
+    assert color["r"] == pytest.approx(64.12345, abs = 255 / 1023 / 2)
+    assert color["r"] != 64.12345
+
+def test_whole_colors_are_written_as_integers():
+    data = ToJson(Color(64.0, 64.2, 0, 255.0), FINE)
+    assert data == b'{"r":64,"g":64,"b":0,"a":255}'
+    for value in FromJson(data).values():
+        assert type(value) is int
+
+def test_default_hook():
+    message = PrimitiveMessage("cube", pose = Pose(Vector3(1.234567, 0, 0)))
+    data = FromJson(ToJson(message, FINE))
+    assert data["pose"]["position"]["x"] == 1.2346
+    # Everything but poses and colors is serialized as ToJson would.
+    assert {key : value for key, value in data.items() if key != "pose"} == \
+        {key : value for key, value in FromJson(ToJson(message)).items() if key != "pose"}
+    # The message itself is not changed.
+    assert message.pose.position.x == 1.234567
+
+    material = UnlitMaterialMessage("red", Color(254.6, 0, 0, 255), UnlitParameters())
+    assert FromJson(ToJson(material, FINE))["color"] == {"r" : 255, "g" : 0, "b" : 0, "a" : 255}
+
+def test_dictionaries_are_sent_as_is():
+    data = {"id" : "cube", "pose" : {"position" : {"x" : 1.234567, "y" : 0, "z" : 0}}}
+    assert FromJson(ToJson(data, FINE)) == data
@@ -0,0 +1,82 @@
+import pytest
+
+from cwruxr_sdk.rate_controller import RateController
+
+def test_rate_grows_while_keeping_up():
+    controller = RateController(rate = 10, batchSize = 100)
+    for _ in range(10):
+        controller.Record(.01)
+    assert controller.rate > 10
+    assert controller.batchSize == 110
+    assert controller.rtt == pytest.approx(.01)
+
+def test_slow_requests_cut_the_rate_but_not_the_batch():
+    controller = RateController(rate = 10, batchSize = 100)
+    controller.Record(.2)
+    assert controller.rate == 5
+    assert controller.batchSize == 100
+
+def test_single_slow_request_cuts_nothing():
+    controller = RateController(rate = 10)
+    for _ in range(20):
+        controller.Record(.01)
+    rate = controller.rate
+    controller.Record(.2)
+    assert controller.rate == rate
+    assert controller.decreases == 0
+
+def test_sustained_slowness_cuts_the_rate():
+    controller = RateController(rate = 10)
+    for _ in range(20):
+        controller.Record(.01)
+    for _ in range(10):
+        controller.Record(.2)
+    assert controller.rate < 10
+    assert controller.decreases > 0
+
+def test_single_failure_cuts_nothing():
+    controller = RateController(rate = 10, batchSize = 100)
+    for _ in range(5):
+        controller.Record(.01)
+    rate = controller.rate
+    controller.Record(.01, ok = False)
+    assert (controller.rate, controller.batchSize) == (rate, 105)
+    assert controller.decreases == 0
+    assert controller.errors == 1
+
+def test_repeated_failures_cut_the_rate():
+    controller = RateController(rate = 10, batchSize = 100, errorThreshold = .25)
+    for _ in range(4):
+        controller.Record(.01, ok = False)
+    assert controller.errorRate > .25
+    assert controller.rate < 10
+    # Errors which are not about the size of the body do not shrink it.
+    assert controller.batchSize == 100
+
+def test_size_failures_cut_the_batch():
+    controller = RateController(rate = 10, batchSize = 100)
+    controller.Record(.01, ok = False, sizeFailure = True)
+    assert controller.batchSize == 50
+    assert controller.rate == 10
+
+def test_timeouts_cut_the_batch():
+    controller = RateController(rate = 10, batchSize = 100, timeout = .05)
+    controller.Record(.08)
+    assert controller.timeouts == 1
+    assert controller.batchSize == 50
+
+def test_one_cut_per_round_trip():
+    controller = RateController(rate = 10, batchSize = 100, timeout = .05)
+    controller.Record(.08)
+    # Sent before the first cut could take effect, so it is not cut again.
+    controller.Record(.06, ok = False, sizeFailure = True)
+    assert controller.batchSize == 50
+    assert controller.decreases == 1
+
+def test_interpolation_follows_the_rate():
+    controller = RateController(rate = 10, interpolationTolerance = .25)
+    interpolation = controller.InterpolationUpdate()
+    assert interpolation.moveSpeed == 10
+    assert controller.InterpolationUpdate() == None
+    controller.Record(.2)
+    assert controller.InterpolationUpdate().moveSpeed == 5
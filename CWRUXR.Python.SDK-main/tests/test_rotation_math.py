@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from cwruxr_sdk.rotation_math import AxisAngleToQuaternion, LookRotation, MatrixToQuaternion, QuaternionToMatrix, Rotate
+
+def test_look_rotation_points_forward():
+    forward = np.array([(1, 0, 0), (0, 0, -1), (1, 2, 3)], dtype = np.float64)
+    q = LookRotation(forward)
+    expected = forward / np.linalg.norm(forward, axis = -1, keepdims = True)
+    assert Rotate(q, (0, 0, 1)) == pytest.approx(expected)
+    # The y axis stays as close to up as possible, so it never points down.
+    assert np.all(Rotate(q, (0, 1, 0))[:, 1] > 0)
+
+def test_look_rotation_parallel_to_up():
+    q = LookRotation([(0, 1, 0), (0, -3, 0)])
+    assert not np.any(np.isnan(q))
+    # As Unity's Quaternion.LookRotation(Vector3.up) and LookRotation(Vector3.down).
+    assert q == pytest.approx(np.array([(-.5 ** .5, 0, 0, .5 ** .5), (.5 ** .5, 0, 0, .5 ** .5)]))
+    assert Rotate(q, (0, 0, 1)) == pytest.approx(np.array([(0, 1, 0), (0, -1, 0)]))
+
+def test_look_rotation_opposite_to_z():
+    q = LookRotation((0, 0, -1), up = (0, 0, 1))
+    assert Rotate(q, (0, 0, 1)) == pytest.approx(np.array((0, 0, -1)))
+
+def SameRotation(a : np.ndarray, b : np.ndarray) -> bool:
+    """
+    Quaternions q and -q are the same rotation.
+    """
+    return np.all(np.abs(np.abs(np.sum(a * b, axis = -1)) - 1) < 1e-9)
+
+@pytest.mark.parametrize("axis", [(1, 0, 0), (0, 1, 0), (0, 0, 1), (1, -1, 0), (-1, 0, 1), (0, 1, -1), (1, -2, 3), (-1, -1, 1)])
+def test_matrix_round_trip_180(axis):
+    q = AxisAngleToQuaternion(axis, np.pi)
+    assert SameRotation(MatrixToQuaternion(QuaternionToMatrix(q)), q)
+
+def test_matrix_180_mixed_signs():
+    # A half turn about (1, -1, 0), whose off-diagonal differences are all zero.
+    q = MatrixToQuaternion([[0, -1, 0], [-1, 0, 0], [0, 0, -1]])
+    assert SameRotation(q, np.array((.5 ** .5, -.5 ** .5, 0, 0)))
+
+def test_matrix_round_trip_many():
+    rng = np.random.default_rng(1)
+    q = rng.normal(size = (200, 4))
+    q /= np.linalg.norm(q, axis = -1, keepdims = True)
+    result = MatrixToQuaternion(QuaternionToMatrix(q))
+    assert np.all(result[:, 3] >= 0)
+    assert SameRotation(result, q)
+
+def test_look_rotation_anti_parallel_up():
+    # Forward along -z with up along -x, so the y axis must end up along -x.
+    q = LookRotation((0, 0, -1), up = (-1, 0, 0))
+    assert Rotate(q, (0, 0, 1)) == pytest.approx(np.array((0, 0, -1)))
+    assert Rotate(q, (0, 1, 0)) == pytest.approx(np.array((-1, 0, 0)))
+    q = LookRotation((0, 0, -1), up = (0, -1, 0))
+    assert Rotate(q, (0, 1, 0)) == pytest.approx(np.array((0, -1, 0)))
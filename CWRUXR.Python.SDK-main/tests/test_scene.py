@@ -0,0 +1,45 @@
+from cwruxr_sdk.client import Client
+from cwruxr_sdk.common import Pose, Vector3
+from cwruxr_sdk.local_server import LocalServer
+from cwruxr_sdk.object_message import PrimitiveMessage
+from cwruxr_sdk.precision import COARSE, FINE
+from cwruxr_sdk.scene import Scene
+from cwruxr_sdk.transport import InMemoryTransport
+
+def MakeClient(server : LocalServer, **kwargs) -> Client:
+    return Client("http://localhost/api/v2/", "room", "anchor", transport = InMemoryTransport(server), **kwargs)
+
+def Cube(x : float) -> PrimitiveMessage:
+    return PrimitiveMessage("cube", pose = Pose(Vector3(x, 0, 0)))
+
+def test_sync_posts_changes_and_deletes():
+    server = LocalServer()
+    client = MakeClient(server)
+    scene = Scene()
+    scene.Set(Cube(1))
+    scene.Set(PrimitiveMessage("sphere"))
+    assert sorted(scene.Sync(client)[0]) == ["cube", "sphere"]
+    scene.Set(Cube(1))
+    assert scene.Sync(client) == ([], [])
+    scene.Remove("sphere")
+    assert scene.Sync(client) == ([], ["sphere"])
+    assert list(server.Room("room").objects["anchor"]) == ["cube"]
+
+def test_sync_uses_the_client_precision():
+    server = LocalServer()
+    client = MakeClient(server, precision = COARSE)
+    scene = Scene()
+    scene.Set(Cube(1.00001))
+    scene.Sync(client)
+    assert server.Room("room").objects["anchor"]["cube"]["pose"]["position"]["x"] == 1
+    scene.Set(Cube(1.00002))
+    assert scene.Sync(client) == ([], [])
+
+def test_scene_precision_takes_precedence():
+    server = LocalServer()
+    client = MakeClient(server, precision = COARSE)
+    scene = Scene(precision = FINE)
+    scene.Set(Cube(1))
+    scene.Sync(client)
+    scene.Set(Cube(1.001))
+    assert scene.Sync(client) == (["cube"], [])
@@ -0,0 +1,94 @@
+from cwruxr_sdk.object_message import ContainerMessage, ObjectMessage, PrimitiveMessage, TextMessage, TextParameters
+from cwruxr_sdk.scene_index import SceneIndex
+from cwruxr_sdk.common import Color, Pose, Quaternion, Vector3
+
+def MakeIndex() -> SceneIndex:
+    index = SceneIndex()
+    index.AddMany([
+        ContainerMessage(id = "root"),
+        ContainerMessage(id = "arm", parentID = "root"),
+        PrimitiveMessage(id = "hand", parentID = "arm", materialID = "red"),
+        {"id" : "finger", "type" : "Primitive", "parentID" : "hand", "materialID" : "red"},
+    ])
+    return index
+
+def test_queries():
+    index = MakeIndex()
+    assert index.Roots() == ["root"]
+    assert index.Children("root") == ["arm"]
+    assert index.Subtree("root") == ["root", "arm", "hand", "finger"]
+    assert index.Ancestors("finger") == ["hand", "arm", "root"]
+    assert index.ByType("Primitive") == ["hand", "finger"]
+    assert index.ByMaterial("red") == ["hand", "finger"]
+
+def test_partial_update_keeps_fields():
+    index = MakeIndex()
+    index.Add(ObjectMessage(id = "hand", active = False))
+    index.Add({"id" : "finger", "pose" : {"position" : {"x" : 1, "y" : 2, "z" : 3}}})
+    index.Add({"id" : "finger", "pose" : {"scale" : {"x" : 2, "y" : 2, "z" : 2}}})
+
+    hand = index.Get("hand")
+    assert isinstance(hand, PrimitiveMessage)
+    assert hand.active == False and hand.parentID == "arm" and hand.materialID == "red"
+    finger = index.Get("finger")
+    assert finger["parentID"] == "hand"
+    assert finger["pose"] == {"position" : {"x" : 1, "y" : 2, "z" : 3}, "scale" : {"x" : 2, "y" : 2, "z" : 2}}
+    assert index.Children("arm") == ["hand"]
+    assert index.ByType("Primitive") == ["hand", "finger"]
+    assert index.ByMaterial("red") == ["hand", "finger"]
+
+def test_update_moves_object():
+    index = MakeIndex()
+    index.Add(ObjectMessage(id = "hand", parentID = "root", materialID = "blue", pose = Pose(Vector3(1, 0, 0))))
+    assert index.Children("arm") == []
+    assert index.Children("root") == ["arm", "hand"]
+    assert index.ByMaterial("red") == ["finger"]
+    assert index.ByMaterial("blue") == ["hand"]
+    assert index.Subtree("hand") == ["hand", "finger"]
+
+def test_remove():
+    index = MakeIndex()
+    assert index.Remove("arm")
+    assert not index.Remove("arm")
+    assert "arm" not in index
+    assert index.Roots() == ["root", "hand"]
+    assert index.Children("arm") == []
+    assert index.Ancestors("finger") == ["hand"]
+    # Adding the removed id again does not reattach its former children, until they are added again too.
+    index.Add(ContainerMessage(id = "arm", parentID = "root"))
+    assert index.Children("arm") == []
+    assert index.Roots() == ["root", "hand"]
+    index.Add(ObjectMessage(id = "hand", parentID = "arm"))
+    assert index.Subtree("root") == ["root", "arm", "hand", "finger"]
+
+def test_remove_leaves_no_entries():
+    index = MakeIndex()
+    for id in ["finger", "arm", "hand", "root"]:
+        index.Remove(id)
+    assert len(index) == 0
+    assert index._children == {} and index._parents == {} and index._byType == {} and index._byMaterial == {}
+
+def test_partial_pose_update_on_message():
+    index = MakeIndex()
+    index.Add(ObjectMessage(id = "hand", pose = Pose(Vector3(1, 2, 3), Quaternion(0, 0, 0, 1), scale = Vector3(.5, .5, .5))))
+    stored = index.Get("hand").pose
+    index.Add(ObjectMessage(id = "hand", pose = Pose(position = Vector3(4, 5, 6))))
+    index.Add({"id" : "hand", "pose" : {"scale" : {"x" : 2}}})
+
+    pose = index.Get("hand").pose
+    assert isinstance(pose, Pose)
+    assert vars(pose.position) == {"x" : 4, "y" : 5, "z" : 6}
+    assert vars(pose.rotation) == {"x" : 0, "y" : 0, "z" : 0, "w" : 1}
+    assert isinstance(pose.scale, Vector3)
+    assert vars(pose.scale) == {"x" : 2, "y" : .5, "z" : .5}
+    # The messages given to Add are not changed.
+    assert vars(stored.position) == {"x" : 1, "y" : 2, "z" : 3}
+
+def test_parameters_merge_and_colors_are_replaced():
+    index = SceneIndex()
+    index.Add(TextMessage(id = "label", params = TextParameters(text = "hi", fontSize = 2, color = Color(1, 0, 0, 1))))
+    blue = Color(0, 0, 1, 1)
+    index.Add(TextMessage(id = "label", params = TextParameters(color = blue)))
+    parameters = index.Get("label").parameters
+    assert parameters.text == "hi" and parameters.fontSize == 2
+    assert parameters.color is blue
@@ -0,0 +1,120 @@
+import threading
+
+import pytest
+
+from cwruxr_sdk.client import ApiError, Client
+from cwruxr_sdk.compression import GZIP, ZSTD, Available
+from cwruxr_sdk.local_server import LocalServer
+from cwruxr_sdk.object_message import PrimitiveMessage
+from cwruxr_sdk.transport import Response, Urllib3Transport
+
+HEADERS = {"RoomId" : "room", "AnchorId" : "anchor"}
+
+@pytest.fixture(scope = "module")
+def running():
+    # One server for the module, as stopping one waits for its polling loop.
+    with LocalServer() as server:
+        yield server
+
+@pytest.fixture
+def server(running : LocalServer) -> LocalServer:
+    running.Reset()
+    running.compressAbove = None
+    return running
+
+def Fill(server : LocalServer, count : int = 200):
+    server.Room("room").objects["anchor"] = {str(i) : {"id" : str(i), "type" : "Primitive"} for i in range(count)}
+
+def test_client_over_a_socket(server : LocalServer):
+    transport = Urllib3Transport(poolSize = 2, timeout = 5)
+    client = Client(server.endpoint, "room", "anchor", transport = transport)
+    try:
+        result = client.PostObject(PrimitiveMessage("cube"))
+        assert isinstance(result, Response)
+        assert result.status_code == 200 and result.ok and result.reason == "OK"
+        assert result.headers["Content-Type"] == "application/json"
+        assert client.GetObject("cube")["source"] == "Cube"
+        with pytest.raises(ApiError) as error:
+            client.GetObject("missing")
+        assert error.value.status_code == 404 and str(error.value) == "Not Found"
+    finally:
+        client.Close()
+
+def test_streamed_body_is_read_in_pieces(server : LocalServer):
+    Fill(server)
+    transport = Urllib3Transport(timeout = 5)
+    url = server.endpoint + "object/"
+    whole = transport.Request("GET", url, headers = HEADERS).content
+
+    with transport.Request("GET", url, headers = HEADERS, stream = True) as response:
+        assert response.status_code == 200
+        assert int(response.headers["Content-Length"]) == len(whole)
+        pieces = list(response.iter_content(100))
+    assert b"".join(pieces) == whole
+    assert all(len(piece) <= 100 for piece in pieces)
+    assert len(pieces) >= len(whole) // 100
+
+    client = Client(server.endpoint, "room", "anchor", transport = transport)
+    assert [o["id"] for o in client.IterAllObjects(chunkSize = 64)] == [str(i) for i in range(200)]
+    transport.Close()
+
+def test_closing_a_streamed_response_frees_its_connection(server : LocalServer):
+    Fill(server)
+    transport = Urllib3Transport(poolSize = 1, timeout = 5)
+    url = server.endpoint + "object/"
+    response = transport.Request("GET", url, headers = HEADERS, stream = True)
+    next(response.iter_content(10))
+    response.close()
+
+    # With one connection in the pool, this waits forever unless the streamed response gave its connection back.
+    result = []
+    thread = threading.Thread(target = lambda : result.append(transport.Request("GET", url + "0", headers = HEADERS)), daemon = True)
+    thread.start()
+    thread.join(5)
+    assert len(result) == 1 and result[0].json() == {"id" : "0", "type" : "Primitive"}
+    transport.Close()
+
+@pytest.mark.parametrize("codec", [GZIP, ZSTD])
+def test_compressed_responses_are_decoded(server : LocalServer, codec : str):
+    if not Available(codec):
+        pytest.skip(codec + " is not installed")
+    Fill(server)
+    server.compressAbove = 0
+    transport = Urllib3Transport(timeout = 5)
+    url = server.endpoint + "object/"
+    headers = {**HEADERS, "Accept-Encoding" : codec}
+
+    response = transport.Request("GET", url, headers = headers)
+    # The header is passed on as sent, and the body is decoded.
+    assert response.headers["Content-Encoding"] == codec
+    assert len(response.json()) == 200
+    assert server.bytesSent < len(response.content)
+
+    with transport.Request("GET", url, headers = headers, stream = True) as streamed:
+        assert streamed.headers["Content-Encoding"] == codec
+        assert b"".join(streamed.iter_content(64)) == response.content
+
+    client = Client(server.endpoint, "room", "anchor", transport = transport, compression = codec, compressionThreshold = 0)
+    client.PostObject(PrimitiveMessage("cube"))
+    assert len(client.GetAllObjects()) == 201
+    assert len(list(client.IterAllObjects())) == 201
+    transport.Close()
+
+def test_reason_defaults():
+    assert Response(200, {}).reason == "OK"
+    assert Response(404, {}, b"").reason == "Not Found"
+    assert Response(413, {}, reason = "").reason == "Request Entity Too Large"
+    assert Response(418, {}, reason = "Short And Stout").reason == "Short And Stout"
+    assert Response(599, {}).reason == ""
+
+def test_response_without_a_body():
+    response = Response(204, {})
+    assert response.content == b""
+    assert list(response.iter_content(10)) == []
+    assert not Response(500, {}).ok
+    response.close()
+
+def test_read_body_is_split_by_iter_content():
+    response = Response(200, {}, b"[1,23,456]")
+    assert list(response.iter_content(4)) == [b"[1,2", b"3,45", b"6]"]
+    assert response.json() == [1, 23, 456]
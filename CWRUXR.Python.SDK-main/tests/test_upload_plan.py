@@ -0,0 +1,59 @@
+import pytest
+
+from cwruxr_sdk.object_message import ContainerMessage, PrimitiveMessage
+from cwruxr_sdk.upload_plan import PlanUpload
+
+def Ids(plan) -> list[list[str]]:
+    return [sorted(message.id if not isinstance(message, dict) else message["id"] for message in level) for level in plan.levels]
+
+def test_levels():
+    plan = PlanUpload([
+        {"id" : "line", "parameters" : {"startId" : "a", "endId" : "b"}},
+        PrimitiveMessage("b", parentID = "root"),
+        PrimitiveMessage("a", parentID = "root"),
+        ContainerMessage("root"),
+    ])
+    assert Ids(plan) == [["root"], ["a", "b"], ["line"]]
+    assert plan.missing == {}
+
+def test_missing_and_existing():
+    messages = [PrimitiveMessage("a", parentID = "server"), PrimitiveMessage("b", parentID = "nowhere")]
+    plan = PlanUpload(messages, existing = ["server"])
+    assert Ids(plan) == [["a", "b"]]
+    assert plan.missing == {"nowhere" : ["b"]}
+    with pytest.raises(ValueError, match = "nowhere"):
+        PlanUpload(messages, existing = ["server"], strict = True)
+
+def test_cycle_lists_only_its_members():
+    messages = [
+        ContainerMessage("root"),
+        ContainerMessage("x", parentID = "z"),
+        ContainerMessage("y", parentID = "x"),
+        ContainerMessage("z", parentID = "y"),
+        # These only hang off the cycle, so they are not part of it.
+        PrimitiveMessage("child", parentID = "x"),
+        PrimitiveMessage("grandchild", parentID = "child"),
+    ]
+    with pytest.raises(ValueError) as error:
+        PlanUpload(messages)
+    assert str(error.value) == "Messages reference each other in a cycle: x, y, z"
+
+def test_separate_cycles_and_self_reference():
+    messages = [
+        ContainerMessage("a", parentID = "b"),
+        ContainerMessage("b", parentID = "a"),
+        ContainerMessage("self", parentID = "self"),
+        {"id" : "line", "parameters" : {"startId" : "line2", "endId" : "a"}},
+        {"id" : "line2", "parameters" : {"startId" : "line", "endId" : "root"}},
+        ContainerMessage("root"),
+    ]
+    with pytest.raises(ValueError) as error:
+        PlanUpload(messages)
+    assert str(error.value) == "Messages reference each other in a cycle: a, b; line, line2; self"
+
+def test_deep_chain_in_a_cycle():
+    count = 5000
+    messages = [ContainerMessage(str(i), parentID = str((i + 1) % count)) for i in range(count)]
+    with pytest.raises(ValueError) as error:
+        PlanUpload(messages)
+    assert len(str(error.value).split(": ")[1].split(", ")) == count